@@ -1,18 +1,69 @@
 import json
+import random
 import time
-from typing import Callable, List, Union
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterable, List, Optional, Tuple, Union
 
+import numpy as np
 from tqdm import tqdm
 
 from dooders.sdk import strategies
 from dooders.sdk.actions import *
 from dooders.sdk.base.entity import Entity
 from dooders.sdk.core import Assemble
+from dooders.sdk.lockstep import LockstepSimulation
 from dooders.sdk.policies import *
 from dooders.sdk.surfaces import *
 from dooders.sdk.utils import ShortID
 from dooders.sdk.utils.loggers import log_entries
 
+# The experiment and custom logic of a worker process, see _init_worker
+_worker = {}
+
+
+def seed_simulation(seed: np.random.SeedSequence) -> None:
+    """
+    Seed the random and numpy global generators for one simulation.
+
+    Parameters
+    ----------
+    seed: np.random.SeedSequence
+        The seed of the simulation.
+    """
+    state = seed.generate_state(4)
+    random.seed(int.from_bytes(state.tobytes(), "little"))
+    np.random.seed(state)
+
+
+def _init_worker(
+    experiment_type: type, experiment_name: str, settings: dict, custom_logic: Callable
+) -> None:
+    """
+    Create the experiment of a worker process, so the settings and custom
+    logic are shipped once per worker instead of once per simulation.
+    """
+    _worker["experiment"] = experiment_type(experiment_name, settings)
+    _worker["custom_logic"] = custom_logic
+
+
+def _simulate_in_worker(
+    number: int, seed: np.random.SeedSequence
+) -> Tuple[int, dict, dict]:
+    """
+    Run one simulation in a worker process.
+
+    Returns
+    -------
+    Tuple[int, dict, dict]
+        The simulation number, its experiment results and the gene pool
+        of its passed Dooders.
+    """
+    experiment = _worker["experiment"]
+    experiment.gene_pool = {}
+    experiment.simulate_once(number, seed, _worker["custom_logic"])
+
+    return number, experiment.experiment_results.pop(number), experiment.gene_pool
+
 
 class Experiment:
     """
@@ -55,19 +106,23 @@ class Experiment:
 
     Methods
     -------
-    create_simulation()
+    create_simulation(seed: np.random.SeedSequence = None)
         Create a simulation.
     simulate(simulation_count: int = 1, restart: bool = False)
         Simulate a single cycle.
-    batch_simulate(simulation_number: int = 100, experiment_count: int = 1, custom_logic: Callable = None, save_result: bool = False)
+    batch_simulate(simulation_number: int = 100, experiment_count: int = 1, custom_logic: Callable = None, save_result: bool = False, workers: int = 1, seed: int = None, lockstep: bool = False)
         Simulate n cycles.
+    simulate_once(number: int, seed: np.random.SeedSequence, custom_logic: Callable = None)
+        Run one simulation of a batch and store its results.
+    simulate_lockstep(simulation_number: int, seed: int = None, custom_logic: Callable = None, progress: Callable = None)
+        Run a batch of simulations together and store their results.
     get_objects(object_type: str = 'Agent')
         Get all objects of a given type.
     save_object(object: Callable, filename: str)
         Save an object into a json file.
     save_logs()
         Save the logs of the experiment into a json file.
-    save_passed_dooders()
+    save_passed_dooders(dooders: Iterable = None)
         Save the internal model weights of any Dooders that made it to the end
         of the simulation.
     save_experiment_results()
@@ -98,18 +153,24 @@ class Experiment:
         self.gene_pool = {}
         self.save_folder = experiment_name
 
-    def create_simulation(self) -> None:
+    def create_simulation(self, seed: np.random.SeedSequence = None) -> None:
         """
         Create a simulation.
 
         See the `Assemble` class for more information.
 
+        Parameters
+        ----------
+        seed: np.random.SeedSequence
+            The seed the simulation's random generators are spawned from.
+            Random if None.
+
         Returns
         -------
         Simulation
             A simulation object. Through the Assembly class.
         """
-        return Assemble.execute(self.settings)
+        return Assemble.execute(self.settings, seed=seed)
 
     def simulate(self, simulation_count: int = 1, restart: bool = False) -> None:
         """
@@ -146,10 +207,19 @@ class Experiment:
         experiment_count: int = 1,
         custom_logic: Callable = None,
         save_result: bool = False,
+        workers: int = 1,
+        seed: Optional[Union[int, List[int]]] = None,
+        lockstep: bool = False,
+        progress_bar: bool = True,
     ) -> None:
         """
         Simulate n cycles.
 
+        With more than one worker the simulations run in a process pool.
+        The custom logic is shipped to every worker once, so it must be
+        picklable, and only the experiment results and gene pool of every
+        simulation are sent back. Logs stay in the worker processes.
+
         Parameters
         ----------
         simulation_number: int
@@ -162,27 +232,51 @@ class Experiment:
             For any custom handling before each simulation.
         save_result: bool
             Whether to save the results of the experiment. Including logs
+        workers: int
+            The number of worker processes, 1 runs every simulation in
+            this process.
+        seed: Optional[Union[int, List[int]]]
+            The entropy every simulation seed is spawned from. Simulation
+            n gets the same seed for the same entropy, in any number of
+            workers. Random if None.
+        lockstep: bool
+            Whether to run all the simulations together in a
+            LockstepSimulation. The custom logic runs once per simulation,
+            on a view with the simulation's arena.dooders().
+        progress_bar: bool
+            Whether to show a progress bar of the simulations.
         """
         self.start_time = time.time()
         pbar = tqdm(
-            desc=f"Experiment[{experiment_count}] Progress", total=simulation_number
+            desc=f"Experiment[{experiment_count}] Progress",
+            total=simulation_number,
+            disable=not progress_bar,
         )
-        for number in range(simulation_number):
-            self.simulation = self.create_simulation()
-            self.simulation.auto_restart = False
-
-            if custom_logic:
-                custom_logic(self)
-
-            self.simulation.run_simulation(batch=True)
-            self.experiment_results[number] = {}
-            self.experiment_results[number][
-                "summary"
-            ] = self.simulation.simulation_summary
-            self.experiment_results[number]["state"] = self.simulation.state
-            self.save_passed_dooders()
-            del self.simulation
-            pbar.update(1)
+        seeds = np.random.SeedSequence(seed).spawn(simulation_number)
+
+        if lockstep and workers > 1:
+            raise ValueError("Lockstep simulations run in a single process")
+
+        if lockstep:
+            self.simulate_lockstep(simulation_number, seed, custom_logic, pbar.update)
+        elif workers > 1:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(type(self), self.save_folder, self.settings, custom_logic),
+            ) as executor:
+                # Results come back in simulation order, so the gene pool
+                # is the same as in a serial run
+                for number, results, gene_pool in executor.map(
+                    _simulate_in_worker, range(simulation_number), seeds
+                ):
+                    self.experiment_results[number] = results
+                    self.gene_pool.update(gene_pool)
+                    pbar.update(1)
+        else:
+            for number in range(simulation_number):
+                self.simulate_once(number, seeds[number], custom_logic)
+                pbar.update(1)
 
         pbar.close()
 
@@ -192,6 +286,74 @@ class Experiment:
 
         self.end_time = time.time()
 
+    def simulate_once(
+        self, number: int, seed: np.random.SeedSequence, custom_logic: Callable = None
+    ) -> None:
+        """
+        Run one simulation of a batch and store its results.
+
+        Parameters
+        ----------
+        number: int
+            The number of the simulation in the batch.
+        seed: np.random.SeedSequence
+            The seed of the simulation.
+        custom_logic: Callable
+            A function to run before the simulation.
+        """
+        self.simulation = self.create_simulation(seed)
+        self.simulation.auto_restart = False
+
+        if custom_logic:
+            custom_logic(self)
+
+        self.simulation.run_simulation(batch=True)
+        self.experiment_results[number] = {}
+        self.experiment_results[number]["summary"] = self.simulation.simulation_summary
+        self.experiment_results[number]["state"] = self.simulation.state
+        self.save_passed_dooders()
+        del self.simulation
+
+    def simulate_lockstep(
+        self,
+        simulation_number: int,
+        seed: Optional[Union[int, List[int]]] = None,
+        custom_logic: Callable = None,
+        progress: Callable = None,
+    ) -> None:
+        """
+        Run a batch of simulations together and store their results.
+
+        Parameters
+        ----------
+        simulation_number: int
+            The number of simulations to run.
+        seed: Optional[Union[int, List[int]]]
+            The entropy of the lockstep seed. Random if None.
+        custom_logic: Callable
+            A function to run before each simulation.
+        progress: Callable
+            Called with the number of simulations that ended after every cycle.
+        """
+        model_seed, engine_seed = np.random.SeedSequence(seed).spawn(2)
+        seed_simulation(model_seed)
+        engine = LockstepSimulation(
+            simulation_number, self.settings, np.random.default_rng(engine_seed)
+        )
+        engine.setup()
+
+        if custom_logic:
+            for simulation in engine.simulations:
+                self.simulation = simulation
+                custom_logic(self)
+            del self.simulation
+
+        engine.run(progress)
+
+        for number, results in enumerate(engine.results()):
+            self.experiment_results[number] = results
+            self.save_passed_dooders(engine.dooders(number))
+
     def get_objects(self, object_type: str = "Entity") -> List[Entity]:
         """
         Get all objects of a given type.
@@ -241,16 +403,25 @@ class Experiment:
         """
         pass
 
-    def save_passed_dooders(self) -> None:
+    def save_passed_dooders(self, dooders: Iterable = None) -> None:
         """
         Save the internal model weights of any Dooders that
         made it to the end of the simulation.
+
+        Parameters
+        ----------
+        dooders: Iterable
+            The Dooders that made it to the end, the Dooders of the
+            current simulation if None.
         """
 
         if self.save_folder is not None:
             setting = self.settings.get("GenePool")
 
-            for dooder in self.get_objects("Dooder"):
+            if dooders is None:
+                dooders = self.get_objects("Dooder")
+
+            for dooder in dooders:
                 if dooder.internal_models.weights:
                     # create dooder directory if it doesn't exist
                     if setting == "save":
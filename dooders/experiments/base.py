@@ -20,5 +20,11 @@ def save_experiment(type: str, results: Dict[str, List], experiment_name: str) -
     if not os.path.exists(f'results/{experiment_name}'):
         os.makedirs(f'results/{experiment_name}')
 
-    with open(f'results/{experiment_name}/{type}.json', 'w') as f:
-        json.dump(results, f)
\ No newline at end of file
+    path = f'results/{experiment_name}/{type}.json'
+
+    # Written to a temporary file first, so an interrupted run never
+    # leaves a partial file that a resumed run would take as finished
+    with open(f'{path}.tmp', 'w') as f:
+        json.dump(results, f)
+
+    os.replace(f'{path}.tmp', path)
\ No newline at end of file
@@ -0,0 +1,203 @@
+"""
+This experiment runs Recursive Artificial Selection (RAS) as an island
+model. Every island evolves its own gene pool in its own process, and
+every few generations sends its fittest Dooders to the next island in a
+ring.
+
+Islands only wait for their neighbour's migrants, never for a global
+generation, so the islands drift apart between migrations and the
+effective population grows with the number of cores instead of the time
+taken by a single generation.
+"""
+
+import multiprocessing
+import queue
+from typing import Dict, List
+
+from dooders.data.experiment_results import calculate_accuracies
+from dooders.data.inference_record_dataframe import get_inference_record_df
+from dooders.experiments.recursive_artificial_selection import (
+    DEFAULT_SETTINGS as RAS_SETTINGS, evolve_generation, get_accuracies)
+from dooders.sdk.modules.selection import get_embeddings, select_top
+
+DEFAULT_SETTINGS = {
+    **RAS_SETTINGS,
+    'SimulationCount': 500,
+    'RecombinationType': 'crossover',
+    'Islands': 4,
+    'MigrationInterval': 5,
+    'MigrationSize': 10,
+}
+
+
+def get_fitness(results: Dict[str, dict]) -> Dict[str, float]:
+    """
+    Returns the accuracy of every Dooder in the experiment results.
+
+    Parameters
+    ----------
+    results : dict
+        The experiment results of a generation.
+
+    Returns
+    -------
+    dict
+        A dictionary containing the Dooder IDs as keys and their accuracy as values.
+    """
+    inference_df = get_inference_record_df(results)
+
+    if inference_df.empty:
+        return {}
+
+    return calculate_accuracies(inference_df)
+
+
+def migrate(gene_pool: Dict[str, dict],
+            fitness: Dict[str, float],
+            migrants: Dict[str, dict]) -> Dict[str, dict]:
+    """
+    Replaces the least fit Dooders of the gene pool with migrants.
+
+    Parameters
+    ----------
+    gene_pool : dict
+        The gene pool of the island.
+    fitness : dict
+        The fitness of the Dooders in the gene pool.
+    migrants : dict
+        The Dooder IDs and weights arriving from another island.
+
+    Returns
+    -------
+    dict
+        The new gene pool, the same size as before unless it was smaller
+        than the migrants.
+    """
+    kept = select_top(gene_pool, fitness, max(len(gene_pool) - len(migrants), 0))
+
+    return {**kept, **migrants}
+
+
+def evolve_island(index: int,
+                  settings: Dict[str, str],
+                  experiment_name: str,
+                  generations: int,
+                  inbox: multiprocessing.Queue,
+                  outbox: multiprocessing.Queue,
+                  results: multiprocessing.Queue) -> None:
+    """
+    Evolves the gene pool of one island, the target of an island process.
+
+    After every MigrationInterval generations the island puts its
+    MigrationSize fittest Dooders in its outbox and replaces its least
+    fit Dooders with the migrants from its inbox.
+
+    Parameters
+    ----------
+    index : int
+        The index of the island.
+    settings : dict
+        The settings to use for the experiment.
+    experiment_name : str
+        The name of the experiment.
+    generations : int
+        The number of generations to evolve.
+    inbox : multiprocessing.Queue
+        The migrants from the previous island.
+    outbox : multiprocessing.Queue
+        The migrants to the next island.
+    results : multiprocessing.Queue
+        Where the island puts its index and results when it is done.
+    """
+    gene_pool = {}
+    island_results = {'fit_dooder_counts': [],
+                      'generation_embeddings': [],
+                      'accuracies': [],
+                      'migrations': []}
+
+    seed = settings.get('Seed')
+    interval = settings['MigrationInterval']
+
+    for i in range(generations):
+        experiment = evolve_generation(f'{experiment_name}/island_{index}',
+                                       settings, gene_pool, i,
+                                       None if seed is None else [seed, index, i])
+        gene_pool = experiment.gene_pool.copy()
+
+        island_results['accuracies'].append(
+            get_accuracies(experiment.experiment_results))
+        island_results['fit_dooder_counts'].append(len(gene_pool))
+        island_results['generation_embeddings'].append(
+            get_embeddings(gene_pool))
+
+        # No migration after the last generation, nobody would use it
+        if (i + 1) % interval == 0 and i + 1 < generations:
+            fitness = get_fitness(experiment.experiment_results)
+            outbox.put(select_top(gene_pool, fitness,
+                                  settings['MigrationSize']))
+            migrants = inbox.get()
+            gene_pool = migrate(gene_pool, fitness, migrants)
+            island_results['migrations'].append(i)
+
+    results.put((index, island_results))
+
+
+def island_model(settings: Dict[str, str] = DEFAULT_SETTINGS,
+                 experiment_name: str = 'island_model',
+                 generations: int = 100) -> Dict[str, List]:
+    """
+    Runs a Recursive Artificial Selection (RAS) experiment on Islands
+    islands, one process per island.
+
+    Migrants move in a ring, island n sends to island n+1, through one
+    queue per island. Every island's simulations run in its own process,
+    so Workers should usually stay 1.
+
+    Parameters
+    ----------
+    settings : dict, optional
+        The settings to use for the experiment (default is DEFAULT_SETTINGS).
+    experiment_name : str, optional
+        The name of the experiment (default is 'island_model').
+    generations : int, optional
+        The number of generations for the experiment (default is 100).
+
+    Returns
+    -------
+    dict
+        A dictionary containing the results of every island, in island
+        order, each with the keys of recursive_artificial_selection and
+        the generations after which the island migrated.
+    """
+    islands = settings['Islands']
+    queues = [multiprocessing.Queue() for _ in range(islands)]
+    results = multiprocessing.Queue()
+
+    processes = [
+        multiprocessing.Process(
+            target=evolve_island,
+            args=(index, settings, experiment_name, generations,
+                  queues[index], queues[(index + 1) % islands], results))
+        for index in range(islands)
+    ]
+
+    for process in processes:
+        process.start()
+
+    # Results are read before joining, a process with a full queue
+    # buffer would never exit
+    island_results = {}
+    while len(island_results) < islands:
+        try:
+            index, result = results.get(timeout=1)
+            island_results[index] = result
+        except queue.Empty:
+            if any(process.exitcode not in (None, 0) for process in processes):
+                for process in processes:
+                    process.terminate()
+                raise RuntimeError('An island process failed')
+
+    for process in processes:
+        process.join()
+
+    return {'islands': [island_results[index] for index in range(islands)]}
@@ -13,25 +13,65 @@ that exhibit desirable traits, improving solutions in various domains.
 
 # TODO: Experiment logging for information like number of fit dooders, time taken, etc.
 
+import os
+import queue
 import time
-from typing import Dict, List
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import partial
+from multiprocessing import Manager
+from typing import Callable, Dict, List, Optional
+
+from tqdm import tqdm
 
 from dooders.data.experiment_results import calculate_accuracies
 from dooders.data.inference_record_dataframe import get_inference_record_df
 from dooders.experiment import Experiment
 from dooders.experiments.base import save_experiment
-from dooders.reports.recursive_artificial_selection import report
+from dooders.reports.recursive_artificial_selection import load_results, report
 from dooders.sdk.modules.recombination import RECOMBINATION_TYPES
-from dooders.sdk.modules.selection import get_embeddings, recombine_genes
+from dooders.sdk.modules.selection import get_embeddings, recombine_genes_batch
 
 DEFAULT_SETTINGS = {
     'MaxCycles': 100,
     'SimulationCount': 2000,
     'GenePool': 'retain',
     'Generations': 50,
+    'Workers': 1,
+    'Seed': None,
+    'Lockstep': False,
 }
 
 
+class InheritWeights:
+    """ 
+    Inherit the weights of the Dooders in the gene pool.
+
+    A class instead of a closure so it can be shipped to the worker
+    processes of Experiment.batch_simulate.
+
+    Parameters
+    ----------
+    gene_pool : dict
+        The weights of the fit Dooders of the last generation.
+    recombination_type : str
+        The type of recombination to use.
+    """
+
+    def __init__(self, gene_pool: Dict[str, dict], recombination_type: str) -> None:
+        self.gene_pool = gene_pool
+        self.recombination_type = recombination_type
+
+    def __call__(self, experiment: Experiment) -> None:
+        if self.gene_pool:
+            dooders = list(experiment.simulation.arena.dooders())
+            offspring_genes = recombine_genes_batch(
+                self.gene_pool, len(dooders), recombination_type=self.recombination_type,
+                rng=experiment.simulation.rng)
+
+            for dooder, new_genes in zip(dooders, offspring_genes):
+                dooder.internal_models.inherit_weights(new_genes)
+
+
 def get_accuracies(results: Dict[str, List]) -> List[float]:
 
     inference_df = get_inference_record_df(results)
@@ -48,9 +88,50 @@ def experiment_results(experiment):
     }
 
 
+def evolve_generation(experiment_name: str,
+                      settings: Dict[str, str],
+                      gene_pool: Dict[str, dict],
+                      generation: int,
+                      seed: Optional[List[int]] = None) -> Experiment:
+    """ 
+    Runs one generation of simulations, seeded from the gene pool of the 
+    last generation.
+
+    Parameters
+    ----------
+    experiment_name : str
+        The name of the experiment.
+    settings : dict
+        The settings to use for the experiment.
+    gene_pool : dict
+        The weights of the fit Dooders of the last generation.
+    generation : int
+        The index of the generation.
+    seed : List[int], optional
+        The entropy of the generation's simulation seeds. Random if None.
+
+    Returns
+    -------
+    Experiment
+        The experiment of the generation, with its results and gene pool.
+    """
+    experiment = Experiment(experiment_name, settings)
+    experiment.batch_simulate(settings['SimulationCount'],
+                              generation+1,
+                              custom_logic=InheritWeights(
+                                  gene_pool, settings['RecombinationType']),
+                              workers=settings.get('Workers', 1),
+                              seed=seed,
+                              lockstep=settings.get('Lockstep', False),
+                              progress_bar=settings.get('ProgressBar', True))
+
+    return experiment
+
+
 def recursive_artificial_selection(settings: Dict[str, str] = DEFAULT_SETTINGS,
                                    experiment_name: str = 'recursive_artificial_selection',
-                                   generations: int = 100) -> Dict[str, List]:
+                                   generations: int = 100,
+                                   progress: Callable = None) -> Dict[str, List]:
     """ 
     Runs a Recursive Artificial Selection (RAS) experiment.
 
@@ -65,6 +146,8 @@ def recursive_artificial_selection(settings: Dict[str, str] = DEFAULT_SETTINGS,
         The settings to use for the experiment (default is DEFAULT_SETTINGS).
     generations : int, optional
         The number of generations for the experiment (default is 100).
+    progress : Callable, optional
+        Called with no arguments after every generation (default is None).
 
     Returns
     -------
@@ -78,23 +161,11 @@ def recursive_artificial_selection(settings: Dict[str, str] = DEFAULT_SETTINGS,
                           'generation_embeddings': [],
                           'accuracies': []}
 
-    def inherit_weights(experiment: Experiment):
-        """ 
-        Inherit the weights of the Dooders in the gene pool.
-        """
-        if gene_pool:
-            for dooder in experiment.simulation.arena.dooders():
-
-                new_genes = recombine_genes(
-                    gene_pool, recombination_type=settings['RecombinationType'])
-
-                dooder.internal_models.inherit_weights(new_genes)
+    seed = settings.get('Seed')
 
     for i in range(generations):
-        experiment = Experiment(experiment_name, settings)
-        experiment.batch_simulate(settings['SimulationCount'],
-                                  i+1,
-                                  custom_logic=inherit_weights)
+        experiment = evolve_generation(experiment_name, settings, gene_pool, i,
+                                       None if seed is None else [seed, i])
         gene_pool = experiment.gene_pool.copy()
 
         experiment_results['accuracies'].append(
@@ -103,46 +174,151 @@ def recursive_artificial_selection(settings: Dict[str, str] = DEFAULT_SETTINGS,
         experiment_results['generation_embeddings'].append(
             get_embeddings(gene_pool))
 
+        if progress:
+            progress()
+
     return experiment_results
 
 
+def sweep_recombination_type(recombination_type: str,
+                             settings: Dict[str, str],
+                             experiment_name: str,
+                             save_results: bool,
+                             progress: Callable = None) -> Dict[str, List]:
+    """ 
+    Runs the Recursive Artificial Selection (RAS) experiment of one
+    recombination type, the task of a sweep worker.
+
+    The simulations of every type save to their own experiment folder, 
+    so Dooders saved with GenePool 'save' never collide across types.
+
+    Parameters
+    ----------
+    recombination_type : str
+        The recombination type of the experiment.
+    settings : dict
+        The settings to use for the experiment.
+    experiment_name : str
+        The name of the experiment.
+    save_results : bool
+        Whether or not to save the results of the experiment.
+    progress : Callable, optional
+        Called with the recombination type after every generation.
+
+    Returns
+    -------
+    dict
+        The results of recursive_artificial_selection.
+    """
+    settings = {**settings, 'RecombinationType': recombination_type}
+
+    results = recursive_artificial_selection(
+        settings,
+        f'{experiment_name}/{recombination_type}',
+        settings['Generations'],
+        partial(progress, recombination_type) if progress else None)
+
+    if save_results:
+        save_experiment(recombination_type, results, experiment_name)
+
+    return results
+
+
 def run_experiment(experiment_name: str = 'recursive_artificial_selection',
                    settings: Dict[str, str] = DEFAULT_SETTINGS,
                    show_report: bool = True,
-                   save_results: bool = True) -> None:
+                   save_results: bool = True,
+                   workers: int = 1,
+                   resume: bool = False) -> Dict[str, Dict[str, List]]:
     """ 
     Runs a Recursive Artificial Selection (RAS) experiment for each recombination type.
 
-    Saves the results of each experiment to a JSON file in the results folder.
+    Saves the results of each experiment to a JSON file in the results folder,
+    and the results of every type together to merged.json.
+    With more than one worker the recombination types run in a process pool,
+    one type per worker, and a single progress bar counts the generations of
+    every type. Reports are shown once every type has finished.
 
     Parameters
     ----------
+    experiment_name : str, optional
+        The name of the experiment (default is 'recursive_artificial_selection').
     settings : dict, optional
         The settings to use for the experiment (default is DEFAULT_SETTINGS).
     show_report : bool, optional
         Whether or not to show the report for each experiment (default is True).
     save_results : bool, optional
         Whether or not to save the results of each experiment (default is True).
+    workers : int, optional
+        The number of recombination types run at once (default is 1).
+    resume : bool, optional
+        Whether or not to load the saved results of a recombination type 
+        instead of running it again (default is False).
+
+    Returns
+    -------
+    dict
+        The results of every recombination type, in RECOMBINATION_TYPES order.
     """
 
     recombination_types = list(RECOMBINATION_TYPES.keys())
+    results = {}
 
-    if save_experiment:
+    if save_results:
         save_experiment('settings', settings, experiment_name)
 
-    for type in recombination_types:
-        print(f'Starting {type} experiment at {time.ctime()}\n')
-
-        settings['RecombinationType'] = type
-        generations = settings['Generations']
-
-        results = recursive_artificial_selection(
-            settings, experiment_name, generations)
+    if resume:
+        for type in recombination_types:
+            if os.path.exists(f'results/{experiment_name}/{type}.json'):
+                print(f'Skipping {type} experiment, results already exist\n')
+                results[type] = load_results(type, experiment_name)
 
-        if show_report:
-            report(type, results)
+    pending = [type for type in recombination_types if type not in results]
 
-        if save_results:
-            save_experiment(type, results, experiment_name)
+    if workers > 1 and pending:
+        # Progress bars of the worker simulations would interleave
+        worker_settings = {**settings, 'ProgressBar': False}
+        generations = settings['Generations']
 
-        print(f'Finished {type} experiment. Ended at {time.ctime()}\n')
+        with Manager() as manager, ProcessPoolExecutor(max_workers=workers) as executor:
+            updates = manager.Queue()
+            futures = {
+                executor.submit(sweep_recombination_type, type, worker_settings,
+                                experiment_name, save_results, updates.put): type
+                for type in pending
+            }
+
+            with tqdm(desc='Sweep Progress', total=len(pending) * generations) as pbar:
+                remaining = len(pending) * generations
+                while remaining and not all(future.done() for future in futures):
+                    try:
+                        updates.get(timeout=1)
+                        pbar.update(1)
+                        remaining -= 1
+                    except queue.Empty:
+                        pass
+
+                while not updates.empty():
+                    updates.get()
+                    pbar.update(1)
+
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+                print(f'Finished {futures[future]} experiment. Ended at {time.ctime()}\n')
+    else:
+        for type in pending:
+            print(f'Starting {type} experiment at {time.ctime()}\n')
+            results[type] = sweep_recombination_type(
+                type, settings, experiment_name, save_results)
+            print(f'Finished {type} experiment. Ended at {time.ctime()}\n')
+
+    results = {type: results[type] for type in recombination_types}
+
+    if save_results:
+        save_experiment('merged', results, experiment_name)
+
+    if show_report:
+        for type, type_results in results.items():
+            report(type, type_results, experiment_name)
+
+    return results
@@ -5,8 +5,6 @@ This module contains the actions that allow dooders
 to move around the environment.
 """
 
-import random
-
 import numpy as np
 
 from dooders.sdk.core.core import Core
@@ -29,7 +27,7 @@ def move(dooder) -> None:
     """
     reality_array = dooder.perception.array("Energy")
     sensory_array = Senses.gather(dooder)
-    fixed_array = np.where(sensory_array >= 0.5, 1, 0)
+    fixed_array = (sensory_array >= 0.5).astype("uint8")
     destination = dooder.think("move_decision", fixed_array, reality_array)
 
     if isinstance(destination, np.int64):
@@ -37,7 +35,9 @@ def move(dooder) -> None:
     elif isinstance(destination, np.ndarray) and len(destination) > 0:
         final_destination = destination.argmax()
     elif isinstance(destination, (list, np.ndarray)) and len(destination) > 0:
-        final_destination = random.choice([d for d in destination if d != 0])
+        final_destination = dooder.simulation.random.choice(
+            [d for d in destination if d != 0]
+        )
     else:
         raise ValueError(f"Destination {destination} is not valid")
 
@@ -1,6 +1,8 @@
 import random
 from abc import ABC, abstractmethod
+from typing import Optional, Union
 
+import numpy as np
 import yaml
 import ast
 
@@ -16,15 +18,19 @@ class Reality(ABC):
     """ 
     """
 
-    def __init__(self):
+    def __init__(self, seed: Optional[Union[int, np.random.SeedSequence]] = None):
         """ 
         Args:
-            experiment_id: Unique ID for the experiment
-            params: Parameters for the experiment
+            seed: The seed of the simulation's random generators, 
+                random if None. The global random and numpy generators
+                are seeded from it as well
 
         Attributes:
             experiment_id: Unique ID for the experiment
             params: Parameters for the experiment
+            seed_sequence: The seed the random generators are spawned from
+            rng: numpy random generator owned by the simulation
+            random: random.Random owned by the simulation
             time: Time object for the simulation
             environment: Environment object for the simulation
             components: Dictionary of components for the simulation
@@ -32,11 +38,22 @@ class Reality(ABC):
         self.seed = ShortID()
         self.simulation_id = self.seed.uuid()
         # self.config = self.load_config(params)
-        self.random = random
+        if not isinstance(seed, np.random.SeedSequence):
+            seed = np.random.SeedSequence(seed)
+        self.seed_sequence = seed
+        numpy_seed, random_seed, global_seed = seed.spawn(3)
+        self.rng = np.random.default_rng(numpy_seed)
+        self.random = random.Random(
+            int.from_bytes(random_seed.generate_state(4).tobytes(), "little"))
+        # Draws that do not take the simulation's generators fall back
+        # on the global ones, so those are seeded too
+        global_state = global_seed.generate_state(4)
+        random.seed(int.from_bytes(global_state.tobytes(), "little"))
+        np.random.seed(global_state)
         # self.params = ExperimentParameters.parse_obj(self.config)
 
         # Initialize the simulation components
-        self.time = Time()
+        self.time = Time(self.random)
         
 
     def load_config(self, params):
@@ -292,7 +292,7 @@ class SequenceList(list):
         with open(path, "w") as f:
             f.write(self.to_json())
 
-    def sample(self, n: int) -> "SequenceList":
+    def sample(self, n: int, rng: np.random.Generator = None) -> "SequenceList":
         """
         Sample n sequences from the sequence list
 
@@ -300,13 +300,17 @@ class SequenceList(list):
         ----------
         n : int
             Number of sequences to sample
+        rng : np.random.Generator
+            The generator to sample with, usually the simulation's.
+            The global numpy generator if None
 
         Returns
         -------
         SequenceList
             Sampled sequence list
         """
-        sampled_indices = np.random.choice(len(self), n, replace=False)
+        rng = np.random if rng is None else rng
+        sampled_indices = rng.choice(len(self), n, replace=False)
         return SequenceList(*[self[i] for i in sampled_indices])
 
     @property
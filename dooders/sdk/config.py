@@ -34,6 +34,17 @@ class Config:
             'GridHeight': 5,
             'GridWidth': 5,
             'EnergyLifespan': ValueGenerator('uniform', 2, 5),
+            'BatchInference': False,
+            'PopulationOptimizer': False,
+            'InferenceCache': False,
+            'InferenceOnly': False,
+            'WeightArena': False,
+            'ReplayLearning': False,
+            'ReplayInterval': 10,
+            'ReplayCapacity': 256,
+            'ReplayBatchSize': 32,
+            'BackgroundLearning': False,
+            'LearningWorkers': None,
         }
 
         self.update(settings)
@@ -6,7 +6,9 @@
 # """
 
 import importlib
-from typing import List
+from typing import List, Optional, Union
+
+import numpy as np
 
 from dooders.sdk.config import Config
 from dooders.sdk.core import (Action, Condition, Policy, Settings, Strategy,
@@ -38,10 +40,20 @@ class Assemble:
     ALL_MODELS: List[str] = BASE_MODELS + ['resources', 'arena']
 
     @classmethod
-    def execute(cls, user_settings: dict = {}) -> Simulation:
+    def execute(cls,
+                user_settings: dict = {},
+                seed: Optional[Union[int, np.random.SeedSequence]] = None) -> Simulation:
         """
         Execute the assembly of the simulation.
 
+        Parameters
+        ----------
+        user_settings: dict
+            Included settings to override defaults, see Config.
+        seed: Optional[Union[int, np.random.SeedSequence]]
+            The seed the simulation's random generators are spawned from.
+            Random if None.
+
         Returns
         -------
         simulation: Simulation
@@ -52,7 +64,7 @@ class Assemble:
         settings_old = Settings.compile()
         final_settings = Config(user_settings)
 
-        simulation = Simulation(final_settings)
+        simulation = Simulation(final_settings, seed=seed)
 
         for model_name in cls.ALL_MODELS:
             try:
@@ -11,6 +11,9 @@ default_settings = {
             "activation_type": "sigmoid",
             "loss_type": "multilabel_binary_crossentropy",
             "optimizer": "adam",
+            "precision": "float32",
+            "storage_precision": None,
+            "binary_inputs": True,
         },
         "dooder_detection": {
             "model_name": "dooder_detection",
@@ -23,6 +26,9 @@ default_settings = {
             "activation_type": "sigmoid",
             "loss_type": "multilabel_binary_crossentropy",
             "optimizer": "adam",
+            "precision": "float32",
+            "storage_precision": None,
+            "binary_inputs": True,
         },
         "hazard_detection": {
             "model_name": "hazard_detection",
@@ -35,6 +41,9 @@ default_settings = {
             "activation_type": "sigmoid",
             "loss_type": "multilabel_binary_crossentropy",
             "optimizer": "adam",
+            "precision": "float32",
+            "storage_precision": None,
+            "binary_inputs": True,
         },
         "move_decision": {
             "model_name": "move_decision",
@@ -53,6 +62,9 @@ default_settings = {
             # 'activation_type': 'sigmoid',
             # 'loss_type': 'multilabel_binary_crossentropy',
             "optimizer": "adam",
+            "precision": "float32",
+            "storage_precision": None,
+            "binary_inputs": True,
         },
     },
 }
@@ -2,7 +2,7 @@
 Fate module used to decide the "fate" of an action.
 """
 
-from random import randint
+import random
 
 class Fate:
     """ 
@@ -12,12 +12,14 @@ class Fate:
     """
         
     @classmethod
-    def ask_fate(cls, probability: int) -> bool:
+    def ask_fate(cls, probability: int, random_state: random.Random = None) -> bool:
         """ 
         Ask fate if the action is successful
 
         Args:
             probability: The probability of the action being successful.
+            random_state: The random generator to ask, usually the 
+                simulation's. The global random module if None.
 
         Returns:
             bool: True if the action is successful, False otherwise.
@@ -25,7 +27,9 @@ class Fate:
         #TODO: Determine different distributions to check against the supplied probability.
         """
 
-        if randint(1, 100) < probability:
+        random_state = random if random_state is None else random_state
+
+        if random_state.randint(1, 100) < probability:
             return True
         else:
             return False
@@ -10,7 +10,7 @@ based on the space type, like a gird
 import importlib
 from abc import abstractmethod
 
-from dooders.sdk.core.core import Core
+from dooders.sdk.core.core import _COMPONENTS, Core
 from dooders.sdk.core.settings import Settings
 
 
@@ -20,6 +20,9 @@ class Surface(Core):
 
     This class is used to register surfaces and provide a schema for all surfaces.
 
+    Surfaces registered with Core.register('surface') are looked up by the
+    name of their module, others by the title-cased surface type.
+
     Methods
     -------
     build(surface_type: str) -> object
@@ -28,6 +31,7 @@ class Surface(Core):
     See Also
     --------
     sdk.surfaces.grid.Grid: Grid surface class.
+    sdk.surfaces.sparse_grid.SparseGrid: Chunked grid surface class.
     sdk.models.environment.Environment: Environment class.
 
     Examples
@@ -67,10 +71,12 @@ class Surface(Core):
         >>> surface = Surface.build('grid')
         """
         try:
-            module = f"dooders.sdk.surfaces.{surface_type}"
-            chosen_surface = getattr(
-                importlib.import_module(module), surface_type.title()
-            )
+            module = importlib.import_module(f"dooders.sdk.surfaces.{surface_type}")
+            registered = _COMPONENTS.get("surface", {}).get(surface_type)
+            if registered:
+                chosen_surface = next(iter(registered.values())).function
+            else:
+                chosen_surface = getattr(module, surface_type.title())
             settings = Settings.get("variables", surface_type)
             final_settings = {
                 k: v.args["value"] for k, v in settings.items() if v is not None
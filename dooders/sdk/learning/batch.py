@@ -0,0 +1,227 @@
+"""
+Batch Inference
+---------------
+Evaluates an internal model for a whole population of Dooders at once.
+
+Every Dooder carries its own copy of each internal model, so a cycle with
+thousands of Dooders makes thousands of tiny matrix products. Here the
+weights of every network are stacked into 3-D tensors so each layer is a
+single batched matmul for the whole population.
+
+The results are handed back to each network with ``SimpleNeuralNet.prime``,
+so the per-Dooder ``think`` flow (predict, learn, inference record) is
+unchanged. It just skips the forward pass when its input is unchanged.
+"""
+
+import copy
+from typing import TYPE_CHECKING, Dict, List
+
+import numpy as np
+
+from dooders.sdk.learning.scratch.layer import Layer_Dense
+
+if TYPE_CHECKING:
+    from dooders.sdk.learning.scratch.model import SimpleNeuralNet
+    from dooders.sdk.modules.internal_models import InternalModels
+
+
+class BatchInference:
+    """
+    Forward pass over many networks that share the same architecture.
+
+    Parameters
+    ----------
+    networks : List[SimpleNeuralNet]
+        The networks to evaluate, one per Dooder.
+
+    Attributes
+    ----------
+    networks : List[SimpleNeuralNet]
+        See Parameters.
+    template : list
+        The layers of the first network, used to apply the activations.
+    parameters : list
+        Stacked (weights, biases) for every dense layer, gathered from the
+        weight arena when the networks share one, None for every other layer.
+
+    Methods
+    -------
+    forward(X: np.ndarray) -> List[np.ndarray]
+        Output of every layer for every network.
+    prime(X: np.ndarray) -> np.ndarray
+        Run the batched pass and prime every network with its results.
+    """
+
+    def __init__(self, networks: List["SimpleNeuralNet"]) -> None:
+        self.networks = networks
+        self.template = networks[0].layers
+
+        signature = self.signature(networks[0])
+        for network in networks:
+            if self.signature(network) != signature:
+                raise ValueError(
+                    f"Network {network.id} does not match the batch architecture"
+                )
+
+        arena = networks[0].weight_arena
+
+        self.parameters = []
+        for i, layer in enumerate(self.template):
+            if isinstance(layer, Layer_Dense):
+                layers = [n.layers[i] for n in networks]
+                if arena is not None and all(layer in arena for layer in layers):
+                    # Read the parameters straight from the weight arena
+                    weights, biases = arena.gather(layers)
+                else:
+                    weights = np.stack([layer.weights for layer in layers])
+                    biases = np.stack([layer.biases for layer in layers])
+                self.parameters.append((weights, biases))
+            else:
+                self.parameters.append(None)
+
+    @staticmethod
+    def signature(network: "SimpleNeuralNet") -> tuple:
+        """
+        Layer types and weight shapes of a network.
+
+        Parameters
+        ----------
+        network : SimpleNeuralNet
+            The network to describe.
+
+        Returns
+        -------
+        tuple
+            The architecture signature of the network.
+        """
+        return tuple(
+            (type(layer), getattr(layer, "weights", np.empty(0)).shape)
+            for layer in network.layers
+        )
+
+    def forward(self, X: np.ndarray) -> List[np.ndarray]:
+        """
+        Output of every layer for every network.
+
+        Parameters
+        ----------
+        X : np.ndarray, shape (N, n_inputs)
+            One input row per network.
+
+        Returns
+        -------
+        List[np.ndarray]
+            The output of every layer, each with shape (N, n_outputs).
+        """
+        outputs = []
+
+        for layer, parameters in zip(self.template, self.parameters):
+            if parameters is not None:
+                weights, biases = parameters
+                X = np.matmul(X[:, np.newaxis, :], weights)[:, 0, :] + biases[:, 0, :]
+            else:
+                # Activations work row by row, so a copy of the template
+                # layer can process the stacked outputs as one batch. The
+                # copy must not write into the buffers of the template
+                activation = copy.copy(layer)
+                activation.buffers = None
+                activation.forward(X, training=False)
+                X = activation.output
+
+            outputs.append(X)
+
+        return outputs
+
+    def prime(self, X: np.ndarray) -> np.ndarray:
+        """
+        Run the batched pass and prime every network with its results.
+
+        Parameters
+        ----------
+        X : np.ndarray, shape (N, n_inputs)
+            One input row per network.
+
+        Returns
+        -------
+        np.ndarray, shape (N, n_outputs)
+            The final output for every network.
+        """
+        outputs = self.forward(X)
+
+        for i, network in enumerate(self.networks):
+            network.prime(X[i : i + 1], [output[i : i + 1] for output in outputs])
+
+        return outputs[-1]
+
+
+class PopulationInference:
+    """
+    Runs the sense models and the decision model for a whole population.
+
+    Mirrors the flow of the move action: every sense model is evaluated on
+    its perception array, the sense outputs are concatenated, thresholded
+    and fed to the decision model.
+
+    Parameters
+    ----------
+    internal_models : List[InternalModels]
+        The internal models of every Dooder in the population.
+    sense_models : List[str]
+        The names of the sense models, in the order Senses gathers them.
+    decision_model : str
+        The name of the decision model.
+
+    Methods
+    -------
+    prime(perceptions: Dict[str, np.ndarray]) -> np.ndarray
+        Evaluate all models and prime every network with its results.
+    """
+
+    def __init__(
+        self,
+        internal_models: List["InternalModels"],
+        sense_models: List[str],
+        decision_model: str = "move_decision",
+    ) -> None:
+        self.internal_models = internal_models
+        self.sense_models = sense_models
+        self.decision_model = decision_model
+
+    def batch(self, model_name: str) -> BatchInference:
+        """
+        Batch of one model across the population.
+
+        Parameters
+        ----------
+        model_name : str
+            The name of the internal model.
+
+        Returns
+        -------
+        BatchInference
+            The batch for the model.
+        """
+        return BatchInference([models[model_name] for models in self.internal_models])
+
+    def prime(self, perceptions: Dict[str, np.ndarray]) -> np.ndarray:
+        """
+        Evaluate all models and prime every network with its results.
+
+        Parameters
+        ----------
+        perceptions : Dict[str, np.ndarray]
+            The stacked perception arrays for every sense model,
+            each with one row per Dooder.
+
+        Returns
+        -------
+        np.ndarray
+            The decision model output for every Dooder.
+        """
+        sensory_array = np.concatenate(
+            [self.batch(name).prime(perceptions[name]) for name in self.sense_models],
+            axis=1,
+        ).astype("float32")
+        fixed_array = (sensory_array >= 0.5).astype("uint8")
+
+        return self.batch(self.decision_model).prime(fixed_array)
@@ -0,0 +1,164 @@
+"""
+Inference Cache
+---------------
+Memoizes the forward pass of internal models on binary inputs.
+
+The sense models see 9-bit perception arrays, so there are only 512
+distinct inputs. The cache stores the output of every layer for each
+(weights, input bit-pattern) pair, so a repeated prediction is a dict
+lookup instead of a 9x512x9 forward pass.
+
+A cache can be private to one network, in which case the weights are
+identified by a version counter, or shared by a whole population, in
+which case they are identified by a digest of their values so networks
+carrying identical inherited weights reuse each other's results.
+"""
+
+import hashlib
+from collections import OrderedDict
+from typing import Hashable, List, Optional
+
+import numpy as np
+
+
+class InferenceCache:
+    """
+    Least recently used store of layer outputs, keyed by weights and input.
+
+    Parameters
+    ----------
+    max_size : int
+        The maximum number of entries kept.
+    shared : bool
+        Whether the cache is shared by several networks. Shared caches
+        identify weights by value instead of by network and version.
+
+    Attributes
+    ----------
+    entries : OrderedDict
+        The cached layer outputs, most recently used last.
+    hits : int
+        The number of lookups answered by the cache.
+    misses : int
+        The number of lookups that needed a forward pass.
+
+    Methods
+    -------
+    key(input_array: np.ndarray) -> Optional[bytes]
+        The packed bit-pattern of a binary input.
+    get(weights_key: Hashable, input_key: bytes) -> Optional[List[np.ndarray]]
+        The cached layer outputs, if any.
+    put(weights_key: Hashable, input_key: bytes, outputs: List[np.ndarray]) -> None
+        Store the layer outputs of a forward pass.
+    digest(weights: List[np.ndarray]) -> bytes
+        A digest of the values of a set of weights.
+    clear() -> None
+        Drop every entry.
+    """
+
+    def __init__(self, max_size: int = 4096, shared: bool = True) -> None:
+        self.max_size = max_size
+        self.shared = shared
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(input_array: np.ndarray) -> Optional[bytes]:
+        """
+        The packed bit-pattern of a binary input.
+
+        Parameters
+        ----------
+        input_array : np.ndarray
+            The input of a prediction.
+
+        Returns
+        -------
+        Optional[bytes]
+            The shape and packed bits of the input,
+            None if the input is not binary.
+        """
+        if input_array.dtype.kind not in "biu":
+            return None
+        if input_array.size and (input_array.min() < 0 or input_array.max() > 1):
+            return None
+
+        shape = np.array(input_array.shape, dtype=np.int64).tobytes()
+
+        return shape + np.packbits(input_array).tobytes()
+
+    def get(
+        self, weights_key: Hashable, input_key: bytes
+    ) -> Optional[List[np.ndarray]]:
+        """
+        The cached layer outputs, if any.
+
+        Parameters
+        ----------
+        weights_key : Hashable
+            Identifies the weights the outputs were computed with.
+        input_key : bytes
+            The packed input, see key.
+
+        Returns
+        -------
+        Optional[List[np.ndarray]]
+            Output of every layer, in layer order, or None.
+        """
+        outputs = self.entries.get((weights_key, input_key))
+
+        if outputs is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self.entries.move_to_end((weights_key, input_key))
+
+        return outputs
+
+    def put(
+        self, weights_key: Hashable, input_key: bytes, outputs: List[np.ndarray]
+    ) -> None:
+        """
+        Store the layer outputs of a forward pass.
+
+        Parameters
+        ----------
+        weights_key : Hashable
+            Identifies the weights the outputs were computed with.
+        input_key : bytes
+            The packed input, see key.
+        outputs : List[np.ndarray]
+            Output of every layer, in layer order.
+        """
+        self.entries[(weights_key, input_key)] = outputs
+
+        if len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    @staticmethod
+    def digest(weights: List[np.ndarray]) -> bytes:
+        """
+        A digest of the values of a set of weights.
+
+        Parameters
+        ----------
+        weights : List[np.ndarray]
+            The weights and biases of a network.
+
+        Returns
+        -------
+        bytes
+            The digest, equal for equal weights.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for array in weights:
+            digest.update(np.ascontiguousarray(array).tobytes())
+
+        return digest.digest()
+
+    def clear(self) -> None:
+        """
+        Drop every entry.
+        """
+        self.entries.clear()
@@ -0,0 +1,115 @@
+"""
+Replay Buffer
+-------------
+Ring buffer of (input, target) samples for replay learning.
+
+With the online schedule an internal model runs one backward pass and one
+optimizer update for every prediction. With the replay schedule the model
+only appends its (perception, reality) pair to a ReplayBuffer, and every
+few cycles it trains on a mini-batch sampled from the buffer, so the
+learning work is done in a few batched passes instead of many
+single-sample ones.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+
+class ReplayBuffer:
+    """
+    Fixed-size store of the most recent training samples.
+
+    The arrays are allocated on the first sample, from its shapes and data
+    types. When the buffer is full the oldest samples are overwritten.
+
+    Parameters
+    ----------
+    capacity : int
+        The maximum number of samples kept.
+
+    Attributes
+    ----------
+    inputs : np.ndarray
+        The stored inputs, one row per sample.
+    targets : np.ndarray
+        The stored targets, one row per sample.
+    position : int
+        The row the next sample is written to.
+    count : int
+        The number of samples stored.
+
+    Methods
+    -------
+    add(inputs: np.ndarray, targets: np.ndarray) -> None
+        Store samples, overwriting the oldest ones when full.
+    sample(batch_size: int, rng: np.random.Generator) -> Tuple[np.ndarray, np.ndarray]
+        A random mini-batch of the stored samples.
+    clear() -> None
+        Drop every sample.
+    """
+
+    def __init__(self, capacity: int = 256) -> None:
+        self.capacity = capacity
+        self.inputs = None
+        self.targets = None
+        self.position = 0
+        self.count = 0
+
+    def add(self, inputs: np.ndarray, targets: np.ndarray) -> None:
+        """
+        Store samples, overwriting the oldest ones when full.
+
+        Parameters
+        ----------
+        inputs : np.ndarray
+            The inputs of the samples, one row per sample.
+        targets : np.ndarray
+            The targets of the samples. A 1-D target for a single input
+            row is stored as that sample's target row.
+        """
+        inputs = np.atleast_2d(inputs)
+        targets = np.asarray(targets).reshape(len(inputs), -1)
+
+        if self.inputs is None:
+            self.inputs = np.zeros((self.capacity,) + inputs.shape[1:], inputs.dtype)
+            self.targets = np.zeros((self.capacity,) + targets.shape[1:], targets.dtype)
+
+        for input_row, target_row in zip(inputs, targets):
+            self.inputs[self.position] = input_row
+            self.targets[self.position] = target_row
+            self.position = (self.position + 1) % self.capacity
+            self.count = min(self.count + 1, self.capacity)
+
+    def sample(
+        self, batch_size: int, rng: np.random.Generator = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        A random mini-batch of the stored samples, without repeats.
+
+        Parameters
+        ----------
+        batch_size : int
+            The number of samples, at most the number stored.
+        rng : np.random.Generator, optional
+            The random generator to sample with, numpy's global one by default.
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray]
+            The inputs and targets of the mini-batch.
+        """
+        rng = np.random if rng is None else rng
+        index = rng.choice(self.count, size=min(batch_size, self.count), replace=False)
+
+        return self.inputs[index], self.targets[index]
+
+    def clear(self) -> None:
+        """
+        Drop every sample.
+        """
+        self.position = 0
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
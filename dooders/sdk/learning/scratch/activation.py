@@ -5,6 +5,8 @@ https://nnfs.io/
 
 import numpy as np
 
+from dooders.sdk.learning.scratch.buffers import buffer
+
 
 # ReLU activation
 class Activation_ReLU:
@@ -44,7 +46,8 @@ class Activation_ReLU:
         # Remember input values
         self.inputs = inputs
         # Calculate output values from inputs
-        self.output = np.maximum(0, inputs)
+        self.output = buffer(self, "output", inputs.shape, inputs.dtype)
+        np.maximum(0, inputs, out=self.output)
 
     def backward(self, dvalues: np.ndarray) -> None:
         """
@@ -56,8 +59,9 @@ class Activation_ReLU:
             Gradient of loss function
         """
         # Since we need to modify original variable,
-        # let's make a copy of values first
-        self.dinputs = dvalues.copy()
+        # let's copy the values into the gradient buffer first
+        self.dinputs = buffer(self, "dinputs", dvalues.shape, dvalues.dtype)
+        np.copyto(self.dinputs, dvalues)
 
         # Zero gradient where input values were negative
         self.dinputs[self.inputs <= 0] = 0
@@ -117,12 +121,12 @@ class Activation_Softmax:
         self.inputs = inputs
 
         # Get unnormalized probabilities
-        exp_values = np.exp(inputs - np.max(inputs, axis=1, keepdims=True))
+        self.output = buffer(self, "output", inputs.shape, inputs.dtype)
+        np.subtract(inputs, np.max(inputs, axis=1, keepdims=True), out=self.output)
+        np.exp(self.output, out=self.output)
 
         # Normalize them for each sample
-        probabilities = exp_values / np.sum(exp_values, axis=1, keepdims=True)
-
-        self.output = probabilities
+        self.output /= np.sum(self.output, axis=1, keepdims=True)
 
     def backward(self, dvalues: np.ndarray) -> None:
         """
@@ -133,8 +137,8 @@ class Activation_Softmax:
         dvalues : array
             Gradient of loss function
         """
-        # Create uninitialized array
-        self.dinputs = np.empty_like(dvalues)
+        # Reuse the uninitialized gradient array
+        self.dinputs = buffer(self, "dinputs", dvalues.shape, dvalues.dtype)
 
         # Enumerate outputs and gradients
         for index, (single_output, single_dvalues) in enumerate(
@@ -204,7 +208,11 @@ class Activation_Sigmoid:
         # Save input and calculate/save output
         # of the sigmoid function
         self.inputs = inputs
-        self.output = 1 / (1 + np.exp(-inputs))
+        self.output = buffer(self, "output", inputs.shape, inputs.dtype)
+        np.negative(inputs, out=self.output)
+        np.exp(self.output, out=self.output)
+        self.output += 1
+        np.reciprocal(self.output, out=self.output)
 
     def backward(self, dvalues: np.ndarray) -> None:
         """
@@ -216,7 +224,15 @@ class Activation_Sigmoid:
             Gradient of loss function
         """
         # Derivative - calculates from output of the sigmoid function
-        self.dinputs = dvalues * (1 - self.output) * self.output
+        self.dinputs = buffer(
+            self,
+            "dinputs",
+            np.broadcast_shapes(dvalues.shape, self.output.shape),
+            np.result_type(dvalues, self.output),
+        )
+        np.subtract(1, self.output, out=self.dinputs)
+        self.dinputs *= self.output
+        self.dinputs *= dvalues
 
     def predictions(self, outputs: np.ndarray) -> np.ndarray:
         """
@@ -0,0 +1,49 @@
+"""
+Reusable output and gradient arrays for the objects of a Model.
+
+Model.finalize gives every layer, activation and loss object a 'buffers'
+dict. Their forward and backward passes then write into the arrays held
+there (with out= and in-place ufuncs) instead of allocating new ones on
+every call. An array is only reallocated when the shape it is asked for
+changes, i.e. when the batch size changes.
+
+Objects used outside a finalized Model have no 'buffers' and get a new
+array on every call, as before.
+"""
+
+import numpy as np
+
+
+def buffer(owner: object, name: str, shape: tuple, dtype: np.dtype) -> np.ndarray:
+    """
+    The reusable array of an object for a given purpose.
+
+    The content of the array is undefined, callers overwrite it.
+
+    Parameters
+    ----------
+    owner : object
+        The layer, activation or loss the array belongs to.
+    name : str
+        What the array holds, e.g. 'output' or 'dweights'.
+    shape : tuple
+        The shape needed.
+    dtype : np.dtype
+        The data type needed.
+
+    Returns
+    -------
+    np.ndarray
+        An array of the requested shape and data type.
+    """
+    buffers = getattr(owner, "buffers", None)
+
+    if buffers is None:
+        return np.empty(shape, dtype=dtype)
+
+    array = buffers.get(name)
+
+    if array is None or array.shape != shape or array.dtype != dtype:
+        array = buffers[name] = np.empty(shape, dtype=dtype)
+
+    return array
@@ -5,6 +5,7 @@ https://nnfs.io/
 
 import numpy as np
 
+from dooders.sdk.learning.scratch.buffers import buffer
 from dooders.sdk.learning.scratch.weights import initialize_weights
 
 
@@ -31,6 +32,13 @@ class Layer_Dense:
         L1 regularization strength. Defaults to 0.
     bias_regularizer_l2 : float
         L2 regularization strength. Defaults to 0.
+    frozen : bool
+        Whether the layer is left out of training. Defaults to False.
+    dtype : str
+        Data type of the weights and biases. Defaults to 'float64'.
+    rng : np.random.Generator
+        The generator to draw the initial weights from. Defaults to the
+        global numpy generator.
 
     Attributes
     ----------
@@ -61,6 +69,8 @@ class Layer_Dense:
     -------
     forward(inputs, training)
         Performs a forward pass of the layer.
+    infer(inputs)
+        Output of the layer, without remembering the inputs.
     backward(dvalues)
         Performs a backward pass of the layer.
     """
@@ -74,10 +84,14 @@ class Layer_Dense:
         bias_regularizer_l1=0,
         bias_regularizer_l2=0,
         frozen=False,
+        dtype="float64",
+        rng=None,
     ) -> None:
         # Initialize weights and biases
-        self.weights = initialize_weights(n_inputs, n_neurons, weight_init="random")
-        self.biases = np.zeros((1, n_neurons))
+        self.weights = initialize_weights(
+            n_inputs, n_neurons, weight_init="random", dtype=dtype, rng=rng
+        )
+        self.biases = np.zeros((1, n_neurons), dtype=dtype)
         self.frozen = frozen
         # Set regularization strength
         self.weight_regularizer_l1 = weight_regularizer_l1
@@ -99,7 +113,33 @@ class Layer_Dense:
         # Remember input values
         self.inputs = inputs
         # Calculate output values from inputs, weights and biases
-        self.output = np.dot(inputs, self.weights) + self.biases
+        self.output = buffer(
+            self,
+            "output",
+            (len(inputs), self.weights.shape[1]),
+            np.result_type(inputs, self.weights),
+        )
+        np.matmul(inputs, self.weights, out=self.output)
+        self.output += self.biases
+
+    def infer(self, inputs: np.ndarray) -> np.ndarray:
+        """
+        Output of the layer, without remembering the inputs.
+
+        Parameters
+        ----------
+        inputs : 2darray
+            Inputs to the layer.
+
+        Returns
+        -------
+        2darray
+            Output of the layer.
+        """
+        output = np.matmul(inputs, self.weights)
+        output += self.biases
+
+        return output
 
     def backward(self, dvalues: np.ndarray) -> None:
         """
@@ -112,29 +152,220 @@ class Layer_Dense:
         """
 
         # Gradients on parameters
-        self.dweights = np.dot(self.inputs.T, dvalues)
-        self.dbiases = np.sum(dvalues, axis=0, keepdims=True)
+        self.dweights = buffer(
+            self,
+            "dweights",
+            self.weights.shape,
+            np.result_type(self.inputs, dvalues),
+        )
+        np.matmul(self.inputs.T, dvalues, out=self.dweights)
+        self._bias_gradients(dvalues)
+        self._regularize()
 
-        # Gradients on regularization
-        # L1 on weights
+        # Gradient on values
+        self._input_gradients(dvalues)
+
+    def _bias_gradients(self, dvalues: np.ndarray) -> None:
+        """
+        Sets the gradients on the biases.
+
+        Parameters
+        ----------
+        dvalues : 2darray
+            Derivative of the loss function with respect to the layer's output.
+        """
+        self.dbiases = buffer(self, "dbiases", self.biases.shape, dvalues.dtype)
+        np.sum(dvalues, axis=0, keepdims=True, out=self.dbiases)
+
+    def _input_gradients(self, dvalues: np.ndarray) -> None:
+        """
+        Sets the gradients on the inputs.
+
+        Parameters
+        ----------
+        dvalues : 2darray
+            Derivative of the loss function with respect to the layer's output.
+        """
+        self.dinputs = buffer(
+            self,
+            "dinputs",
+            (len(dvalues), self.weights.shape[0]),
+            np.result_type(dvalues, self.weights),
+        )
+        np.matmul(dvalues, self.weights.T, out=self.dinputs)
+
+    def _regularize(self) -> None:
+        """
+        Adds the gradients of the regularization terms, in place.
+        """
+        # L1 on weights, +l1 for positive and -l1 for negative weights
         if self.weight_regularizer_l1 > 0:
-            dL1 = np.ones_like(self.weights)
-            dL1[self.weights < 0] = -1
-            self.dweights += self.weight_regularizer_l1 * dL1
+            self.dweights += self.weight_regularizer_l1
+            self.dweights[self.weights < 0] -= 2 * self.weight_regularizer_l1
         # L2 on weights
         if self.weight_regularizer_l2 > 0:
             self.dweights += 2 * self.weight_regularizer_l2 * self.weights
         # L1 on biases
         if self.bias_regularizer_l1 > 0:
-            dL1 = np.ones_like(self.biases)
-            dL1[self.biases < 0] = -1
-            self.dbiases += self.bias_regularizer_l1 * dL1
+            self.dbiases += self.bias_regularizer_l1
+            self.dbiases[self.biases < 0] -= 2 * self.bias_regularizer_l1
         # L2 on biases
         if self.bias_regularizer_l2 > 0:
             self.dbiases += 2 * self.bias_regularizer_l2 * self.biases
 
+
+class Layer_BinaryDense(Layer_Dense):
+    """
+    Dense layer for binary inputs, like the perception arrays.
+
+    With 0/1 inputs the dot product is the sum of the weight rows selected
+    by the set inputs, so the forward pass gathers and sums those rows and
+    the backward pass only writes the gradients of those rows. Perception
+    arrays have 1-3 set cells out of 9, which cuts the work of the layer
+    several-fold. Inputs that are not binary take the dense path.
+
+    Parameters
+    ----------
+    See Layer_Dense.
+
+    Attributes
+    ----------
+    active : tuple
+        The (sample, input) indices of the set inputs of the last forward
+        pass, None if it took the dense path.
+
+    Methods
+    -------
+    binary(inputs)
+        Whether inputs can take the sparse path.
+    """
+
+    active = None
+
+    @staticmethod
+    def binary(inputs: np.ndarray) -> bool:
+        """
+        Whether inputs can take the sparse path.
+
+        Parameters
+        ----------
+        inputs : 2darray
+            Inputs to the layer.
+
+        Returns
+        -------
+        bool
+            True for boolean inputs and integer inputs of 0s and 1s.
+        """
+        kind = inputs.dtype.kind
+
+        if kind == "b" or not inputs.size:
+            return kind in "biu"
+        # The ufunc reductions are cheaper than max() and min() on tiny arrays
+        if kind == "u":
+            return np.maximum.reduce(inputs, axis=None) <= 1
+        if kind == "i":
+            return (
+                np.minimum.reduce(inputs, axis=None) >= 0
+                and np.maximum.reduce(inputs, axis=None) <= 1
+            )
+        return False
+
+    def _gather(self, inputs: np.ndarray, output: np.ndarray) -> tuple:
+        """
+        Sum the weight rows selected by the set inputs of every sample.
+
+        Parameters
+        ----------
+        inputs : 2darray
+            Binary inputs to the layer.
+        output : 2darray
+            The array to write the output of the layer into.
+
+        Returns
+        -------
+        tuple
+            The (sample, input) indices of the set inputs.
+        """
+        rows, columns = np.nonzero(inputs)
+
+        if len(inputs) == 1:
+            np.add.reduce(self.weights[columns], axis=0, keepdims=True, out=output)
+        else:
+            output[...] = 0
+            np.add.at(output, rows, self.weights[columns])
+        output += self.biases
+
+        return rows, columns
+
+    def forward(self, inputs: np.ndarray, training: bool) -> None:
+        """
+        Performs a forward pass of the layer.
+
+        Parameters
+        ----------
+        inputs : 2darray
+            Inputs to the layer.
+        training : bool
+            Whether or not the layer is in training mode.
+        """
+        if not self.binary(inputs):
+            self.active = None
+            super().forward(inputs, training)
+            return
+
+        self.inputs = inputs
+        self.output = buffer(
+            self, "output", (len(inputs), self.weights.shape[1]), self.weights.dtype
+        )
+        self.active = self._gather(inputs, self.output)
+
+    def infer(self, inputs: np.ndarray) -> np.ndarray:
+        """
+        Output of the layer, without remembering the inputs.
+
+        Parameters
+        ----------
+        inputs : 2darray
+            Inputs to the layer.
+
+        Returns
+        -------
+        2darray
+            Output of the layer.
+        """
+        if not self.binary(inputs):
+            return super().infer(inputs)
+
+        output = np.empty((len(inputs), self.weights.shape[1]), self.weights.dtype)
+        self._gather(inputs, output)
+
+        return output
+
+    def backward(self, dvalues: np.ndarray) -> None:
+        """
+        Performs a backward pass of the layer.
+
+        Parameters
+        ----------
+        dvalues : 2darray
+            Derivative of the loss function with respect to the layer's output.
+        """
+        if self.active is None:
+            super().backward(dvalues)
+            return
+
+        rows, columns = self.active
+
+        # Only the rows of the set inputs have a gradient
+        self.dweights = buffer(self, "dweights", self.weights.shape, dvalues.dtype)
+        self.dweights[...] = 0
+        np.add.at(self.dweights, columns, dvalues[rows])
+        self._bias_gradients(dvalues)
+        self._regularize()
+
         # Gradient on values
-        self.dinputs = np.dot(dvalues, self.weights.T)
+        self._input_gradients(dvalues)
 
 
 class Layer_Dropout:
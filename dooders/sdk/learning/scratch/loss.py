@@ -5,6 +5,8 @@ https://nnfs.io/
 
 import numpy as np
 
+from dooders.sdk.learning.scratch.buffers import buffer
+
 
 class Loss:
     """
@@ -231,11 +233,12 @@ class Activation_Softmax_Loss_CategoricalCrossentropy(Loss):
             y_true = np.argmax(y_true, axis=1)
 
         # Copy so we can safely modify
-        self.dinputs = dvalues.copy()
+        self.dinputs = buffer(self, "dinputs", dvalues.shape, dvalues.dtype)
+        np.copyto(self.dinputs, dvalues)
         # Calculate gradient
         self.dinputs[range(samples), y_true] -= 1
         # Normalize gradient
-        self.dinputs = self.dinputs / samples
+        self.dinputs /= samples
 
 
 class Loss_BinaryCrossentropy(Loss):
@@ -496,17 +499,28 @@ class MultiLabelBinaryCrossEntropy(Loss):
         result = np.isin(test_elements, y_true)
         #!
 
-        y_pred_clipped = np.clip(result, self.epsilon, 1 - self.epsilon)
+        y_pred_clipped = buffer(self, "clipped", result.shape, np.float64)
+        np.clip(result, self.epsilon, 1 - self.epsilon, out=y_pred_clipped)
 
         self.forward(y_pred_clipped, result)
 
         samples = y_pred.shape[0]
 
-        # Calculate the gradient
-        self.dinputs = -(result / y_pred_clipped - (1 - result) / (1 - y_pred_clipped))
+        # Calculate the gradient, -(result / clipped - (1 - result) / (1 - clipped))
+        gradient = buffer(self, "gradient", result.shape, np.float64)
+        complement = buffer(self, "complement", result.shape, np.float64)
+        np.subtract(1, y_pred_clipped, out=complement)
+        np.subtract(1, result, out=gradient)
+        np.divide(gradient, complement, out=complement)
+        np.divide(result, y_pred_clipped, out=gradient)
+        np.subtract(complement, gradient, out=gradient)
+
+        # In the precision of the predictions
+        self.dinputs = buffer(self, "dinputs", result.shape, y_pred.dtype)
+        np.copyto(self.dinputs, gradient, casting="same_kind")
 
         # Normalize the gradient
-        self.dinputs = self.dinputs / samples
+        self.dinputs /= samples
 
 
 LOSS = {
@@ -5,7 +5,8 @@ https://nnfs.io/
 
 import copy
 import pickle
-from typing import List
+from contextlib import nullcontext
+from typing import TYPE_CHECKING, Hashable, List
 
 from dooders.sdk.learning.scratch.activation import ACTIVATIONS, Activation_Softmax
 from dooders.sdk.learning.scratch.eval import *
@@ -16,6 +17,14 @@ from dooders.sdk.learning.scratch.loss import (
     Loss_CategoricalCrossentropy,
 )
 from dooders.sdk.learning.scratch.optimizer import *
+from dooders.sdk.learning.scratch.plan import InferencePlan
+from dooders.sdk.learning.scratch.weights import SHARED_WEIGHTS
+
+if TYPE_CHECKING:
+    from dooders.sdk.learning.cache import InferenceCache
+    from dooders.sdk.learning.replay import ReplayBuffer
+    from dooders.sdk.learning.workers import LearningPool
+    from dooders.sdk.learning.weight_arena import WeightArena
 
 
 class Model:
@@ -40,6 +49,9 @@ class Model:
         Output layer activation object
     trainable_layers : list
         List of trainable layers
+    backward_layers : list
+        The layers from the first trainable layer on, the only ones
+        backward has to go through
 
     Methods
     -------
@@ -53,6 +65,8 @@ class Model:
         Train the model
     forward(X, training)
         Forward pass
+    replay_forward(X, outputs)
+        Restore the state of a forward pass from precomputed outputs
     backward(output, y)
         Backward pass
     evaluate(X, y)
@@ -135,6 +149,14 @@ class Model:
         # Update loss object with trainable layers
         self.loss.remember_trainable_layers(self.trainable_layers)
 
+        # The gradients of the layers before the first trainable layer,
+        # like a frozen input layer, would never be used
+        first_trainable = next(
+            (i for i, layer in enumerate(self.layers) if layer in self.trainable_layers),
+            layer_count,
+        )
+        self.backward_layers = self.layers[first_trainable:]
+
         # If output activation is Softmax and
         # loss function is Categorical Cross-Entropy
         # create an object of combined activation
@@ -149,6 +171,12 @@ class Model:
                 Activation_Softmax_Loss_CategoricalCrossentropy()
             )
 
+        # Give every object its own output and gradient buffers, reused by
+        # every pass until the batch size changes
+        for layer in self.layers + [self.loss, self.softmax_classifier_output]:
+            if layer is not None:
+                layer.buffers = {}
+
     def train(
         self,
         X: np.ndarray,
@@ -262,6 +290,69 @@ class Model:
         # return its output
         return layer.output
 
+    def replay_forward(self, X: np.ndarray, outputs: List[np.ndarray]) -> np.ndarray:
+        """
+        Restores the state a forward pass would have left on every layer,
+        using outputs that were already computed elsewhere (for example by
+        a batched pass over the whole population), so backward can run as
+        if forward had been called
+
+        Parameters
+        ----------
+        X : array
+            Input data
+        outputs : list
+            Output of every layer, in layer order
+
+        Returns
+        -------
+        array
+            Output data
+        """
+        self.input_layer.output = X
+
+        for layer, output in zip(self.layers, outputs):
+            layer.inputs = layer.prev.output
+            layer.output = output
+            if isinstance(layer, Layer_BinaryDense):
+                # backward reads the set inputs of the pass it follows
+                layer.active = (
+                    np.nonzero(layer.inputs) if layer.binary(layer.inputs) else None
+                )
+
+        return layer.output
+
+    def infer(self, X: np.ndarray, outputs: list = None) -> np.ndarray:
+        """
+        Performs a forward pass for inference only. Dense layers do not
+        remember their inputs, so backward can not be called afterwards
+
+        Parameters
+        ----------
+        X : array
+            Input data
+        outputs : list, optional
+            If given, the output of every layer is appended to it
+
+        Returns
+        -------
+        array
+            Output data
+        """
+        for layer in self.layers:
+            if isinstance(layer, Layer_Dense):
+                X = layer.infer(X)
+            else:
+                layer.forward(X, training=False)
+                X = layer.output
+
+            if outputs is not None:
+                # Activations write into their buffers, which the next
+                # pass overwrites
+                outputs.append(X.copy())
+
+        return X
+
     def backward(self, output: np.ndarray, y: np.ndarray) -> None:
         """
         Performs backward pass
@@ -289,7 +380,7 @@ class Model:
             # Call backward method going through
             # all the objects but last
             # in reversed order passing dinputs as a parameter
-            for layer in reversed(self.layers[:-1]):
+            for layer in reversed(self.backward_layers[:-1]):
                 layer.backward(layer.next.dinputs)
 
             return
@@ -299,7 +390,7 @@ class Model:
         self.loss.backward(output, y)
         # Call backward method going through all the objects
         # in reversed order passing dinputs as a parameter
-        for layer in reversed(self.layers):
+        for layer in reversed(self.backward_layers):
             layer.backward(layer.next.dinputs)
 
     # Saves the model
@@ -315,10 +406,18 @@ class Model:
         # and gradients from the loss object
         model.input_layer.__dict__.pop("output", None)
         model.loss.__dict__.pop("dinputs", None)
+        model.loss.__dict__.pop("buffers", None)
 
         # For each layer remove inputs, output and dinputs properties
         for layer in model.layers:
-            for property in ["inputs", "output", "dinputs", "dweights", "dbiases"]:
+            for property in [
+                "inputs",
+                "output",
+                "dinputs",
+                "dweights",
+                "dbiases",
+                "buffers",
+            ]:
                 layer.__dict__.pop(property, None)
 
         # Open a file in the binary-write mode and save the model
@@ -334,22 +433,79 @@ class SimpleNeuralNet:
     ----------
     model : Model
         The model
+    precision : str
+        Data type the model computes in, 'float32' by default
+    storage_precision : str
+        Data type of the weights handed out for inheritance and saving,
+        for example 'float16'. None keeps the compute precision
+    binary_inputs : bool
+        Whether the inputs are 0/1 arrays, in which case the first layer
+        sums the weight rows of the set inputs instead of a dot product.
+        True by default
+    rng : np.random.Generator
+        The generator the initial weights are drawn from, usually the
+        simulation's. None for the global numpy generator
+    plan : InferencePlan
+        Fused forward pass used for inference-only predictions, compiled
+        when the model is built
+    replay : ReplayBuffer
+        Where learn stores its samples under the replay schedule,
+        None for online learning
+    learning_pool : LearningPool
+        The thread pool learn hands its updates to, None to learn
+        in the calling thread
 
     Methods
     -------
     predict(input_array: np.ndarray) -> int
         Predict the class of the input data
+    prime(input_array: np.ndarray, outputs: List[np.ndarray]) -> None
+        Provide precomputed layer outputs for the next prediction
+    share_optimizer(optimizer: Optimizer_Adam_Population) -> None
+        Apply parameter updates through a population optimizer
+    use_cache(cache: InferenceCache) -> None
+        Memoize predictions on binary inputs
+    set_inference_only(inference_only: bool) -> None
+        Switch between learning and inference-only execution
+    use_weight_arena(arena: WeightArena) -> None
+        Keep the trainable parameters in a contiguous weight arena
+    use_replay(replay: ReplayBuffer) -> None
+        Switch between online and replay learning
+    train_replay(batch_size: int, rng: np.random.Generator) -> None
+        Train on a mini-batch of the stored samples
+    use_learning_pool(pool: LearningPool) -> None
+        Learn on background threads
+
+    Properties
+    ----------
+    weights_key : Hashable
+        Identifies the current weights in the inference cache
     """
 
     #! make better debugging in general to debug problems
     #! make data types so I can better identify data in flight
-    def __init__(self, id: str, instructions: dict) -> None:
+    def __init__(
+        self, id: str, instructions: dict, rng: np.random.Generator = None
+    ) -> None:
         """
         Initialize the model
         """
         self.id = id
+        self.rng = rng
         self.purpose = instructions["model_purpose"]
         self.built = False
+        self.primed = None
+        self.population_optimizer = None
+        self.inference_cache = None
+        self.inference_only = False
+        self.weight_arena = None
+        self.replay = None
+        self.learning_pool = None
+        self.precision = "float32"
+        self.storage_precision = None
+        self.binary_inputs = True
+        self.weight_version = 0
+        self._weights_key = None
 
         for key in instructions:
             setattr(self, key, instructions[key])
@@ -373,17 +529,64 @@ class SimpleNeuralNet:
         if output_size is None:
             output_size = self.output_size
 
+        if self.population_optimizer is not None and hasattr(self, "model"):
+            self.population_optimizer.release(self.model.trainable_layers)
+        if self.weight_arena is not None and hasattr(self, "model"):
+            self.weight_arena.release(self.model.trainable_layers)
+
         self.model = Model()
-        self.model.add(Layer_Dense(input_size, 512, frozen=True))
+        input_layer = Layer_BinaryDense if self.binary_inputs else Layer_Dense
+        self.model.add(
+            input_layer(
+                input_size, 512, frozen=True, dtype=self.precision, rng=self.rng
+            )
+        )
         self.model.add(ACTIVATIONS.get("relu")())
-        self.model.add(Layer_Dense(512, output_size))
+        self.model.add(
+            Layer_Dense(512, output_size, dtype=self.precision, rng=self.rng)
+        )
         self.model.add(ACTIVATIONS.get(self.activation_type)())
         self.model.set(
             loss=LOSS.get(self.loss_type)(),
-            optimizer=Optimizer_Adam(decay=5e-7),
+            optimizer=None if self.inference_only else Optimizer_Adam(decay=5e-7),
             accuracy=Accuracy_Categorical(),
         )
         self.model.finalize()
+        self.plan = InferencePlan.compile(self.model)
+        self._share_frozen_weights()
+        if self.weight_arena is not None:
+            self.weight_arena.attach(self.model.trainable_layers)
+        self.primed = None
+        self._weights_changed()
+
+    def _share_frozen_weights(self) -> None:
+        """
+        Replace the weights of frozen layers with the shared array
+        holding the same values
+        """
+        for layer in self.model.layers:
+            if isinstance(layer, Layer_Dense) and layer.frozen:
+                layer.weights = SHARED_WEIGHTS.intern(layer.weights)
+
+    def _weights_changed(self) -> None:
+        """
+        Invalidate the cached predictions after the weights changed
+        """
+        self.weight_version += 1
+        self._weights_key = None
+
+        if self.inference_cache is not None and not self.inference_cache.shared:
+            self.inference_cache.clear()
+
+    def _updates_pending(self) -> bool:
+        """
+        Whether the population optimizer has queued updates for this model
+        that have not been applied to the weights yet
+        """
+        return self.population_optimizer is not None and any(
+            layer in self.population_optimizer.pending
+            for layer in self.model.trainable_layers
+        )
 
     def predict(self, input_array: np.ndarray) -> int:
         """
@@ -404,16 +607,111 @@ class SimpleNeuralNet:
             self.build(input_size)
             self.built = True
 
+        if self.inference_only:
+            return self._infer(input_array)
+
+        # The update from the last prediction must be applied first
+        if self.learning_pool is not None:
+            self.learning_pool.wait(self)
+
         self.input = input_array
 
-        self.output = self.model.forward(input_array, training=False)
+        input_key = None
+        if self.inference_cache is not None and not self._updates_pending():
+            input_key = self.inference_cache.key(np.asarray(input_array))
+
+        # Use the outputs from a batched pass if they were computed
+        # for this exact input, then the cached outputs for this input
+        # and weights, otherwise run the forward pass
+        outputs = None
+        if self.primed is not None and np.array_equal(self.primed[0], input_array):
+            outputs = self.primed[1]
+        elif input_key is not None:
+            outputs = self.inference_cache.get(self.weights_key, input_key)
+            if outputs is None:
+                self.model.forward(input_array, training=False)
+                outputs = [layer.output.copy() for layer in self.model.layers]
+                self.inference_cache.put(self.weights_key, input_key, outputs)
+
+        if outputs is not None:
+            self.output = self.model.replay_forward(input_array, outputs)
+        else:
+            self.output = self.model.forward(input_array, training=False)
+        self.primed = None
+
         self.prediction = self.model.output_layer_activation.predictions(self.output)
 
         return self.output
 
+    def _infer(self, input_array: np.ndarray) -> np.ndarray:
+        """
+        Predict without keeping anything needed to learn from the prediction
+
+        Parameters
+        ----------
+        input_array : array
+            The input data
+
+        Returns
+        -------
+        array
+            The output of the model
+        """
+        primed, self.primed = self.primed, None
+        if primed is not None and np.array_equal(primed[0], input_array):
+            return primed[1][-1]
+
+        input_key = None
+        if self.inference_cache is not None:
+            input_key = self.inference_cache.key(np.asarray(input_array))
+
+        infer = self.model.infer if self.plan is None else self.plan
+
+        if input_key is None:
+            return infer(input_array)
+
+        outputs = self.inference_cache.get(self.weights_key, input_key)
+        if outputs is None:
+            outputs = []
+            infer(input_array, outputs)
+            self.inference_cache.put(self.weights_key, input_key, outputs)
+
+        return outputs[-1]
+
+    def prime(self, input_array: np.ndarray, outputs: List[np.ndarray]) -> None:
+        """
+        Provide precomputed layer outputs for the next prediction.
+
+        The outputs are only used if the next call to predict receives the
+        same input, and they are discarded after that call.
+
+        Parameters
+        ----------
+        input_array : array
+            The input data the outputs were computed for
+        outputs : list
+            Output of every layer, in layer order
+        """
+        self.primed = (input_array, outputs)
+
     def learn(self, reality: list) -> None:
         """
-        Learn from the reality
+        Learn from the reality, on a worker thread if the model uses
+        a learning pool
+
+        Parameters
+        ----------
+        reality : list
+            The reality (truth)
+        """
+        if self.learning_pool is not None:
+            self.learning_pool.submit(self, reality)
+        else:
+            self._learn(reality)
+
+    def _learn(self, reality: list) -> None:
+        """
+        Learn from the reality, in the calling thread
 
         Parameters
         ----------
@@ -423,16 +721,167 @@ class SimpleNeuralNet:
         self.reality = reality
         reality_array = np.array(self.reality)
 
-        if len(reality_array) == 0:
+        # One-hot or multi-label targets are cast once to the model precision
+        # so the backward pass does not upcast, class indices stay integers
+        if reality_array.ndim == 2:
+            reality_array = reality_array.astype(self.precision, copy=False)
+
+        if self.inference_only or len(reality_array) == 0:
             pass  # nothing to learn
+        elif self.replay is not None:
+            # Keep the sample, it is learned from in the next replay training
+            self.replay.add(self.input, reality_array)
         else:
-            # Optimize parameters
+            self._apply_pending()
             self.model.backward(self.output, reality_array)
+            self._update()
+
+    def train_replay(self, batch_size: int, rng: np.random.Generator = None) -> None:
+        """
+        Train on a mini-batch sampled from the replay buffer, with one
+        batched forward and backward pass
+
+        Parameters
+        ----------
+        batch_size : int
+            The number of samples in the mini-batch
+        rng : np.random.Generator, optional
+            The random generator to sample with
+        """
+        if self.inference_only or self.replay is None or len(self.replay) == 0:
+            return
+
+        inputs, targets = self.replay.sample(batch_size, rng)
+        self._apply_pending()
+        output = self.model.forward(inputs, training=True)
+        self.model.backward(output, targets.astype(self.precision, copy=False))
+        self._update()
+        self.primed = None
+
+    def _apply_pending(self) -> None:
+        """
+        Apply the update still queued for this model in the population
+        optimizer, before the next backward pass overwrites its gradients
+        """
+        if self._updates_pending():
+            self.population_optimizer.step()
+
+    def _update(self) -> None:
+        """
+        Apply the gradients of the last backward pass
+        """
+        if self.population_optimizer is not None:
+            # Queue the update, it is applied with the rest of the population.
+            # The optimizer is shared by every worker of a learning pool
+            pool = self.learning_pool
+            with nullcontext() if pool is None else pool.lock:
+                self.population_optimizer.queue(self.model.trainable_layers)
+        else:
+            # Optimize parameters
             self.model.optimizer.pre_update_params()
             for layer in self.model.trainable_layers:
                 self.model.optimizer.update_params(layer)
             self.model.optimizer.post_update_params()
 
+        self._weights_changed()
+
+    def use_learning_pool(self, pool: "LearningPool") -> None:
+        """
+        Hand the updates of learn to the worker threads of a learning pool.
+        Pass None to learn in the calling thread again.
+
+        Parameters
+        ----------
+        pool : LearningPool
+            The pool shared by the population, or None
+        """
+        if self.learning_pool is not None:
+            self.learning_pool.wait(self)
+
+        self.learning_pool = pool
+
+    def use_replay(self, replay: "ReplayBuffer") -> None:
+        """
+        Store the samples of learn in a replay buffer and only train in
+        train_replay. Pass None to go back to online learning.
+
+        Parameters
+        ----------
+        replay : ReplayBuffer
+            The buffer of this model, or None
+        """
+        self.replay = replay
+
+    def share_optimizer(self, optimizer: "Optimizer_Adam_Population") -> None:
+        """
+        Apply parameter updates through a population optimizer instead of
+        the model's own optimizer. Pass None to release the model from the
+        population optimizer.
+
+        Parameters
+        ----------
+        optimizer : Optimizer_Adam_Population
+            The optimizer shared by the population, or None
+        """
+        if self.population_optimizer is not None:
+            self.population_optimizer.release(self.model.trainable_layers)
+
+        self.population_optimizer = optimizer
+
+    def set_inference_only(self, inference_only: bool = True) -> None:
+        """
+        Switch between learning and inference-only execution.
+
+        In inference-only mode predictions use a lean forward pass, learn
+        does nothing and the model holds no optimizer, so no gradient or
+        optimizer state is ever allocated.
+
+        Parameters
+        ----------
+        inference_only : bool
+            Whether the model only runs inference
+        """
+        self.inference_only = inference_only
+
+        if inference_only:
+            self.share_optimizer(None)
+            self.model.optimizer = None
+        elif self.model.optimizer is None:
+            self.model.optimizer = Optimizer_Adam(decay=5e-7)
+
+        self.primed = None
+
+    def use_weight_arena(self, arena: "WeightArena") -> None:
+        """
+        Keep the parameters of the trainable layers in a weight arena.
+        Pass None to move them back to private arrays.
+
+        Parameters
+        ----------
+        arena : WeightArena
+            The arena shared by the population, or None
+        """
+        if self.weight_arena is not None:
+            self.weight_arena.release(self.model.trainable_layers)
+
+        self.weight_arena = arena
+
+        if arena is not None:
+            arena.attach(self.model.trainable_layers)
+
+    def use_cache(self, cache: "InferenceCache") -> None:
+        """
+        Memoize predictions on binary inputs in an inference cache.
+        Pass None to stop caching.
+
+        Parameters
+        ----------
+        cache : InferenceCache
+            The cache, private to this model or shared by the population
+        """
+        self.inference_cache = cache
+        self._weights_key = None
+
     def inherit_weights(self, genetics: List[np.ndarray]) -> None:
         """
         Update the weights based on provided derived genetics
@@ -443,8 +892,15 @@ class SimpleNeuralNet:
         genetics : List[np.ndarray]
             The weights of the neural network
         """
-        self.model.layers[0].weights = genetics[0]
-        self.model.layers[2].weights = genetics[1]
+        for layer, weights in zip(self.model.layers[0::2], genetics):
+            weights = np.asarray(weights, dtype=self.precision)
+            if self.weight_arena is not None and layer in self.weight_arena:
+                self.weight_arena.store(layer, weights)
+            else:
+                layer.weights = weights
+        self._share_frozen_weights()
+        self.primed = None
+        self._weights_changed()
 
     def save(self, path: str) -> None:
         """
@@ -482,6 +938,33 @@ class SimpleNeuralNet:
         )
         self.inherit_weights(loaded_weights)
 
+    @property
+    def weights_key(self) -> Hashable:
+        """
+        Identifies the current weights in the inference cache
+
+        Returns
+        -------
+        Hashable
+            A digest of the weights and biases if the cache is shared,
+            so identical networks share entries, otherwise the model
+            and its weight version
+        """
+        if self._weights_key is None:
+            if self.inference_cache is not None and self.inference_cache.shared:
+                self._weights_key = self.inference_cache.digest(
+                    [
+                        parameters
+                        for layer in self.model.layers
+                        if isinstance(layer, Layer_Dense)
+                        for parameters in (layer.weights, layer.biases)
+                    ]
+                )
+            else:
+                self._weights_key = (id(self), self.weight_version)
+
+        return self._weights_key
+
     @property
     def layers(self) -> list:
         """
@@ -497,7 +980,8 @@ class SimpleNeuralNet:
     @property
     def weights(self) -> np.ndarray:
         """
-        Get the weights of the neural network from every dense layer
+        Get the weights of the neural network from every dense layer,
+        in the storage precision if one is set
 
         Returns
         -------
@@ -507,5 +991,8 @@ class SimpleNeuralNet:
         weights = []
         for layer in self.model.layers:
             if isinstance(layer, Layer_Dense):
-                weights.append(layer.weights)
+                if self.storage_precision is not None:
+                    weights.append(layer.weights.astype(self.storage_precision))
+                else:
+                    weights.append(layer.weights)
         return np.array(weights, dtype=object)
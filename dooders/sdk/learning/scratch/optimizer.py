@@ -361,3 +361,201 @@ class Optimizer_Adam:
 
     def post_update_params(self) -> None:
         self.iterations += 1
+
+
+class Optimizer_Adam_Population:
+    """
+    Adam optimizer shared by the trainable layers of many models.
+
+    Every model keeps its own Adam state, but instead of separate small
+    arrays the momentums and caches of all layers with the same shape are
+    kept in stacked arrays, one slot per layer. Layers queue their
+    gradients after the backward pass and step() applies one vectorized
+    Adam update per layer shape for every queued layer.
+
+    The update of a layer is identical to Optimizer_Adam, including the
+    learning rate decay, as each slot tracks its own iteration count.
+
+    Parameters
+    ----------
+    learning_rate : float, optional
+        Learning rate, by default 0.001
+    decay : float, optional
+        Decay rate, by default 0.
+    epsilon : float, optional
+        Small value to avoid division by zero, by default 1e-7
+    beta_1 : float, optional
+        Exponential decay rate for the momentums, by default 0.9
+    beta_2 : float, optional
+        Exponential decay rate for the caches, by default 0.999
+
+    Methods
+    -------
+    queue(layers)
+        Queue the gradients of the layers for the next step
+    step()
+        Update the parameters of every queued layer
+    release(layers)
+        Free the slots of the layers so they can be reused
+
+    Attributes
+    ----------
+    slots : dict
+        The (shape, slot index) of every registered layer
+    groups : dict
+        The stacked Adam state for every layer shape
+    pending : dict
+        The layers queued for the next step
+    """
+
+    def __init__(self,
+                 learning_rate: float = 0.001,
+                 decay: float = 0.,
+                 epsilon: float = 1e-7,
+                 beta_1: float = 0.9,
+                 beta_2: float = 0.999) -> None:
+        self.learning_rate = learning_rate
+        self.decay = decay
+        self.epsilon = epsilon
+        self.beta_1 = beta_1
+        self.beta_2 = beta_2
+        self.slots = {}
+        self.groups = {}
+        self.pending = {}
+
+    def _register(self, layer: layer) -> tuple:
+        """
+        Assign a slot to a layer, reusing a freed slot if there is one
+
+        Parameters
+        ----------
+        layer : Layer
+            Layer to register
+
+        Returns
+        -------
+        tuple
+            The shape key and slot index of the layer
+        """
+        key = (layer.weights.shape, layer.biases.shape, layer.weights.dtype.str)
+
+        if key not in self.groups:
+            dtype = layer.weights.dtype
+            self.groups[key] = {
+                'weight_momentums': np.zeros((1,) + layer.weights.shape, dtype),
+                'weight_cache': np.zeros((1,) + layer.weights.shape, dtype),
+                'bias_momentums': np.zeros((1,) + layer.biases.shape, dtype),
+                'bias_cache': np.zeros((1,) + layer.biases.shape, dtype),
+                'iterations': np.zeros(1, dtype=int),
+                'size': 0,
+                'free': [],
+            }
+
+        group = self.groups[key]
+
+        if group['free']:
+            index = group['free'].pop()
+        else:
+            index = group['size']
+            group['size'] += 1
+
+            # Double the capacity of the stacked arrays when full
+            capacity = len(group['iterations'])
+            if index >= capacity:
+                for name in ('weight_momentums', 'weight_cache',
+                             'bias_momentums', 'bias_cache', 'iterations'):
+                    group[name] = np.concatenate(
+                        (group[name], np.zeros_like(group[name])))
+
+        self.slots[layer] = (key, index)
+
+        return self.slots[layer]
+
+    def queue(self, layers: list) -> None:
+        """
+        Queue the gradients of the layers for the next step
+
+        If a layer is already queued, pending updates are applied first,
+        so its gradients are never overwritten before they are used.
+
+        Parameters
+        ----------
+        layers : list
+            The trainable layers of a model, after the backward pass
+        """
+        if any(layer in self.pending for layer in layers):
+            self.step()
+
+        for layer in layers:
+            if layer not in self.slots:
+                self._register(layer)
+            self.pending[layer] = self.slots[layer]
+
+    def step(self) -> None:
+        """
+        Update the parameters of every queued layer
+
+        One vectorized Adam update is applied per layer shape.
+        """
+        batches = {}
+        for layer, (key, index) in self.pending.items():
+            batches.setdefault(key, []).append((layer, index))
+
+        for key, batch in batches.items():
+            group = self.groups[key]
+            layers = [layer for layer, _ in batch]
+            index = np.array([index for _, index in batch])
+
+            iterations = group['iterations'][index]
+            # Per slot factors, in the precision of the parameters
+            dtype = group['weight_momentums'].dtype
+            learning_rate = (self.learning_rate * (
+                1. / (1. + self.decay * iterations)))[:, None, None].astype(dtype)
+            momentum_correction = (
+                1 - self.beta_1 ** (iterations + 1))[:, None, None].astype(dtype)
+            cache_correction = (
+                1 - self.beta_2 ** (iterations + 1))[:, None, None].astype(dtype)
+
+            for parameter, gradient, name in (('weights', 'dweights', 'weight'),
+                                              ('biases', 'dbiases', 'bias')):
+                gradients = np.stack([getattr(layer, gradient) for layer in layers])
+
+                momentums = self.beta_1 * group[f'{name}_momentums'][index] + \
+                    (1 - self.beta_1) * gradients
+                cache = self.beta_2 * group[f'{name}_cache'][index] + \
+                    (1 - self.beta_2) * gradients**2
+                group[f'{name}_momentums'][index] = momentums
+                group[f'{name}_cache'][index] = cache
+
+                updates = learning_rate * (momentums / momentum_correction) / \
+                    (np.sqrt(cache / cache_correction) + self.epsilon)
+
+                for layer, update in zip(layers, updates):
+                    getattr(layer, parameter)[...] -= update
+
+            group['iterations'][index] += 1
+
+        self.pending = {}
+
+    def release(self, layers: list) -> None:
+        """
+        Free the slots of the layers so they can be reused
+
+        Pending updates are applied first if any of the layers is queued.
+
+        Parameters
+        ----------
+        layers : list
+            The trainable layers of a model
+        """
+        if any(layer in self.pending for layer in layers):
+            self.step()
+
+        for layer in layers:
+            if layer in self.slots:
+                key, index = self.slots.pop(layer)
+                group = self.groups[key]
+                for name in ('weight_momentums', 'weight_cache',
+                             'bias_momentums', 'bias_cache', 'iterations'):
+                    group[name][index] = 0
+                group['free'].append(index)
@@ -0,0 +1,165 @@
+"""
+Inference Plan
+--------------
+A fused forward pass for the dense -> activation -> dense -> activation
+networks built by SimpleNeuralNet.
+
+Model.forward walks the layer objects and writes the inputs and output of
+every layer back onto it, which costs more than the arithmetic for a
+single 1x9 input. The plan is compiled once from the layers of a model and
+runs the whole pass as one function over local arrays, applying the
+activations in place. It performs the same operations in the same order as
+Model.forward, so its outputs are identical.
+
+The plan reads the parameters through the two dense layers on every call,
+so it stays valid when the weights are trained in place, replaced by
+inherit_weights or moved by a weight arena. It has to be compiled again
+when the layers themselves are replaced.
+"""
+
+from typing import TYPE_CHECKING, Callable, List, Optional
+
+import numpy as np
+
+from dooders.sdk.learning.scratch.activation import (
+    Activation_Linear,
+    Activation_ReLU,
+    Activation_Sigmoid,
+    Activation_Softmax,
+)
+from dooders.sdk.learning.scratch.layer import Layer_Dense
+
+if TYPE_CHECKING:
+    from dooders.sdk.learning.scratch.model import Model
+
+
+def relu(x: np.ndarray) -> None:
+    np.maximum(0, x, out=x)
+
+
+def sigmoid(x: np.ndarray) -> None:
+    np.negative(x, out=x)
+    np.exp(x, out=x)
+    x += 1
+    np.reciprocal(x, out=x)
+
+
+def softmax(x: np.ndarray) -> None:
+    # The ufunc reductions behind np.max and np.sum, without their wrappers
+    np.subtract(x, np.maximum.reduce(x, axis=1, keepdims=True), out=x)
+    np.exp(x, out=x)
+    x /= np.add.reduce(x, axis=1, keepdims=True)
+
+
+def linear(x: np.ndarray) -> None:
+    pass
+
+
+#: In-place kernel of every activation the plan can fuse
+KERNELS = {
+    Activation_ReLU: relu,
+    Activation_Sigmoid: sigmoid,
+    Activation_Softmax: softmax,
+    Activation_Linear: linear,
+}
+
+
+class InferencePlan:
+    """
+    Fused forward pass of a two dense layer model.
+
+    Parameters
+    ----------
+    first : Layer_Dense
+        The first dense layer.
+    hidden : Callable
+        The in-place kernel of the hidden activation.
+    second : Layer_Dense
+        The second dense layer.
+    activation : Callable
+        The in-place kernel of the output activation.
+
+    Methods
+    -------
+    compile(model: Model) -> Optional[InferencePlan]
+        The plan for a model, None if its layers can not be fused.
+    """
+
+    def __init__(
+        self,
+        first: Layer_Dense,
+        hidden: Callable,
+        second: Layer_Dense,
+        activation: Callable,
+    ) -> None:
+        self.first = first
+        self.hidden = hidden
+        self.second = second
+        self.activation = activation
+
+    @classmethod
+    def compile(cls, model: "Model") -> Optional["InferencePlan"]:
+        """
+        The plan for a model.
+
+        Parameters
+        ----------
+        model : Model
+            A finalized model.
+
+        Returns
+        -------
+        Optional[InferencePlan]
+            The plan, None unless the model is dense -> activation ->
+            dense -> activation with activations in KERNELS.
+        """
+        layers = model.layers
+
+        if len(layers) != 4:
+            return None
+
+        first, hidden, second, activation = layers
+
+        if not (isinstance(first, Layer_Dense) and isinstance(second, Layer_Dense)):
+            return None
+        if type(hidden) not in KERNELS or type(activation) not in KERNELS:
+            return None
+
+        return cls(first, KERNELS[type(hidden)], second, KERNELS[type(activation)])
+
+    def __call__(self, X: np.ndarray, outputs: List[np.ndarray] = None) -> np.ndarray:
+        """
+        Run the forward pass.
+
+        Parameters
+        ----------
+        X : np.ndarray
+            Input data.
+        outputs : List[np.ndarray], optional
+            If given, the output of every layer is appended to it.
+
+        Returns
+        -------
+        np.ndarray
+            Output of the model.
+        """
+        second = self.second
+
+        x = self.first.infer(X)
+        if outputs is not None:
+            outputs.append(x.copy())
+
+        self.hidden(x)
+        if outputs is not None:
+            outputs.append(x.copy())
+
+        x = np.matmul(x, second.weights)
+        x += second.biases
+        if outputs is not None:
+            outputs.append(x.copy())
+
+        self.activation(x)
+        if outputs is not None:
+            outputs.append(x)
+
+        return x
@@ -1,11 +1,19 @@
 """
-Functions for initializing weights
+Functions for initializing weights, and the shared store for the
+weights of frozen layers
 """
 
+import hashlib
+import weakref
+
 import numpy as np
 
 
-def initialize_weights(n_inputs: int, n_neurons: int, weight_init: str = 'random') -> np.ndarray:
+def initialize_weights(n_inputs: int,
+                       n_neurons: int,
+                       weight_init: str = 'random',
+                       dtype: str = 'float64',
+                       rng: np.random.Generator = None) -> np.ndarray:
     """ 
     Initializes weights using the specified method.
     
@@ -17,6 +25,11 @@ def initialize_weights(n_inputs: int, n_neurons: int, weight_init: str = 'random
         Number of neurons.
     weight_init : str
         Weight initialization method.
+    dtype : str
+        Data type of the weights, 'float64', 'float32', etc.
+    rng : np.random.Generator
+        The generator to draw the weights from, usually the simulation's.
+        The global numpy generator if None.
     
     Returns
     -------
@@ -25,16 +38,20 @@ def initialize_weights(n_inputs: int, n_neurons: int, weight_init: str = 'random
     """
     
     if weight_init == 'random':
-        return random_weights(n_inputs, n_neurons)
+        weights = random_weights(n_inputs, n_neurons, rng)
     elif weight_init == 'he':
-        return he_weights(n_inputs, n_neurons)
+        weights = he_weights(n_inputs, n_neurons, rng)
     elif weight_init == 'xavier':
-        return xavier_weights(n_inputs, n_neurons)
+        weights = xavier_weights(n_inputs, n_neurons, rng)
     else:
         raise ValueError(f'Unknown weight initialization method: {weight_init}')
 
+    return weights.astype(dtype, copy=False)
+
 
-def random_weights(n_inputs: int, n_neurons: int) -> np.ndarray:
+def random_weights(n_inputs: int,
+                   n_neurons: int,
+                   rng: np.random.Generator = None) -> np.ndarray:
     """ 
     Initializes weights randomly.
     
@@ -44,6 +61,9 @@ def random_weights(n_inputs: int, n_neurons: int) -> np.ndarray:
         Number of inputs.
     n_neurons : int
         Number of neurons.
+    rng : np.random.Generator
+        The generator to draw the weights from. The global numpy
+        generator if None.
     
     Returns
     -------
@@ -51,10 +71,12 @@ def random_weights(n_inputs: int, n_neurons: int) -> np.ndarray:
         Randomly initialized weights.
     """
     
-    return 0.01 * np.random.randn(n_inputs, n_neurons)
+    return 0.01 * _standard_normal(rng, n_inputs, n_neurons)
 
 
-def he_weights(n_inputs: int, n_neurons: int) -> np.ndarray:
+def he_weights(n_inputs: int,
+               n_neurons: int,
+               rng: np.random.Generator = None) -> np.ndarray:
     """ 
     Initializes weights using He et al. initialization.
     
@@ -64,6 +86,9 @@ def he_weights(n_inputs: int, n_neurons: int) -> np.ndarray:
         Number of inputs.
     n_neurons : int
         Number of neurons.
+    rng : np.random.Generator
+        The generator to draw the weights from. The global numpy
+        generator if None.
     
     Returns
     -------
@@ -71,10 +96,12 @@ def he_weights(n_inputs: int, n_neurons: int) -> np.ndarray:
         Randomly initialized weights.
     """
     
-    return np.random.randn(n_inputs, n_neurons) * np.sqrt(2 / n_inputs)
+    return _standard_normal(rng, n_inputs, n_neurons) * np.sqrt(2 / n_inputs)
 
 
-def xavier_weights(n_inputs: int, n_neurons: int) -> np.ndarray:
+def xavier_weights(n_inputs: int,
+                   n_neurons: int,
+                   rng: np.random.Generator = None) -> np.ndarray:
     """ 
     Initializes weights using Xavier initialization.
     
@@ -84,10 +111,112 @@ def xavier_weights(n_inputs: int, n_neurons: int) -> np.ndarray:
         Number of inputs.
     n_neurons : int
         Number of neurons.
+    rng : np.random.Generator
+        The generator to draw the weights from. The global numpy
+        generator if None.
 
     Returns
     -------
     weights : 2darray
         Randomly initialized weights.
     """
-    return np.random.randn(n_inputs, n_neurons) * np.sqrt(1 / n_inputs)
\ No newline at end of file
+    return _standard_normal(rng, n_inputs, n_neurons) * np.sqrt(1 / n_inputs)
+
+
+def _standard_normal(rng: np.random.Generator, *shape: int) -> np.ndarray:
+    """
+    Draw standard normal values from rng, or from the global numpy
+    generator if rng is None.
+    """
+    if rng is None:
+        return np.random.randn(*shape)
+
+    return rng.standard_normal(shape)
+
+
+class SharedWeights:
+    """
+    Flyweight store for the weights of frozen layers.
+
+    Frozen layers are never trained, so networks whose frozen weights hold
+    the same values can use one array instead of a copy each. Arrays are
+    interned by value and returned read-only; code that needs different
+    values must assign a new array, which is interned in turn. An array is
+    dropped from the store once no layer refers to it anymore.
+
+    Methods
+    -------
+    intern(weights: np.ndarray) -> np.ndarray
+        The shared read-only array holding the same values.
+
+    Properties
+    ----------
+    nbytes : int
+        The memory held by the shared arrays.
+    """
+
+    def __init__(self) -> None:
+        self._arrays = weakref.WeakValueDictionary()
+
+    @staticmethod
+    def key(weights: np.ndarray) -> tuple:
+        """
+        Identifies the values of an array.
+
+        Parameters
+        ----------
+        weights : np.ndarray
+            The array to identify.
+
+        Returns
+        -------
+        tuple
+            The shape, data type and a digest of the values.
+        """
+        digest = hashlib.blake2b(np.ascontiguousarray(weights).tobytes(), digest_size=16)
+
+        return weights.shape, weights.dtype.str, digest.digest()
+
+    def intern(self, weights: np.ndarray) -> np.ndarray:
+        """
+        The shared read-only array holding the same values.
+
+        Parameters
+        ----------
+        weights : np.ndarray
+            The weights to share.
+
+        Returns
+        -------
+        np.ndarray
+            The shared array. It is a read-only copy of weights
+            the first time these values are seen.
+        """
+        weights = np.asarray(weights)
+        key = self.key(weights)
+        shared = self._arrays.get(key)
+
+        if shared is None:
+            shared = np.array(weights)
+            shared.flags.writeable = False
+            self._arrays[key] = shared
+
+        return shared
+
+    def __len__(self) -> int:
+        return len(self._arrays)
+
+    @property
+    def nbytes(self) -> int:
+        """
+        The memory held by the shared arrays.
+
+        Returns
+        -------
+        int
+            The number of bytes.
+        """
+        return sum(array.nbytes for array in self._arrays.values())
+
+
+SHARED_WEIGHTS = SharedWeights()
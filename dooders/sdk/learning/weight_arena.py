@@ -0,0 +1,250 @@
+"""
+Weight Arena
+------------
+Contiguous storage for the parameters of every agent's internal models.
+
+Each network owns a handful of small weight and bias arrays, scattered
+across the heap. The WeightArena keeps one large buffer per layer shape
+instead, with one slot per layer, and every attached Layer_Dense holds
+views into its slot. Training updates the parameters in place, so the
+buffers always hold the current weights of the whole population and bulk
+operations (batched forward passes, exports) can read them directly.
+
+Slots of released layers are reused by the next layers attached.
+"""
+
+from typing import TYPE_CHECKING, Dict, List, Tuple
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from dooders.sdk.learning.scratch.layer import Layer_Dense
+
+
+class WeightArena:
+    """
+    One contiguous buffer per layer shape, shared by many layers.
+
+    Parameters
+    ----------
+    capacity : int
+        The initial number of slots per layer shape. A buffer doubles in
+        size when it is full.
+
+    Attributes
+    ----------
+    slots : dict
+        The (shape key, slot index) of every attached layer.
+    groups : dict
+        The buffers for every layer shape: 'weights' and 'biases' with one
+        slot per layer, the attached 'layers' by slot, the number of slots
+        handed out ('size') and the released slots ('free').
+
+    Methods
+    -------
+    attach(layers: List[Layer_Dense]) -> None
+        Move the parameters of the layers into the arena.
+    release(layers: List[Layer_Dense]) -> None
+        Give the layers private copies of their parameters and free their slots.
+    store(layer: Layer_Dense, weights: np.ndarray, biases: np.ndarray) -> None
+        Overwrite the parameters of an attached layer.
+    gather(layers: List[Layer_Dense]) -> Tuple[np.ndarray, np.ndarray]
+        The stacked parameters of layers with the same shape.
+    export(key: tuple) -> Dict[str, np.ndarray]
+        The parameters held for one layer shape.
+    """
+
+    def __init__(self, capacity: int = 64) -> None:
+        self.capacity = capacity
+        self.slots = {}
+        self.groups = {}
+
+    @staticmethod
+    def key(layer: "Layer_Dense") -> tuple:
+        """
+        The buffer a layer belongs to.
+
+        Parameters
+        ----------
+        layer : Layer_Dense
+            The layer.
+
+        Returns
+        -------
+        tuple
+            The weight shape, bias shape and data type of the layer.
+        """
+        return layer.weights.shape, layer.biases.shape, layer.weights.dtype.str
+
+    def _allocate(self, key: tuple) -> int:
+        """
+        Hand out a slot for a layer shape, growing its buffers if needed.
+
+        Parameters
+        ----------
+        key : tuple
+            The shape key, see key.
+
+        Returns
+        -------
+        int
+            The slot index.
+        """
+        weight_shape, bias_shape, dtype = key
+
+        if key not in self.groups:
+            self.groups[key] = {
+                "weights": np.zeros((self.capacity,) + weight_shape, dtype=dtype),
+                "biases": np.zeros((self.capacity,) + bias_shape, dtype=dtype),
+                "layers": {},
+                "size": 0,
+                "free": [],
+            }
+
+        group = self.groups[key]
+
+        if group["free"]:
+            return group["free"].pop()
+
+        index = group["size"]
+        group["size"] += 1
+
+        # Double the buffers when full, and point every attached layer
+        # at its slot in the new buffers
+        if index >= len(group["weights"]):
+            for name in ("weights", "biases"):
+                group[name] = np.concatenate(
+                    (group[name], np.zeros_like(group[name]))
+                )
+            for slot, layer in group["layers"].items():
+                layer.weights = group["weights"][slot]
+                layer.biases = group["biases"][slot]
+
+        return index
+
+    def attach(self, layers: List["Layer_Dense"]) -> None:
+        """
+        Move the parameters of the layers into the arena.
+
+        Parameters
+        ----------
+        layers : List[Layer_Dense]
+            The layers to attach. Layers already attached are skipped.
+        """
+        for layer in layers:
+            if layer in self.slots:
+                continue
+
+            key = self.key(layer)
+            index = self._allocate(key)
+            group = self.groups[key]
+
+            group["weights"][index] = layer.weights
+            group["biases"][index] = layer.biases
+            layer.weights = group["weights"][index]
+            layer.biases = group["biases"][index]
+
+            group["layers"][index] = layer
+            self.slots[layer] = (key, index)
+
+    def release(self, layers: List["Layer_Dense"]) -> None:
+        """
+        Give the layers private copies of their parameters and free
+        their slots.
+
+        Parameters
+        ----------
+        layers : List[Layer_Dense]
+            The layers to release. Layers not attached are skipped.
+        """
+        for layer in layers:
+            if layer not in self.slots:
+                continue
+
+            key, index = self.slots.pop(layer)
+            group = self.groups[key]
+
+            layer.weights = layer.weights.copy()
+            layer.biases = layer.biases.copy()
+
+            del group["layers"][index]
+            group["free"].append(index)
+
+    def store(
+        self,
+        layer: "Layer_Dense",
+        weights: np.ndarray = None,
+        biases: np.ndarray = None,
+    ) -> None:
+        """
+        Overwrite the parameters of an attached layer, in its slot.
+
+        Parameters
+        ----------
+        layer : Layer_Dense
+            The attached layer.
+        weights : np.ndarray, optional
+            The new weights.
+        biases : np.ndarray, optional
+            The new biases.
+        """
+        if weights is not None:
+            layer.weights[...] = weights
+        if biases is not None:
+            layer.biases[...] = biases
+
+    def gather(self, layers: List["Layer_Dense"]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        The stacked parameters of attached layers with the same shape.
+
+        When the layers occupy consecutive slots the result is a view of
+        the buffers, otherwise one gather per buffer.
+
+        Parameters
+        ----------
+        layers : List[Layer_Dense]
+            The layers, all attached and with the same shape.
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray]
+            The weights, shape (N, n_inputs, n_neurons),
+            and biases, shape (N, 1, n_neurons).
+        """
+        key = self.slots[layers[0]][0]
+        group = self.groups[key]
+        index = np.array([self.slots[layer][1] for layer in layers])
+
+        if len(index) and np.all(np.diff(index) == 1):
+            index = slice(index[0], index[-1] + 1)
+
+        return group["weights"][index], group["biases"][index]
+
+    def export(self, key: tuple) -> Dict[str, np.ndarray]:
+        """
+        The parameters held for one layer shape.
+
+        Parameters
+        ----------
+        key : tuple
+            The shape key, see key.
+
+        Returns
+        -------
+        Dict[str, np.ndarray]
+            The 'weights' and 'biases' of the slots handed out, and the
+            'active' mask of the slots attached to a layer.
+        """
+        group = self.groups[key]
+        size = group["size"]
+        active = np.zeros(size, dtype=bool)
+        active[list(group["layers"])] = True
+
+        return {
+            "weights": group["weights"][:size],
+            "biases": group["biases"][:size],
+            "active": active,
+        }
+
+    def __contains__(self, layer: "Layer_Dense") -> bool:
+        return layer in self.slots
@@ -0,0 +1,130 @@
+"""
+Learning Pool
+-------------
+Runs the learning updates of internal models on background threads.
+
+In Dooder.think every prediction is followed by a backward pass and an
+optimizer update. With a LearningPool, learn only hands the update to a
+worker thread and returns, so the backward passes (whose NumPy kernels
+release the GIL) overlap with the rest of the simulation step.
+
+Two rules keep the results identical to serial learning:
+
+* A model waits for its own pending update before it predicts again.
+* Arena.apply_learning waits for every pending update (the barrier)
+  before the population optimizer steps, so a cycle ends in the same
+  state whatever order the workers finished in.
+"""
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict
+
+if TYPE_CHECKING:
+    from dooders.sdk.learning.scratch.model import SimpleNeuralNet
+
+
+class LearningPool:
+    """
+    Thread pool for the learning updates of internal models.
+
+    Parameters
+    ----------
+    workers : int, optional
+        The number of worker threads. Defaults to the ThreadPoolExecutor
+        default for the machine.
+
+    Attributes
+    ----------
+    executor : ThreadPoolExecutor
+        The worker threads.
+    lock : threading.Lock
+        Held while an update is queued in a population optimizer, which
+        is shared by the models of every worker.
+    pending : Dict[SimpleNeuralNet, Future]
+        The update in flight for every model.
+
+    Methods
+    -------
+    submit(model: SimpleNeuralNet, reality: list) -> None
+        Learn from the reality on a worker thread.
+    wait(model: SimpleNeuralNet) -> None
+        Wait for the pending update of a model.
+    barrier() -> None
+        Wait for every pending update.
+    shutdown() -> None
+        Wait for every pending update and stop the workers.
+    """
+
+    def __init__(self, workers: int = None) -> None:
+        self.executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="learning"
+        )
+        self.lock = threading.Lock()
+        self.pending: Dict["SimpleNeuralNet", Future] = {}
+
+    def submit(self, model: "SimpleNeuralNet", reality: list) -> None:
+        """
+        Learn from the reality on a worker thread.
+
+        If the model still has an update queued in its population optimizer,
+        that update is applied first, with no other update in flight, so
+        its gradients are never overwritten before they are used.
+
+        Parameters
+        ----------
+        model : SimpleNeuralNet
+            The model that made the last prediction.
+        reality : list
+            The reality (truth) to learn from.
+        """
+        self.wait(model)
+
+        optimizer = model.population_optimizer
+        if optimizer is not None and any(
+            layer in optimizer.pending for layer in model.model.trainable_layers
+        ):
+            self.barrier()
+            optimizer.step()
+
+        self.pending[model] = self.executor.submit(model._learn, reality)
+
+    def wait(self, model: "SimpleNeuralNet") -> None:
+        """
+        Wait for the pending update of a model, raising its exception if
+        it failed.
+
+        Parameters
+        ----------
+        model : SimpleNeuralNet
+            The model.
+        """
+        future = self.pending.pop(model, None)
+
+        if future is not None:
+            future.result()
+
+    def barrier(self) -> None:
+        """
+        Wait for every pending update, then raise the first exception
+        raised by an update, if any.
+        """
+        pending, self.pending = self.pending, {}
+        errors = [future.exception() for future in pending.values()]
+
+        for error in errors:
+            if error is not None:
+                raise error
+
+    def shutdown(self) -> None:
+        """
+        Wait for every pending update and stop the workers, even if an
+        update failed.
+        """
+        try:
+            self.barrier()
+        finally:
+            self.executor.shutdown()
+
+    def __len__(self) -> int:
+        return len(self.pending)
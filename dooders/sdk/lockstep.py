@@ -0,0 +1,835 @@
+"""
+Lockstep Simulation
+-------------------
+Advances many small, independent simulations together.
+
+Recursive artificial selection runs thousands of 5x5 simulations with a
+single seed Dooder, and each one pays for the Python objects built by
+Assemble.execute and for stepping every object on its own. The lockstep
+engine keeps the grid occupancy, the energy and the Dooder state of N
+simulations in (N, ...) arrays. It applies the rules of Simulation.step
+to all of them in the same pass: every Dooder ages, moves, consumes and
+passes its death checks. Then the energy ages, dissipates and is
+allocated again.
+
+The Dooders keep their own InternalModels. Their predictions are batched
+across the simulations with PopulationInference, and they learn through
+the same predict and learn calls as Dooder.think. So the weights a
+simulation hands to the gene pool are the weights it learned. The
+summaries and states follow Simulation.simulation_summary and
+Simulation.state, including how Information collects per-cycle data.
+The rules are written for the default surface, policies, conditions and
+step flow, any other registered component raises a ValueError.
+
+Random draws come from one numpy Generator, so a lockstep run is
+reproducible for its seed. It does not reproduce the draws of an object
+simulation.
+"""
+
+from datetime import datetime
+from typing import Callable, Dict, Iterator, List, NamedTuple
+
+import numpy as np
+
+from dooders.sdk.actions.consume import consume
+from dooders.sdk.actions.move import move
+from dooders.sdk.conditions.death import DeathConditions
+from dooders.sdk.conditions.stop import StopConditions
+from dooders.sdk.config import Config
+from dooders.sdk.core.core import Core
+from dooders.sdk.core.settings import Settings
+from dooders.sdk.core.surface import Surface
+from dooders.sdk.learning.batch import PopulationInference
+from dooders.sdk.learning.scratch.optimizer import Optimizer_Adam_Population
+from dooders.sdk.models.dooder import ACTIVE_MODELS, MODEL_SETTINGS, Dooder
+from dooders.sdk.models.senses import Senses
+from dooders.sdk.modules.internal_models import InternalModels
+from dooders.sdk.steps.dooder import BasicStep
+from dooders.sdk.utils.short_id import seed
+
+# Hunger at which DeathConditions.starvation terminates a Dooder
+STARVATION_HUNGER = 5
+
+# Registered components the lockstep rules are written for, by component
+# type and module
+LOCKSTEP_COMPONENTS = {
+    ("condition", "death"): {"DeathConditions": DeathConditions},
+    ("condition", "stop"): {"StopConditions": StopConditions},
+    ("step", "dooder"): {"BasicStep": BasicStep},
+    ("action", "move"): {"move": move},
+    ("action", "consume"): {"consume": consume},
+}
+
+# Checks of DeathConditions the lockstep rules are written for
+LOCKSTEP_DEATH_CHECKS = ["starvation"]
+
+# Policy and surface variables the lockstep rules are written for
+LOCKSTEP_VARIABLES = {
+    "SurfaceType": "grid",
+    "Movement": "NeuralNetwork",
+    "Reproduction": "AverageWeights",
+}
+
+# Information clears its data after collecting every CLEAR_INTERVAL cycles
+CLEAR_INTERVAL = 1000
+
+ARENA_COLUMNS = [
+    "active_dooder_count",
+    "terminated_dooder_count",
+    "created_dooder_count",
+    "average_dooder_hunger",
+    "median_dooder_age",
+    "average_dooder_age",
+    "average_energy_consumed",
+]
+
+RESOURCES_COLUMNS = [
+    "available_energy",
+    "allocated_energy",
+    "consumed_energy",
+    "average_energy_age",
+]
+
+# Columns Arena.collect and Resources.collect round to 3 decimals
+ROUNDED_COLUMNS = {
+    "average_dooder_hunger",
+    "average_dooder_age",
+    "average_energy_consumed",
+    "average_energy_age",
+}
+
+
+def draw(setting, rng: np.random.Generator, size) -> np.ndarray:
+    """
+    Vectorized draw of a generation strategy.
+
+    Parameters
+    ----------
+    setting : Setting
+        A variable setting, with the name of its strategy function and args.
+    rng : np.random.Generator
+        The random generator to draw with.
+    size : int or tuple
+        The shape of the draw.
+
+    Returns
+    -------
+    np.ndarray
+        The values, drawn like the strategy draws one value.
+    """
+    args = setting.args
+
+    if setting.function == "fixed_value":
+        return np.full(size, args["value"])
+    elif setting.function == "uniform_distribution":
+        return rng.integers(args["min"], args["max"], size)
+    elif setting.function == "normal_distribution":
+        mean = (args["max"] + args["min"]) / 2
+        variation = args.get("variation")
+        if variation is None:
+            variation = (args["max"] - args["min"]) / 8
+        return rng.normal(mean, variation, size)
+
+    raise ValueError(f"Strategy {setting.function} can not be drawn in lockstep")
+
+
+def check_rules(variables: Dict[str, dict]) -> None:
+    """
+    Check that a simulation runs the rules the lockstep engine is written
+    for: the default surface and policies, the DeathConditions and
+    StopConditions checks, and the move and consume actions of BasicStep.
+
+    Parameters
+    ----------
+    variables : dict
+        The compiled variables, by model.
+
+    Raises
+    ------
+    ValueError
+        If a component, condition, policy or surface is not the default.
+    """
+    for (component, module), expected in LOCKSTEP_COMPONENTS.items():
+        registered = {
+            name: registered.function
+            for name, registered in Core.get_components(component).get(module, {}).items()
+        }
+        if registered != expected:
+            raise ValueError(
+                f"Lockstep only runs the default {component} {module}, "
+                f"found {sorted(registered)}"
+            )
+
+    checks = [name for name in dir(DeathConditions) if not name.startswith("_")]
+    if checks != LOCKSTEP_DEATH_CHECKS:
+        raise ValueError(f"Lockstep only runs the default death checks, found {checks}")
+
+    for model_variables in variables.values():
+        for name, default in LOCKSTEP_VARIABLES.items():
+            if name in model_variables:
+                value = model_variables[name].args["value"]
+                if value != default:
+                    raise ValueError(f"Lockstep only runs {name} {default}, found {value}")
+
+
+class LockstepDooder(NamedTuple):
+    """
+    The identity and internal models of a Dooder in a lockstep simulation.
+    """
+
+    id: str
+    internal_models: InternalModels
+
+
+class LockstepView:
+    """
+    One simulation of a LockstepSimulation, with the attributes custom
+    logic uses on a Simulation (simulation.arena.dooders()).
+
+    Parameters
+    ----------
+    engine : LockstepSimulation
+        The lockstep simulation.
+    index : int
+        The index of the simulation.
+    """
+
+    def __init__(self, engine: "LockstepSimulation", index: int) -> None:
+        self.engine = engine
+        self.index = index
+        self.simulation_id = engine.simulation_ids[index]
+        self.arena = self
+
+    def dooders(self) -> Iterator[LockstepDooder]:
+        """
+        Yields the active Dooders of the simulation.
+        """
+        yield from self.engine.dooders(self.index)
+
+    @property
+    def rng(self) -> np.random.Generator:
+        """
+        The random generator of the lockstep simulation, shared by every view
+        so draws stay in simulation order.
+        """
+        return self.engine.rng
+
+
+class LockstepSimulation:
+    """
+    Runs N independent simulations in lockstep.
+
+    The BatchInference, PopulationOptimizer, InferenceOnly and
+    ReplayLearning settings apply as in Simulation. The other learning
+    settings are ignored.
+
+    Parameters
+    ----------
+    count : int
+        The number of simulations.
+    settings : dict
+        Included settings to override defaults, see Config.
+    rng : np.random.Generator, optional
+        The random generator of every draw. A fresh one if None.
+
+    Attributes
+    ----------
+    settings : Config
+        The simulation settings.
+    variables : dict
+        The strategy settings of the arena and the resources.
+    neighbourhood : np.ndarray, shape (cells, 9)
+        The flat indices of every cell's perception, in nearby_spaces order.
+    running : np.ndarray, shape (N,)
+        Whether each simulation is still running.
+    cycle_number : np.ndarray, shape (N,)
+        The cycle count of each simulation.
+    position, age, hunger, energy_consumed, move_count : np.ndarray, shape (N, A)
+        The state of every Dooder, A being the seed count.
+    alive : np.ndarray, shape (N, A)
+        Whether each Dooder is active.
+    energy_cell, energy_age, energy_order : np.ndarray, shape (N, K)
+        The cell, age and placement order of every energy slot,
+        energy_cell is -1 for an empty slot.
+
+    Methods
+    -------
+    setup() -> None
+        Allocate the starting energy and place the seed Dooders.
+    step() -> None
+        Advance every running simulation by one cycle.
+    run(callback: Callable = None) -> None
+        Step until every simulation has stopped.
+    dooders(index: int) -> Iterator[LockstepDooder]
+        The active Dooders of a simulation.
+    results() -> List[dict]
+        The summary and state of every simulation.
+
+    Properties
+    ----------
+    simulations : List[LockstepView]
+        A view of every simulation, for custom logic.
+    """
+
+    def __init__(
+        self, count: int, settings: dict = {}, rng: np.random.Generator = None
+    ) -> None:
+        self.count = count
+        self.settings = Config(settings)
+        self.rng = np.random.default_rng() if rng is None else rng
+
+        variables = Settings.compile()["variables"]
+        check_rules(variables)
+        self.variables = {**variables["resources"], **variables["arena"], **variables["energy"]}
+        self.surface = Surface.build(variables["environment"]["SurfaceType"].args["value"])
+        self.neighbourhood = np.asarray(
+            self.surface.neighbourhood(moore=True, include_center=True, radius=1)
+        )
+        self.cells = self.surface.width * self.surface.height
+
+        self.simulation_ids = [seed.uuid() for _ in range(count)]
+        self.running = np.zeros(count, dtype=bool)
+        self.cycle_number = np.zeros(count, dtype=np.int64)
+        self.starting_time = None
+        self.ending_time = [None] * count
+
+        self.max_cycles = self.settings.get("MaxCycles")
+        self.arena_data = {
+            name: np.zeros((count, self.max_cycles)) for name in ARENA_COLUMNS
+        }
+        self.resources_data = {
+            name: np.zeros((count, self.max_cycles)) for name in RESOURCES_COLUMNS
+        }
+
+        if self.settings.get("PopulationOptimizer") and not self.settings.get(
+            "InferenceOnly"
+        ):
+            self.optimizer = Optimizer_Adam_Population(decay=5e-7)
+        else:
+            self.optimizer = None
+
+    def setup(self) -> None:
+        """
+        Allocate the starting energy and place the seed Dooders, like
+        Simulation.setup.
+        """
+        n = self.count
+        self.energy_cell = np.full((n, 0), -1, dtype=np.int64)
+        self.energy_age = np.zeros((n, 0), dtype=np.int64)
+        self.energy_order = np.zeros((n, 0), dtype=np.int64)
+        self.placed = 0
+        self.allocated = np.zeros(n, dtype=np.int64)
+        self.consumed = np.zeros(n, dtype=np.int64)
+        self.allocate_resources(np.arange(n))
+
+        agents = int(draw(self.variables["SeedCount"], self.rng, 1)[0])
+        self.position = self.rng.integers(0, self.cells, (n, agents))
+        self.alive = np.ones((n, agents), dtype=bool)
+        self.age = np.zeros((n, agents), dtype=np.int64)
+        self.hunger = np.zeros((n, agents), dtype=np.int64)
+        self.energy_consumed = np.zeros((n, agents), dtype=np.int64)
+        self.move_count = np.zeros((n, agents), dtype=np.int64)
+        self.terminated = np.full((n, agents), -1, dtype=np.int64)
+        self.died = np.zeros(n, dtype=np.int64)
+        self.created = np.full(n, agents, dtype=np.int64)
+
+        self.ids = [[seed.id() for _ in range(agents)] for _ in range(n)]
+        self.models = [
+            [
+                InternalModels(id, MODEL_SETTINGS, active=ACTIVE_MODELS, rng=self.rng)
+                for id in ids
+            ]
+            for ids in self.ids
+        ]
+        self.inference_records = [[{} for _ in range(agents)] for _ in range(n)]
+        self.graveyard = [{} for _ in range(n)]
+
+        for models in self._all_models():
+            if self.settings.get("InferenceOnly"):
+                models.set_inference_only(True)
+            elif self.optimizer is not None:
+                models.share_optimizer(self.optimizer)
+            if self.settings.get("ReplayLearning"):
+                models.use_replay(self.settings.get("ReplayCapacity"))
+
+        self.running[:] = True
+
+    def _all_models(self) -> Iterator[InternalModels]:
+        for models in self.models:
+            yield from models
+
+    @property
+    def simulations(self) -> List[LockstepView]:
+        """
+        A view of every simulation, for custom logic.
+        """
+        return [LockstepView(self, index) for index in range(self.count)]
+
+    def dooders(self, index: int) -> Iterator[LockstepDooder]:
+        """
+        The active Dooders of a simulation.
+
+        Parameters
+        ----------
+        index : int
+            The index of the simulation.
+
+        Yields
+        ------
+        LockstepDooder
+            The id and internal models of every active Dooder.
+        """
+        for agent in np.flatnonzero(self.alive[index]):
+            yield LockstepDooder(self.ids[index][agent], self.models[index][agent])
+
+    def stop_conditions(self) -> None:
+        """
+        Stop every simulation that reached MaxCycles or has no Dooders left.
+        """
+        stopped = self.running & (
+            (self.cycle_number >= self.max_cycles) | ~self.alive.any(axis=1)
+        )
+
+        for index in np.flatnonzero(stopped):
+            self.ending_time[index] = datetime.now()
+        self.running &= ~stopped
+
+    def run(self, callback: Callable = None) -> None:
+        """
+        Step until every simulation has stopped.
+
+        Parameters
+        ----------
+        callback : Callable, optional
+            Called with the number of simulations that stopped after
+            every cycle.
+        """
+        self.starting_time = datetime.now()
+        self.stop_conditions()
+
+        while self.running.any():
+            running = self.running.sum()
+            self.step()
+            self.stop_conditions()
+            if callback is not None:
+                callback(int(running - self.running.sum()))
+
+    def step(self) -> None:
+        """
+        Advance every running simulation by one cycle.
+
+        1. Step every Dooder, in a shuffled order in each simulation
+        2. Apply the learning from the cycle
+        3. Collect data at the end of the cycle
+        4. Age, dissipate and place energy
+        5. Increment cycle counter
+        """
+        sims = np.flatnonzero(self.running)
+        order = np.argsort(self.rng.random(self.alive.shape), axis=1)
+
+        for rank in range(self.alive.shape[1]):
+            agents = order[sims, rank]
+            active = self.alive[sims, agents]
+            self.step_dooders(sims[active], agents[active])
+
+        self.apply_learning()
+        self.collect(sims)
+        self.step_resources(sims)
+        self.died[sims] = 0
+        self.created[sims] = 0
+        self.cycle_number[sims] += 1
+
+    def step_dooders(self, sims: np.ndarray, agents: np.ndarray) -> None:
+        """
+        Step one Dooder in each of the given simulations, like Dooder.step
+        with the BasicStep flow.
+
+        Parameters
+        ----------
+        sims : np.ndarray
+            The simulation of every Dooder.
+        agents : np.ndarray
+            The index of every Dooder in its simulation.
+        """
+        self.age[sims, agents] += 1
+        sims, agents = self.death_check(sims, agents)
+
+        if sims.size:
+            self.move(sims, agents)
+            self.consume(sims, agents)
+            self.death_check(sims, agents)
+
+    def death_check(self, sims: np.ndarray, agents: np.ndarray) -> tuple:
+        """
+        Terminate the starved Dooders.
+
+        Returns
+        -------
+        tuple
+            The simulations and indices of the surviving Dooders.
+        """
+        starved = self.hunger[sims, agents] >= STARVATION_HUNGER
+
+        for index, agent in zip(sims[starved], agents[starved]):
+            self.terminate_dooder(index, agent)
+
+        return sims[~starved], agents[~starved]
+
+    def terminate_dooder(self, index: int, agent: int) -> None:
+        """
+        Terminate a Dooder, like Arena.terminate_dooder and Dooder.die.
+        """
+        self.alive[index, agent] = False
+        self.terminated[index, agent] = self.cycle_number[index]
+        self.died[index] += 1
+
+        if self.optimizer is not None:
+            self.models[index][agent].share_optimizer(None)
+
+        self.graveyard[index][self.ids[index][agent]] = self.dooder_state(index, agent)
+
+    def layer(self, object_type: str) -> np.ndarray:
+        """
+        The count of an object type in every cell of every simulation.
+
+        Parameters
+        ----------
+        object_type : str
+            'Energy' or 'Dooder'.
+
+        Returns
+        -------
+        np.ndarray, shape (N, cells)
+            The counts.
+        """
+        if object_type == "Energy":
+            cells, placed = self.energy_cell, self.energy_cell >= 0
+        elif object_type == "Dooder":
+            cells, placed = self.position, self.alive
+        else:
+            raise ValueError(f"Object type {object_type} is not simulated in lockstep")
+
+        flat = (np.arange(self.count)[:, np.newaxis] * self.cells + cells)[placed]
+
+        return np.bincount(flat, minlength=self.count * self.cells).reshape(
+            self.count, self.cells
+        )
+
+    def perceive(
+        self, sims: np.ndarray, agents: np.ndarray, object_type: str
+    ) -> np.ndarray:
+        """
+        The perception arrays of Dooders, like Perception.array.
+
+        Returns
+        -------
+        np.ndarray, shape (len(sims), 9), uint8
+            One perception array per Dooder.
+        """
+        cells = self.position[sims, agents]
+        nearby = self.neighbourhood[cells]
+        counts = self.layer(object_type)[sims[:, np.newaxis], nearby]
+
+        if object_type == "Dooder":
+            # A Dooder does not perceive itself
+            counts = counts - (nearby == cells[:, np.newaxis])
+
+        return (counts > 0).astype("uint8")
+
+    def think(
+        self,
+        index: int,
+        agent: int,
+        model_name: str,
+        input_array: np.ndarray,
+        reality_array: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Predict and learn with an internal model, like Dooder.think.
+        """
+        model = self.models[index][agent][model_name]
+        output_array = model.predict(input_array)
+
+        if not model.inference_only:
+            model.learn(reality_array)
+
+        return output_array
+
+    def move(self, sims: np.ndarray, agents: np.ndarray) -> None:
+        """
+        Move Dooders to the cell their move_decision model chooses,
+        like the move action.
+        """
+        reality = self.perceive(sims, agents, "Energy")
+        perceptions = {
+            name: self.perceive(sims, agents, object_type)
+            for name, object_type in Senses.SENSE_TYPES.items()
+        }
+
+        if self.settings.get("BatchInference"):
+            self.prime(sims, agents, perceptions)
+
+        choices = np.empty(len(sims), dtype=np.int64)
+        for i, (index, agent) in enumerate(zip(sims, agents)):
+            sensory_array = [
+                self.think(index, agent, name, perception[i : i + 1], perception[i : i + 1])
+                for name, perception in perceptions.items()
+            ]
+            combined_array = np.concatenate([arr.squeeze() for arr in sensory_array])
+            fixed_array = (np.array([combined_array], dtype="float32") >= 0.5).astype(
+                "uint8"
+            )
+            reality_array = reality[i : i + 1]
+            destination = self.think(
+                index, agent, "move_decision", fixed_array, reality_array
+            )
+            choices[i] = destination.argmax()
+
+            # Only the last record of a cycle is kept by Dooder.think
+            x, y = divmod(int(self.position[index, agent]), self.surface.height)
+            self.inference_records[index][agent][int(self.cycle_number[index])] = {
+                "model_name": "move_decision",
+                "hunger": int(self.hunger[index, agent]),
+                "position": str((x, y)),
+                "perception": [str(x) for x in fixed_array[0]],
+                "output": str(destination),
+                "reality": [str(choice) for choice in reality_array],
+                "inferred_goal": None,
+                "accurate": Dooder.check_accuracy(None, destination, reality_array),
+            }
+
+        cells = self.position[sims, agents]
+        destinations = self.neighbourhood[cells, choices]
+        self.move_count[sims, agents] += destinations != cells
+        self.position[sims, agents] = destinations
+
+    def prime(
+        self, sims: np.ndarray, agents: np.ndarray, perceptions: Dict[str, np.ndarray]
+    ) -> None:
+        """
+        Evaluate the models of every built Dooder in one batched pass,
+        like Arena.prime_internal_models.
+        """
+        built = [
+            i
+            for i, (index, agent) in enumerate(zip(sims, agents))
+            if all(model.built for model in self.models[index][agent].values())
+        ]
+
+        if built:
+            PopulationInference(
+                [self.models[sims[i]][agents[i]] for i in built], list(perceptions)
+            ).prime({name: perception[built] for name, perception in perceptions.items()})
+
+    def consume(self, sims: np.ndarray, agents: np.ndarray) -> None:
+        """
+        Consume the first energy placed in the cell of every Dooder,
+        like the consume action.
+        """
+        cells = self.position[sims, agents]
+        in_cell = self.energy_cell[sims] == cells[:, np.newaxis]
+        found = in_cell.any(axis=1)
+        first = np.where(in_cell, self.energy_order[sims], np.iinfo(np.int64).max).argmin(
+            axis=1
+        )
+
+        self.energy_cell[sims[found], first[found]] = -1
+        self.consumed[sims] += found
+        self.hunger[sims, agents] = np.where(found, 0, self.hunger[sims, agents] + 1)
+        self.energy_consumed[sims, agents] += found
+
+    def apply_learning(self) -> None:
+        """
+        Apply the learning queued during the cycle, like Arena.apply_learning.
+        """
+        if self.settings.get("ReplayLearning"):
+            interval = self.settings.get("ReplayInterval")
+            batch_size = self.settings.get("ReplayBatchSize")
+            for index in np.flatnonzero(self.running):
+                if (self.cycle_number[index] + 1) % interval == 0:
+                    for dooder in self.dooders(index):
+                        dooder.internal_models.train_replay(batch_size, self.rng)
+
+        if self.optimizer is not None:
+            self.optimizer.step()
+
+    def collect(self, sims: np.ndarray) -> None:
+        """
+        Record the Arena.collect and Resources.collect data of the cycle.
+        """
+        cycles = self.cycle_number[sims]
+        alive = self.alive[sims]
+        count = alive.sum(axis=1)
+        some = count > 0
+        divisor = np.maximum(count, 1)
+
+        arena = {
+            "active_dooder_count": count,
+            "terminated_dooder_count": self.died[sims],
+            "created_dooder_count": self.created[sims],
+            "average_dooder_hunger": (self.hunger[sims] * alive).sum(axis=1) / divisor,
+            "average_dooder_age": (self.age[sims] * alive).sum(axis=1) / divisor,
+            "average_energy_consumed": (self.energy_consumed[sims] * alive).sum(axis=1)
+            / divisor,
+            "median_dooder_age": np.zeros(len(sims)),
+        }
+        if some.any():
+            ages = np.where(alive[some], self.age[sims[some]], np.nan)
+            arena["median_dooder_age"][some] = np.nanmedian(ages, axis=1)
+
+        placed = self.energy_cell[sims] >= 0
+        available = placed.sum(axis=1)
+        resources = {
+            "available_energy": available,
+            "allocated_energy": self.allocated[sims],
+            "consumed_energy": self.consumed[sims],
+            "average_energy_age": (self.energy_age[sims] * placed).sum(axis=1)
+            / np.maximum(available, 1),
+        }
+
+        for data, values in ((self.arena_data, arena), (self.resources_data, resources)):
+            for name, column in values.items():
+                data[name][sims, cycles] = column
+
+    def step_resources(self, sims: np.ndarray) -> None:
+        """
+        Age and dissipate the energy, then allocate new energy,
+        like Resources.step.
+        """
+        placed = self.energy_cell[sims] >= 0
+        self.energy_age[sims] += placed
+        lifespan = draw(self.variables["EnergyLifespan"], self.rng, placed.shape)
+        dissipated = placed & (self.energy_age[sims] >= lifespan)
+        self.energy_cell[sims] = np.where(dissipated, -1, self.energy_cell[sims])
+
+        self.allocated[sims] = 0
+        self.consumed[sims] = 0
+        self.allocate_resources(sims)
+
+    def allocate_resources(self, sims: np.ndarray) -> None:
+        """
+        Place new energy at random cells while the total stays under a
+        MaxTotalEnergy draw, like Resources.allocate_resources.
+        """
+        energy_count = draw(self.variables["EnergyPerCycle"], self.rng, len(sims))
+        slots = int(energy_count.max(initial=0))
+        locations = self.rng.integers(0, self.cells, (len(sims), slots))
+
+        for slot in range(slots):
+            available = (self.energy_cell[sims] >= 0).sum(axis=1)
+            max_total = draw(self.variables["MaxTotalEnergy"], self.rng, len(sims))
+            place = (slot < energy_count) & (available < max_total)
+            self.place_energy(sims[place], locations[place, slot])
+
+    def place_energy(self, sims: np.ndarray, cells: np.ndarray) -> None:
+        """
+        Place one new energy in the given cell of every given simulation.
+        """
+        if not sims.size:
+            return
+
+        free = self.energy_cell[sims] < 0
+        if not free.any(axis=1).all():
+            # Grow every simulation by one slot
+            n = self.count
+            self.energy_cell = np.hstack([self.energy_cell, np.full((n, 1), -1)])
+            self.energy_age = np.hstack([self.energy_age, np.zeros((n, 1), np.int64)])
+            self.energy_order = np.hstack([self.energy_order, np.zeros((n, 1), np.int64)])
+            free = self.energy_cell[sims] < 0
+
+        slot = free.argmax(axis=1)
+        self.energy_cell[sims, slot] = cells
+        self.energy_age[sims, slot] = 0
+        self.energy_order[sims, slot] = self.placed + np.arange(len(sims))
+        self.placed += len(sims)
+        self.allocated[sims] += 1
+
+    def dooder_state(self, index: int, agent: int) -> dict:
+        """
+        The state of a Dooder, the keys of Dooder.state.
+        """
+        terminated = int(self.terminated[index, agent])
+
+        return {
+            "id": self.ids[index][agent],
+            "number": int(agent) + 1,
+            "age": int(self.age[index, agent]),
+            "generation": 0,
+            "created": 0,
+            "terminated": terminated if terminated >= 0 else None,
+            "position": divmod(int(self.position[index, agent]), self.surface.height),
+            "rotation": 0,
+            "status": "Alive" if self.alive[index, agent] else "Terminated",
+            "reproduction_count": 0,
+            "move_count": int(self.move_count[index, agent]),
+            "energy_consumed": int(self.energy_consumed[index, agent]),
+            "hunger": int(self.hunger[index, agent]),
+            "tag": "Seed",
+            "inference_record": self.inference_records[index][agent],
+        }
+
+    def information(self, index: int) -> dict:
+        """
+        The Information data of a simulation, only the cycles after the
+        last time Information cleared it.
+        """
+        cycles = int(self.cycle_number[index])
+        start = (cycles - 1) // CLEAR_INTERVAL * CLEAR_INTERVAL + 1 if cycles else 0
+
+        data = {}
+        for model, columns in (("arena", self.arena_data), ("resources", self.resources_data)):
+            data[model] = {}
+            for name, values in columns.items():
+                values = values[index, start:cycles].tolist()
+                if name in ROUNDED_COLUMNS:
+                    values = [round(value, 3) for value in values]
+                elif name != "median_dooder_age":
+                    values = [int(value) for value in values]
+                data[model][name] = values
+
+        return data
+
+    def results(self) -> List[dict]:
+        """
+        The summary and state of every simulation, in the format of
+        Simulation.simulation_summary and Simulation.state.
+
+        Returns
+        -------
+        List[dict]
+            A dict with the summary and state of every simulation.
+        """
+        results = []
+
+        for index in range(self.count):
+            information = self.information(index)
+            ending_time = self.ending_time[index] or datetime.now()
+            arena = {
+                **self.graveyard[index],
+                **{
+                    self.ids[index][agent]: self.dooder_state(index, agent)
+                    for agent in np.flatnonzero(self.alive[index])
+                },
+            }
+            summary = {
+                "SimulationID": self.simulation_ids[index],
+                "Timestamp": datetime.now().strftime("%Y-%m-%d, %H:%M:%S"),
+                "CycleCount": int(self.cycle_number[index]),
+                "TotalEnergy": sum(information["resources"]["allocated_energy"]),
+                "ConsumedEnergy": sum(information["resources"]["consumed_energy"]),
+                "StartingDooderCount": self.alive.shape[1],
+                "EndingDooderCount": int(self.alive[index].sum()),
+                "ElapsedSeconds": int((ending_time - self.starting_time).total_seconds()),
+            }
+            state = {
+                "simulation_id": self.simulation_ids[index],
+                "running": False,
+                "starting_time": str(self.starting_time),
+                "ending_time": str(ending_time),
+                "arena": arena,
+                "environment": self.surface.state,
+                "information": information,
+            }
+            results.append({"summary": summary, "state": state})
+
+        return results
@@ -25,18 +25,23 @@ agents and their environments.
 from typing import TYPE_CHECKING, Generator
 
 import networkx as nx
+import numpy as np
 from pydantic import BaseModel
-from sklearn.decomposition import PCA
 
+from dooders.sdk.learning.batch import PopulationInference
+from dooders.sdk.learning.cache import InferenceCache
+from dooders.sdk.learning.scratch.optimizer import Optimizer_Adam_Population
+from dooders.sdk.learning.weight_arena import WeightArena
+from dooders.sdk.learning.workers import LearningPool
 from dooders.sdk.models import Dooder
+from dooders.sdk.models.senses import Senses
+from dooders.sdk.modules.embedding import GENE_EMBEDDING
+from dooders.sdk.modules.population import PopulationStore
 
 if TYPE_CHECKING:
     from dooders.sdk.base.reality import BaseSimulation
 
 
-gene_embedding = PCA(n_components=3)
-
-
 class Attributes(BaseModel):
     dooders_created: int = 0
     dooders_died: int = 0
@@ -72,6 +77,20 @@ class Arena:
     seed : function
         The function that generates the seed population to start
         the simulation.
+    population : PopulationStore
+        Columnar state (age, hunger, position, etc.) of the active Dooders.
+    optimizer : Optimizer_Adam_Population
+        The optimizer shared by the internal models of all active Dooders,
+        None if every model uses its own optimizer or only runs inference.
+    inference_cache : InferenceCache
+        The prediction cache shared by the internal models of all active
+        Dooders, None if predictions are not cached.
+    weight_arena : WeightArena
+        The contiguous parameter buffers of the internal models of all
+        active Dooders, None if every model keeps its own arrays.
+    learning_pool : LearningPool
+        The worker threads the internal models of all active Dooders
+        learn on, None if they learn while the Dooder thinks.
 
     Methods
     -------
@@ -97,6 +116,14 @@ class Arena:
         Get all dooders in the environment
     collect_dooders() -> None
         Collect all stats from dooders
+    prime_internal_models() -> None
+        Batch the internal model inference for all active dooders
+    apply_learning() -> None
+        Apply the learning queued by the dooders during the cycle
+    start_learning() -> None
+        Start the learning pool workers, if background learning is enabled
+    stop_learning() -> None
+        Stop the learning pool workers
 
     Properties
     ----------
@@ -116,6 +143,24 @@ class Arena:
         self.graveyard = {}
         self.simulation = simulation
         self.settings = settings
+        self.population = PopulationStore()
+
+        if settings.get("PopulationOptimizer") and not settings.get("InferenceOnly"):
+            self.optimizer = Optimizer_Adam_Population(decay=5e-7)
+        else:
+            self.optimizer = None
+
+        if settings.get("InferenceCache"):
+            self.inference_cache = InferenceCache()
+        else:
+            self.inference_cache = None
+
+        if settings.get("WeightArena"):
+            self.weight_arena = WeightArena()
+        else:
+            self.weight_arena = None
+
+        self.start_learning()
 
     def _setup(self) -> None:
         self.reset()  # set attributes
@@ -156,9 +201,14 @@ class Arena:
         Dooder: dooder object
             Newly generated Dooder object
         """
-        dooder = Dooder(self.simulation.generate_id(), position, self.simulation)
+        dooder = Dooder(
+            {"position": position, "created": self.simulation.cycle_number},
+            self.simulation.rng,
+        )
+        dooder.id = self.simulation.generate_id()
+        dooder.simulation = self.simulation
         dooder.tag = tag
-        dooder.gene_embedding = gene_embedding
+        dooder.gene_embedding = GENE_EMBEDDING
 
         return dooder
 
@@ -188,9 +238,30 @@ class Arena:
         position : tuple
             position to place dooder, (x, y)
         """
+        # Models and parameter buffers are rearranged below, so no
+        # update may be in flight
+        if self.learning_pool is not None:
+            self.learning_pool.barrier()
+
+        self.population.attach(dooder)
         self.simulation.environment.place_object(dooder, position)
         self.simulation.time.add(dooder)
 
+        if self.simulation.settings.get("InferenceOnly"):
+            dooder.internal_models.set_inference_only(True)
+        elif self.optimizer is not None:
+            dooder.internal_models.share_optimizer(self.optimizer)
+        if self.inference_cache is not None:
+            dooder.internal_models.use_cache(self.inference_cache)
+        if self.weight_arena is not None:
+            dooder.internal_models.use_weight_arena(self.weight_arena)
+        if self.simulation.settings.get("ReplayLearning"):
+            dooder.internal_models.use_replay(
+                self.simulation.settings.get("ReplayCapacity")
+            )
+        if self.learning_pool is not None:
+            dooder.internal_models.use_learning_pool(self.learning_pool)
+
         self.active_dooders[dooder.id] = dooder
 
         #! TODO: Add more attributes to graph node
@@ -211,8 +282,17 @@ class Arena:
         """
         self.simulation.time.remove(dooder)
         self.simulation.environment.remove_object(dooder)
+
+        if self.learning_pool is not None:
+            self.learning_pool.barrier()
+            dooder.internal_models.use_learning_pool(None)
+        if self.optimizer is not None:
+            dooder.internal_models.share_optimizer(None)
+        if self.weight_arena is not None:
+            dooder.internal_models.use_weight_arena(None)
         self.active_dooders.pop(dooder.id)
         self.graveyard[dooder.id] = dooder.state
+        self.population.detach(dooder)
         self.dooders_died += 1
         del dooder
 
@@ -251,6 +331,89 @@ class Arena:
         for dooder in self.active_dooders.values():
             yield dooder
 
+    def prime_internal_models(self) -> None:
+        """
+        Evaluate the sense and move_decision models of every active dooder
+        in one batched pass, before the dooders take their steps.
+
+        Each model keeps the result and uses it when the dooder thinks,
+        as long as its perception has not changed since.
+        """
+        dooders = [
+            dooder
+            for dooder in self.dooders()
+            if all(model.built for model in dooder.internal_models.values())
+        ]
+
+        if not dooders:
+            return
+
+        environment = self.simulation.environment
+        positions = [dooder.position for dooder in dooders]
+        perceptions = {
+            model_name: environment.perception_batch(
+                positions, object_name, ignore=Dooder.__name__
+            )
+            for model_name, object_name in Senses.SENSE_TYPES.items()
+        }
+
+        PopulationInference(
+            [dooder.internal_models for dooder in dooders],
+            list(Senses.SENSE_TYPES),
+        ).prime(perceptions)
+
+    def apply_learning(self) -> None:
+        """
+        Apply the learning queued by the dooders during the cycle,
+        with one vectorized optimizer step for the whole population.
+
+        With background learning, every update still in flight is waited
+        for first. With replay learning, every ReplayInterval cycles each
+        dooder then trains on a mini-batch of the samples its models stored.
+        """
+        if self.learning_pool is not None:
+            self.learning_pool.barrier()
+
+        settings = self.simulation.settings
+
+        if settings.get("ReplayLearning"):
+            cycles = self.simulation.cycle_number + 1
+            if cycles % settings.get("ReplayInterval") == 0:
+                batch_size = settings.get("ReplayBatchSize")
+                for dooder in self.active_dooders.values():
+                    dooder.internal_models.train_replay(
+                        batch_size, self.simulation.rng
+                    )
+
+        if self.optimizer is not None:
+            self.optimizer.step()
+
+    def start_learning(self) -> None:
+        """
+        Start the learning pool workers, if background learning is enabled.
+        """
+        # Strategy.compile replaces self.settings with the compiled strategies
+        settings = self.simulation.settings
+
+        if settings.get("BackgroundLearning") and not settings.get("InferenceOnly"):
+            self.learning_pool = LearningPool(settings.get("LearningWorkers"))
+        else:
+            self.learning_pool = None
+
+    def stop_learning(self) -> None:
+        """
+        Wait for the updates still in flight and stop the learning pool
+        workers. The active dooders learn while they think afterwards.
+        """
+        pool, self.learning_pool = self.learning_pool, None
+
+        if pool is not None:
+            try:
+                pool.shutdown()
+            finally:
+                for dooder in self.active_dooders.values():
+                    dooder.internal_models.use_learning_pool(None)
+
     def collect(self) -> dict:
         """
         Collects the attributes of dooders for simulation statistics.
@@ -260,34 +423,22 @@ class Arena:
         dict
             A dictionary of the dooders' attributes.
         """
-        dooder_attributes = [
-            (dooder.age, dooder.hunger, dooder.energy_consumed)
-            for dooder in self.dooders()
-        ]
-        dooder_count = len(dooder_attributes)
-
-        def median(data: list) -> float:
-            data = sorted(data)
-            n = len(data)
-            mid = n // 2
-            return data[mid] if n % 2 else (data[mid - 1] + data[mid]) / 2
-
-        if dooder_count > 0:
-            ages, hunger, energy_consumed = zip(*dooder_attributes)
-        else:
-            ages, hunger, energy_consumed = [], [], []
+        ages = self.population.column("age")
+        hunger = self.population.column("hunger")
+        energy_consumed = self.population.column("energy_consumed")
+        dooder_count = len(ages)
 
         return {
             "active_dooder_count": self.active_dooder_count,
             "terminated_dooder_count": self.dooders_died,
             "created_dooder_count": self.dooders_created,
-            "average_dooder_hunger": round(sum(hunger) / dooder_count, 3)
-            if hunger
+            "average_dooder_hunger": round(float(hunger.mean()), 3)
+            if dooder_count
             else 0,
-            "median_dooder_age": median(ages) if ages else 0,
-            "average_dooder_age": round(sum(ages) / dooder_count, 3) if ages else 0,
-            "average_energy_consumed": round(sum(energy_consumed) / dooder_count, 3)
-            if energy_consumed
+            "median_dooder_age": float(np.median(ages)) if dooder_count else 0,
+            "average_dooder_age": round(float(ages.mean()), 3) if dooder_count else 0,
+            "average_energy_consumed": round(float(energy_consumed.mean()), 3)
+            if dooder_count
             else 0,
         }
 
@@ -20,6 +20,7 @@ from dooders.sdk.core.step import Step
 from dooders.sdk.models.senses import Senses
 from dooders.sdk.modules.internal_models import InternalModels
 from dooders.sdk.modules.perception import Perception
+from dooders.sdk.modules.population import StoredAttribute
 from dooders.sdk.utils.loggers import log_performance
 
 if TYPE_CHECKING:
@@ -28,6 +29,9 @@ if TYPE_CHECKING:
 
 MODEL_SETTINGS = default_settings["internal_models"]
 
+# Models used by the move action, the others are built on first use
+ACTIVE_MODELS = [*Senses.SENSE_TYPES, "move_decision"]
+
 
 GeneticCode = Dict[str, List[Any]]
 
@@ -63,6 +67,9 @@ class Dooder(Entity):
         The settings for the Dooder including position, created, age, hunger,
         generation, status, reproduction_count, move_count, energy_consumed, tag,
         encoded_weights, and inference_record.
+    rng: np.random.Generator, optional
+        The generator the initial weights of the internal models are drawn
+        from, usually the simulation's.
 
     Attributes
     ----------
@@ -79,6 +86,9 @@ class Dooder(Entity):
         The Moore neighborhood of the dooder.
     internal_models: InternalModels
         The internal models of the dooder.
+    age, hunger, energy_consumed, move_count, position, status:
+        Stored in the Arena's PopulationStore while the dooder is active,
+        and on the dooder itself otherwise.
 
     Methods
     -------
@@ -101,12 +111,36 @@ class Dooder(Entity):
         The Dooder's perception.
     """
 
-    def __init__(self, settings: dict = None) -> None:
+    age = StoredAttribute()
+    hunger = StoredAttribute()
+    energy_consumed = StoredAttribute()
+    move_count = StoredAttribute()
+    position = StoredAttribute()
+    status = StoredAttribute()
+
+    def __init__(self, settings: dict = None, rng: np.random.Generator = None) -> None:
         if settings is None:
             settings = DEFAULT_SETTINGS
+        self._store = None
+        self._slot = None
+        self._state = {
+            name: settings.get(name, DEFAULT_SETTINGS[name])
+            for name in ["hunger", "energy_consumed", "move_count", "status"]
+        }
+        self._state["position"] = tuple(settings.get("position", (0, 0)))
         super().__init__(settings)
+        self.generation = settings.get("generation", 0)
+        self.reproduction_count = settings.get("reproduction_count", 0)
+        self.tag = settings.get("tag", "Dooder")
+        self.encoded_weights = dict(settings.get("encoded_weights", {}))
+        self.inference_record = dict(settings.get("inference_record", {}))
+        self.number = 0
+        self.rotation = 0
+        self.death = None
         self.condensed_weight_list = list()
-        self.internal_models = InternalModels(self.id, MODEL_SETTINGS)
+        self.internal_models = InternalModels(
+            self.id, MODEL_SETTINGS, active=ACTIVE_MODELS, rng=rng
+        )
 
     def do(self, action: str) -> None:
         """
@@ -130,12 +164,27 @@ class Dooder(Entity):
             The reason for the death.
             For example: starvation, old age, etc.
         """
-        self.simulation.arena.terminate_dooder(self)
         self.status = "Terminated"
         self.death = self.simulation.cycle_number
+        self.simulation.arena.terminate_dooder(self)
         message = f"Died from {reason}"
         self.log(granularity=1, message=message, scope="Dooder")
 
+    def log(self, granularity: int, message: str, scope: str) -> None:
+        """
+        Log a message about the dooder to the simulation log.
+
+        Parameters
+        ----------
+        granularity: int
+            The granularity of the message.
+        message: str
+            The message to log.
+        scope: str
+            The scope of the message.
+        """
+        self.simulation.log(granularity, message, scope)
+
     def death_check(self) -> None:
         """
         Checking if the dooder should be dead,
@@ -243,7 +292,8 @@ class Dooder(Entity):
         model = self.internal_models[model_name]
         output_array = model.predict(input_array)
 
-        model.learn(reality_array)
+        if not model.inference_only:
+            model.learn(reality_array)
 
         inference_record = {
             "model_name": model_name,
@@ -262,12 +312,17 @@ class Dooder(Entity):
 
     @property
     def genetic_code_embeddings(self) -> "GeneticCode":
-        genetic_code = self.genetic_code
+        genetic_code = {
+            model: list(weights) for model, weights in self.genetic_code.items()
+        }
+
+        #! will do all layers
+        embeddings = self.gene_embedding.embed_many(
+            [weights[1] for weights in genetic_code.values()]
+        )
 
-        for model in self.internal_models.keys():
-            weights = genetic_code[model][1]  #! will do all layers
-            embedding = self.gene_embedding.fit(weights)
-            genetic_code[model][1] = embedding.singular_values_
+        for weights, embedding in zip(genetic_code.values(), embeddings):
+            weights[1] = embedding
 
         return genetic_code
 
@@ -320,6 +375,7 @@ class Dooder(Entity):
             "energy_consumed": self.energy_consumed,
             "hunger": self.hunger,
             "tag": self.tag,
+            "inference_record": self.inference_record,
         }
 
     @property
@@ -332,6 +388,7 @@ class Dooder(Entity):
         perception: list
             A list of the dooder's nearby perception locations.
         """
-        locations = self.simulation.environment.nearby_spaces((self.position))
+        environment = self.simulation.environment
+        locations = environment.nearby_spaces((self.position))
 
-        return Perception(locations, self)
+        return Perception(locations, self, environment.surface)
@@ -11,6 +11,7 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from dooders.sdk.core.data import Position, UniqueID
     from dooders.sdk.models.resources import Resources
+    from dooders.sdk.simulation import Simulation
 
 
 class Energy:
@@ -54,6 +55,8 @@ class Energy:
     ----------
     name: str
         Name of the object
+    simulation: Simulation
+        Simulation of the resources object
     """
 
     def __init__(self,
@@ -97,6 +100,16 @@ class Energy:
         self.resources.log(
             granularity=3, message=f"Energy {self.id} consumed", scope='Energy')
 
+    @property
+    def simulation(self) -> 'Simulation':
+        """ 
+        Returns
+        -------
+        simulation: Simulation
+            The simulation of the resources object
+        """
+        return self.resources.simulation
+
     @property
     def name(self) -> str:
         """ 
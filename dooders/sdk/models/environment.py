@@ -4,7 +4,9 @@ Environment Model
 Represents the "physical" environment in which the agents interact.
 """
 
-from typing import Any, List, Union
+from typing import Any, List, Sequence, Union
+
+import numpy as np
 
 from dooders.sdk.base.entity import Entity
 from dooders.sdk.core.surface import Surface
@@ -32,6 +34,8 @@ class Environment:
         Get an object by its id.
     get_random_neighbors(object: Entity, object_type: Entity = 'Entity') -> List[Entity]
         Get all objects in the perception of the given object.
+    perception_batch(positions, object_types, radius, ignore) -> np.ndarray
+        Get the perception arrays of many positions at once.
     """
 
     def __init__(self, simulation, settings: dict) -> None:
@@ -45,6 +49,7 @@ class Environment:
         torus: bool
             Whether the environment is a torus or not.
         """
+        self.simulation = simulation
         self.settings = settings
 
     def _setup(self) -> None:
@@ -142,6 +147,36 @@ class Environment:
         """
         return len(list(self.get_objects(object_type)))
 
+    def perception_batch(
+        self,
+        positions: Sequence[tuple],
+        object_types: Union[str, List[str]],
+        radius: int = 1,
+        ignore: str = None,
+    ) -> np.ndarray:
+        """
+        Get the perception arrays of many positions at once.
+
+        Parameters
+        ----------
+        positions: Sequence[tuple]
+            The positions to perceive from, in the form (x, y).
+        object_types: Union[str, List[str]]
+            The object types to check for.
+        radius: int
+            The radius of the perception.
+        ignore: str
+            The object type of the perceiving objects, left out of their
+            own position.
+
+        Returns
+        -------
+        np.ndarray
+            One uint8 perception array per position, with one value per
+            object type and nearby cell.
+        """
+        return self.surface.perception_batch(positions, object_types, radius, ignore)
+
     def coordinates(self):
         return self.surface.coordinates()
 
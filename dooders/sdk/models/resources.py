@@ -65,11 +65,10 @@ class Resources:
         Consumes the given resource.
     """
 
-    available_resources = {}
-
     def __init__(self, simulation: "Simulation", settings) -> None:
         self.simulation = simulation
         self.settings = settings
+        self.available_resources = {}
 
     def _setup(self) -> None:
         """
@@ -18,6 +18,12 @@ class Time(BaseTime):
 
     Each cycle all Dooder objects are stepped through.
 
+    Parameters
+    ----------
+    random_state : Random, optional
+        The random number generator used by the scheduler, the global
+        random module if None.
+
     Attributes
     ----------
     time : int
@@ -41,8 +47,8 @@ class Time(BaseTime):
 
     __slots__ = ["time", "_objects", "random"]
 
-    def __init__(self) -> None:
-        self.random = random
+    def __init__(self, random_state: random.Random = None) -> None:
+        self.random = random if random_state is None else random_state
         self.time = 0
         self._objects = defaultdict(dict)
 
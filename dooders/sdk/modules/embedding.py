@@ -0,0 +1,166 @@
+"""
+Gene Embedding
+--------------
+Embeds weight matrices as their leading singular values.
+
+The embedding of a weight matrix is the singular values of the matrix
+after centering its columns, which is what PCA(n_components=3).fit(weights)
+.singular_values_ gives. Fitting a PCA per matrix repeats the validation
+and bookkeeping of the estimator for every agent and layer. GeneEmbedding
+stacks every matrix of the same shape and computes their singular values
+with one batched np.linalg.svd call.
+
+Embeddings are cached by a digest of the weight values, so a genome that
+has not changed since it was last embedded, like an inherited gene pool
+or a Dooder embedded every cycle while its weights stay fixed, is never
+embedded again.
+"""
+
+import hashlib
+from collections import OrderedDict
+from typing import Dict, List
+
+import numpy as np
+
+
+class GeneEmbedding:
+    """
+    Least recently used store of weight matrix embeddings.
+
+    Parameters
+    ----------
+    n_components : int
+        The number of singular values kept for every matrix.
+    max_size : int
+        The maximum number of embeddings kept.
+
+    Attributes
+    ----------
+    entries : OrderedDict
+        The cached embeddings, most recently used last.
+    hits : int
+        The number of matrices answered by the cache.
+    misses : int
+        The number of matrices that needed a decomposition.
+
+    Methods
+    -------
+    embed(weights: np.ndarray) -> np.ndarray
+        The embedding of one weight matrix.
+    embed_many(weights: List[np.ndarray]) -> List[np.ndarray]
+        The embeddings of many weight matrices, decomposed in batches.
+    digest(weights: np.ndarray) -> bytes
+        A digest of the shape and values of a weight matrix.
+    clear() -> None
+        Drop every entry.
+    """
+
+    def __init__(self, n_components: int = 3, max_size: int = 65536) -> None:
+        self.n_components = n_components
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def embed(self, weights: np.ndarray) -> np.ndarray:
+        """
+        The embedding of one weight matrix.
+
+        Parameters
+        ----------
+        weights : np.ndarray
+            A 2-D weight matrix, one row per sample as in PCA.fit.
+
+        Returns
+        -------
+        np.ndarray
+            The leading singular values of the centered matrix.
+        """
+        return self.embed_many([weights])[0]
+
+    def embed_many(self, weights: List[np.ndarray]) -> List[np.ndarray]:
+        """
+        The embeddings of many weight matrices.
+
+        Matrices missing from the cache are grouped by shape, and every
+        group is centered and decomposed in one batched call.
+
+        Parameters
+        ----------
+        weights : List[np.ndarray]
+            2-D weight matrices, one row per sample as in PCA.fit.
+
+        Returns
+        -------
+        List[np.ndarray]
+            The embedding of every matrix, in order.
+        """
+        embeddings = [None] * len(weights)
+        keys = [self.digest(matrix) for matrix in weights]
+        groups: Dict[tuple, Dict[bytes, List[int]]] = {}
+
+        for i, (matrix, key) in enumerate(zip(weights, keys)):
+            embedding = self.entries.get(key)
+
+            if embedding is None:
+                self.misses += 1
+                # Equal matrices in one call are decomposed once
+                groups.setdefault(np.shape(matrix), {}).setdefault(key, []).append(i)
+            else:
+                self.hits += 1
+                self.entries.move_to_end(key)
+                embeddings[i] = embedding
+
+        for group in groups.values():
+            indices = [positions[0] for positions in group.values()]
+            stacked = np.stack([weights[i] for i in indices]).astype(np.float64)
+            stacked -= stacked.mean(axis=1, keepdims=True)
+            singular_values = np.linalg.svd(stacked, compute_uv=False)
+
+            for (key, positions), values in zip(group.items(), singular_values):
+                embedding = values[: self.n_components].copy()
+                # Cached embeddings are shared by every caller
+                embedding.flags.writeable = False
+                self._put(key, embedding)
+                for i in positions:
+                    embeddings[i] = embedding
+
+        return embeddings
+
+    def _put(self, key: bytes, embedding: np.ndarray) -> None:
+        self.entries[key] = embedding
+
+        if len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    @staticmethod
+    def digest(weights: np.ndarray) -> bytes:
+        """
+        A digest of the shape, data type and values of a weight matrix.
+
+        Parameters
+        ----------
+        weights : np.ndarray
+            The weight matrix.
+
+        Returns
+        -------
+        bytes
+            The digest, equal for equal matrices.
+        """
+        weights = np.ascontiguousarray(weights)
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(str((weights.shape, weights.dtype.str)).encode())
+        digest.update(weights.tobytes())
+
+        return digest.digest()
+
+    def clear(self) -> None:
+        """
+        Drop every entry.
+        """
+        self.entries.clear()
+
+
+# Global embedding service, shared so every caller reuses the cache
+GENE_EMBEDDING = GeneEmbedding(n_components=3)
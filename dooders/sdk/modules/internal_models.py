@@ -7,10 +7,21 @@ How the internal models are created at simulation start:
 ...
 """
 
+from typing import TYPE_CHECKING
+
+import numpy as np
+
 from dooders.sdk.core.default_settings import default_settings
 from dooders.sdk.core.settings import Settings
+from dooders.sdk.learning.replay import ReplayBuffer
 from dooders.sdk.learning.scratch.model import SimpleNeuralNet
 
+if TYPE_CHECKING:
+    from dooders.sdk.learning.cache import InferenceCache
+    from dooders.sdk.learning.scratch.optimizer import Optimizer_Adam_Population
+    from dooders.sdk.learning.weight_arena import WeightArena
+    from dooders.sdk.learning.workers import LearningPool
+
 DEFAULT_SETTINGS = default_settings["internal_models"]
 
 
@@ -19,20 +30,47 @@ class InternalModels(dict):
     Works like a normal dictionary but with a method to easily replace
     the weights of the internal models.
 
-    Each model is created when the class is instantiated. The models are
-    stored as a dictionary with the model name as the key.
+    The models in active are created when the class is instantiated, every
+    other declared model is only created the first time it is accessed.
+    The models are stored as a dictionary with the model name as the key,
+    so iterating only covers the models that were built.
 
     Parameters
     ----------
-    model_list : list
-        A list of model names to use as keys for the dictionary.
+    id : str
+        The id of the owner of the models.
+    model_dict : dict
+        The instructions of every declared model, by model name.
+    inference_only : bool
+        Whether the models only run inference, without learning.
+    active : list, optional
+        The models to build right away. Defaults to every declared model.
+    rng : np.random.Generator, optional
+        The generator the initial weights of every model are drawn from,
+        usually the simulation's. Defaults to the global numpy generator.
 
     Methods
     -------
-    build(model_list: list) -> None
+    build(id: str, model_list: list) -> None
         Build the internal models.
+    get(model_name: str, default: object) -> object
+        Get a model, building it if it is declared but not built yet.
     inherit_weights(weights: dict) -> None
         Take a dictionary of weights and inherit them into the internal models.
+    share_optimizer(optimizer: Optimizer_Adam_Population) -> None
+        Apply parameter updates of every model through a population optimizer.
+    use_cache(cache: InferenceCache) -> None
+        Memoize the predictions of every model in an inference cache.
+    use_weight_arena(arena: WeightArena) -> None
+        Keep the parameters of every model in a contiguous weight arena.
+    set_inference_only(inference_only: bool) -> None
+        Switch every model between learning and inference-only execution.
+    use_replay(capacity: int) -> None
+        Give every model its own replay buffer, for replay learning.
+    train_replay(batch_size: int, rng: np.random.Generator) -> None
+        Train every model on a mini-batch of its replay buffer.
+    use_learning_pool(pool: LearningPool) -> None
+        Learn on the background threads of a learning pool.
 
     Properties
     ----------
@@ -40,26 +78,104 @@ class InternalModels(dict):
         Dictionary of weights from the internal models.
     biases : dict
         Biases from the internal models.
+    inference_only : bool
+        Whether the models only run inference.
     """
 
     def __init__(
-        self, id: str, model_dict: dict = DEFAULT_SETTINGS, *args, **kwargs
+        self,
+        id: str,
+        model_dict: dict = DEFAULT_SETTINGS,
+        *args,
+        inference_only: bool = False,
+        active: list = None,
+        rng: np.random.Generator = None,
+        **kwargs,
     ) -> None:
-        self.build(id, model_dict)
+        self.id = id
+        self.instructions = dict(model_dict)
+        self.rng = rng
+        self._optimizer = None
+        self._cache = None
+        self._weight_arena = None
+        self._replay_capacity = None
+        self._learning_pool = None
+        self._inference_only = inference_only
+        self.build(id, model_dict if active is None else active)
         super(InternalModels, self).__init__(*args, **kwargs)
 
-    def build(self, id: str, model_dict: dict) -> None:
+    def build(self, id: str, model_list: list) -> None:
         """
         Build the internal models.
 
         Parameters
         ----------
+        id : str
+            The id of the owner of the models.
         model_list : list
             A list of model names to use as keys for the dictionary.
         """
-        for model_name in model_dict:
-            instructions = model_dict[model_name]
-            self[model_name] = SimpleNeuralNet(id, instructions)
+        for model_name in model_list:
+            self._build_model(model_name)
+
+    def _build_model(self, model_name: str) -> SimpleNeuralNet:
+        """
+        Build a declared model, with the optimizer, cache and execution
+        mode already applied to the other models.
+
+        Parameters
+        ----------
+        model_name : str
+            The name of the model to build.
+
+        Returns
+        -------
+        SimpleNeuralNet
+            The new model.
+        """
+        model = SimpleNeuralNet(self.id, self.instructions[model_name], self.rng)
+
+        if self._inference_only:
+            model.set_inference_only(True)
+        elif self._optimizer is not None:
+            model.share_optimizer(self._optimizer)
+        if self._cache is not None:
+            model.use_cache(self._cache)
+        if self._weight_arena is not None:
+            model.use_weight_arena(self._weight_arena)
+        if self._replay_capacity is not None:
+            model.use_replay(ReplayBuffer(self._replay_capacity))
+        if self._learning_pool is not None:
+            model.use_learning_pool(self._learning_pool)
+
+        self[model_name] = model
+
+        return model
+
+    def __missing__(self, model_name: str) -> SimpleNeuralNet:
+        """
+        Build a declared model on first access.
+        """
+        if model_name not in self.instructions:
+            raise KeyError(model_name)
+
+        return self._build_model(model_name)
+
+    def get(self, model_name: str, default: object = None) -> object:
+        """
+        Get a model, building it if it is declared but not built yet.
+
+        Parameters
+        ----------
+        model_name : str
+            The name of the model.
+        default : object
+            Returned if no such model is declared.
+        """
+        try:
+            return self[model_name]
+        except KeyError:
+            return default
 
     def inherit_weights(self, weights: dict) -> None:
         """
@@ -71,9 +187,119 @@ class InternalModels(dict):
         weights : dict
             A dictionary of weights to inherit.
         """
-        for model in self.keys():
+        for model in weights:
             self[model].inherit_weights(weights[model])
 
+    def share_optimizer(self, optimizer: "Optimizer_Adam_Population") -> None:
+        """
+        Apply parameter updates of every model through a population optimizer.
+        Pass None to release the models from the population optimizer.
+
+        Parameters
+        ----------
+        optimizer : Optimizer_Adam_Population
+            The optimizer shared by the population, or None
+        """
+        self._optimizer = optimizer
+        for model in self.keys():
+            self[model].share_optimizer(optimizer)
+
+    def set_inference_only(self, inference_only: bool = True) -> None:
+        """
+        Switch every model between learning and inference-only execution.
+
+        Parameters
+        ----------
+        inference_only : bool
+            Whether the models only run inference
+        """
+        self._inference_only = inference_only
+        for model in self.keys():
+            self[model].set_inference_only(inference_only)
+
+    @property
+    def inference_only(self) -> bool:
+        """
+        Whether the models only run inference.
+
+        Returns
+        -------
+        bool
+            True if the models were set to inference-only execution
+        """
+        return self._inference_only
+
+    def use_cache(self, cache: "InferenceCache") -> None:
+        """
+        Memoize the predictions of every model in an inference cache.
+        Pass None to stop caching.
+
+        Parameters
+        ----------
+        cache : InferenceCache
+            The cache shared by the population, or None
+        """
+        self._cache = cache
+        for model in self.keys():
+            self[model].use_cache(cache)
+
+    def use_weight_arena(self, arena: "WeightArena") -> None:
+        """
+        Keep the parameters of every model in a contiguous weight arena.
+        Pass None to move them back to private arrays.
+
+        Parameters
+        ----------
+        arena : WeightArena
+            The arena shared by the population, or None
+        """
+        self._weight_arena = arena
+        for model in self.keys():
+            self[model].use_weight_arena(arena)
+
+    def use_replay(self, capacity: int) -> None:
+        """
+        Give every model its own replay buffer, so learning only stores
+        samples until train_replay is called. Pass None to go back to
+        online learning.
+
+        Parameters
+        ----------
+        capacity : int
+            The number of samples each buffer keeps, or None
+        """
+        self._replay_capacity = capacity
+        for model in self.keys():
+            self[model].use_replay(None if capacity is None else ReplayBuffer(capacity))
+
+    def train_replay(self, batch_size: int, rng: np.random.Generator = None) -> None:
+        """
+        Train every model on a mini-batch of its replay buffer.
+
+        Parameters
+        ----------
+        batch_size : int
+            The number of samples in each mini-batch
+        rng : np.random.Generator, optional
+            The random generator to sample with
+        """
+        for model in self.keys():
+            self[model].train_replay(batch_size, rng)
+
+    def use_learning_pool(self, pool: "LearningPool") -> None:
+        """
+        Hand the learning updates of every model to a learning pool.
+        Pass None to learn in the calling thread again.
+
+        Parameters
+        ----------
+        pool : LearningPool
+            The pool shared by the population, or None
+        """
+        self._learning_pool = pool
+        for model in self.keys():
+            self[model].use_learning_pool(pool)
+
     def save(self, path: str) -> None:
         """
         Save the internal models to a directory.
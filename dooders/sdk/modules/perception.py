@@ -24,6 +24,10 @@ class Perception(list):
         A list of Space adjacent to the dooder
     dooder: Dooder
         The dooder to create the perception around
+    surface: Grid, optional
+        The surface the Spaces belong to. When it keeps occupancy layers,
+        presence checks are answered from the layers instead of the
+        contents of each Space.
 
     Methods
     -------
@@ -44,8 +48,9 @@ class Perception(list):
         A random Space in the perception
     """
 
-    def __init__(self, spaces: list, dooder: object) -> None:
+    def __init__(self, spaces: list, dooder: object, surface: object = None) -> None:
         self.dooder = dooder
+        self.surface = surface if hasattr(surface, "layer") else None
         super().__init__(spaces)
 
     def contains(self, object_type: str) -> List[bool]:
@@ -62,6 +67,12 @@ class Perception(list):
         result: list[bool]
             True if the perception contains the object type, False otherwise
         """
+        if self.surface is not None:
+            return [
+                self.surface.has(space.coordinates, object_type, ignore=self.dooder)
+                for space in self
+            ]
+
         result = []
         for space in self:
             result.append(space.has(object_type, ignore=self.dooder))
@@ -150,14 +161,18 @@ class Perception(list):
     @property
     def random(self) -> 'Space':
         """ 
-        Fetch random Space in the perception
+        Fetch random Space in the perception, drawn from the random
+        generator of the dooder's simulation
 
         Returns
         -------
         Space: Location
             A random Space in the perception
         """
-        return random.choice(self)
+        simulation = getattr(self.dooder, "simulation", None)
+        random_state = random if simulation is None else simulation.random
+
+        return random_state.choice(self)
 
 class CardinalPerception(Perception):
     pass
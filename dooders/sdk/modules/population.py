@@ -0,0 +1,236 @@
+"""
+Population Module
+-----------------
+Columnar storage for the state of every active Dooder.
+
+Instead of keeping age, hunger, position, etc. as attributes on thousands
+of Dooder objects, the Arena keeps one NumPy array per attribute, indexed
+by a dense slot assigned to each Dooder. The Dooder attributes are thin
+views over those arrays, so statistics over the whole population are
+single array operations.
+"""
+
+from typing import TYPE_CHECKING, Any, Dict, Tuple
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from dooders.sdk.models.dooder import Dooder
+
+
+class PopulationStore:
+    """
+    Struct-of-arrays store for Dooder state.
+
+    Each active Dooder owns a slot (row) in every column. Slots of
+    terminated Dooders are recycled for new Dooders.
+
+    Parameters
+    ----------
+    capacity: int
+        The initial number of slots. The store doubles in size when full.
+
+    Attributes
+    ----------
+    columns: Dict[str, np.ndarray]
+        One array per stored attribute. Position is stored as 'x' and 'y',
+        and status as an index into statuses.
+    statuses: list
+        The status values seen by this store, in the order they were
+        first set. Starts with 'Alive' and 'Terminated'.
+    active: np.ndarray
+        Boolean mask of the slots owned by an active Dooder.
+    free: list
+        Released slots, ready to be reused.
+    size: int
+        The number of slots that have ever been handed out.
+
+    Methods
+    -------
+    attach(dooder: Dooder) -> int
+        Move the state of a Dooder into the store.
+    detach(dooder: Dooder) -> None
+        Move the state of a Dooder back onto the Dooder and free its slot.
+    get(name: str, slot: int) -> Any
+        Get the value of an attribute for a slot.
+    set(name: str, slot: int, value: Any) -> None
+        Set the value of an attribute for a slot.
+    column(name: str) -> np.ndarray
+        The values of an attribute for every active Dooder.
+    snapshot() -> Dict[str, np.ndarray]
+        A copy of every column for the active Dooders.
+    """
+
+    ATTRIBUTES = ("age", "hunger", "energy_consumed", "move_count", "position", "status")
+    COLUMNS = ("age", "hunger", "energy_consumed", "move_count", "x", "y", "status")
+
+    def __init__(self, capacity: int = 64) -> None:
+        self.statuses = ["Alive", "Terminated"]
+        self.columns = {
+            name: np.zeros(capacity, dtype=np.int64) for name in self.COLUMNS
+        }
+        self.active = np.zeros(capacity, dtype=bool)
+        self.free = []
+        self.size = 0
+
+    def _allocate(self) -> int:
+        """
+        Hand out a free slot, growing the columns if needed.
+
+        Returns
+        -------
+        int
+            The allocated slot.
+        """
+        if self.free:
+            return self.free.pop()
+
+        slot = self.size
+        self.size += 1
+
+        if slot >= len(self.active):
+            for name, column in self.columns.items():
+                self.columns[name] = np.concatenate((column, np.zeros_like(column)))
+            self.active = np.concatenate((self.active, np.zeros_like(self.active)))
+
+        return slot
+
+    def attach(self, dooder: "Dooder") -> int:
+        """
+        Move the state of a Dooder into the store.
+
+        Parameters
+        ----------
+        dooder: Dooder
+            The Dooder to attach.
+
+        Returns
+        -------
+        int
+            The slot of the Dooder.
+        """
+        slot = self._allocate()
+        self.active[slot] = True
+
+        for name in self.ATTRIBUTES:
+            self.set(name, slot, dooder._state[name])
+
+        dooder._store, dooder._slot = self, slot
+
+        return slot
+
+    def detach(self, dooder: "Dooder") -> None:
+        """
+        Move the state of a Dooder back onto the Dooder and free its slot.
+
+        Parameters
+        ----------
+        dooder: Dooder
+            The Dooder to detach.
+        """
+        slot = dooder._slot
+
+        for name in self.ATTRIBUTES:
+            dooder._state[name] = self.get(name, slot)
+
+        dooder._store, dooder._slot = None, None
+        self.active[slot] = False
+        self.free.append(slot)
+
+    def get(self, name: str, slot: int) -> Any:
+        """
+        Get the value of an attribute for a slot.
+
+        Parameters
+        ----------
+        name: str
+            The attribute name, one of ATTRIBUTES.
+        slot: int
+            The slot of the Dooder.
+
+        Returns
+        -------
+        Any
+            The value of the attribute.
+        """
+        if name == "position":
+            return (int(self.columns["x"][slot]), int(self.columns["y"][slot]))
+        elif name == "status":
+            return self.statuses[self.columns["status"][slot]]
+        else:
+            return int(self.columns[name][slot])
+
+    def set(self, name: str, slot: int, value: Any) -> None:
+        """
+        Set the value of an attribute for a slot.
+
+        Parameters
+        ----------
+        name: str
+            The attribute name, one of ATTRIBUTES.
+        slot: int
+            The slot of the Dooder.
+        value: Any
+            The new value.
+        """
+        if name == "position":
+            self.columns["x"][slot], self.columns["y"][slot] = value
+        elif name == "status":
+            if value not in self.statuses:
+                self.statuses.append(value)
+            self.columns["status"][slot] = self.statuses.index(value)
+        else:
+            self.columns[name][slot] = value
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        The values of an attribute for every active Dooder.
+
+        Parameters
+        ----------
+        name: str
+            The column name, one of COLUMNS.
+
+        Returns
+        -------
+        np.ndarray
+            The values of the active slots.
+        """
+        return self.columns[name][: self.size][self.active[: self.size]]
+
+    def snapshot(self) -> Dict[str, np.ndarray]:
+        """
+        A copy of every column for the active Dooders.
+
+        Returns
+        -------
+        Dict[str, np.ndarray]
+            The column values of the active slots.
+        """
+        return {name: self.column(name) for name in self.COLUMNS}
+
+    def __len__(self) -> int:
+        return int(self.active.sum())
+
+
+class StoredAttribute:
+    """
+    Dooder attribute that lives in the PopulationStore while the Dooder is
+    attached to one, and on the Dooder itself otherwise.
+    """
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, dooder: "Dooder", owner: type = None) -> Any:
+        if dooder is None:
+            return self
+        if dooder._store is None:
+            return dooder._state[self.name]
+        return dooder._store.get(self.name, dooder._slot)
+
+    def __set__(self, dooder: "Dooder", value: Any) -> None:
+        if dooder._store is None:
+            dooder._state[self.name] = value
+        else:
+            dooder._store.set(self.name, dooder._slot, value)
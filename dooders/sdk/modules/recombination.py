@@ -13,12 +13,41 @@ The module currently supports five recombination types:
 - `none`: Randomly inherits all weights from one of the parent Dooders, with no recombination involved.
 """
 
-import random
+from typing import Dict, List, Tuple
 
 import numpy as np
 
+#: Alias for the weights of every internal model of one Dooder
+Genome = Dict[str, List[np.ndarray]]
 
-def averaging_weights(a_weights: np.ndarray, b_weights: np.ndarray) -> np.ndarray:
+
+def _gene_shape(weights: np.ndarray, batch_dims: int) -> tuple:
+    """
+    The shape of one random draw per gene, broadcastable against the weights.
+
+    A gene is a row of a layer's weights, or a single value for 1-D weights.
+
+    Parameters
+    ----------
+    weights : (np.ndarray)
+        The weights, with batch_dims leading batch axes
+    batch_dims : (int)
+        The number of leading batch axes
+
+    Returns
+    -------
+    tuple
+        The batch and gene axes of the weights, then 1 for every other axis
+    """
+    return weights.shape[: batch_dims + 1] + (1,) * (weights.ndim - batch_dims - 1)
+
+
+def averaging_weights(
+    a_weights: np.ndarray,
+    b_weights: np.ndarray,
+    batch_dims: int = 0,
+    rng: np.random.Generator = None,
+) -> np.ndarray:
     """
     Averages the weights of two Dooders to create a new set of weights
 
@@ -28,6 +57,10 @@ def averaging_weights(a_weights: np.ndarray, b_weights: np.ndarray) -> np.ndarra
         The weights of the first Dooder
     b_weights : (np.ndarray)
         The weights of the second Dooder
+    batch_dims : (int)
+        The number of leading axes indexing separate pairs of parents
+    rng : (np.random.Generator)
+        Unused, averaging draws nothing
 
     Returns
     -------
@@ -40,15 +73,17 @@ def averaging_weights(a_weights: np.ndarray, b_weights: np.ndarray) -> np.ndarra
     >>> averaging_weights(a_weights, b_weights)
     array([3.5, 4.5, 5.5, 6.5, 7.5])
     """
-    new_weights = []
-    for i in range(len(a_weights)):
-        new_weights.append((a_weights[i] + b_weights[i]) / 2)
-    return np.array(new_weights)
+    return (a_weights + b_weights) / 2
 
 
-def lottery_weights(a_weights: np.ndarray, b_weights: np.ndarray) -> np.ndarray:
+def lottery_weights(
+    a_weights: np.ndarray,
+    b_weights: np.ndarray,
+    batch_dims: int = 0,
+    rng: np.random.Generator = None,
+) -> np.ndarray:
     """
-    Randomly selects weights between the range of the two Dooders
+    Randomly selects every gene from either of the two Dooders
     to create a new set of weights
 
     Parameters
@@ -57,6 +92,10 @@ def lottery_weights(a_weights: np.ndarray, b_weights: np.ndarray) -> np.ndarray:
         The weights of the first Dooder
     b_weights : (np.ndarray)
         The weights of the second Dooder
+    batch_dims : (int)
+        The number of leading axes indexing separate pairs of parents
+    rng : (np.random.Generator)
+        The random generator to draw with, numpy's global one by default
 
     Returns
     -------
@@ -66,24 +105,21 @@ def lottery_weights(a_weights: np.ndarray, b_weights: np.ndarray) -> np.ndarray:
     --------
     >>> a_weights = np.array([1, 2, 3, 4, 5])
     >>> b_weights = np.array([6, 7, 8, 9, 10])
-    >>> random_weights(a_weights, b_weights)
+    >>> lottery_weights(a_weights, b_weights)
     array([1, 7, 8, 4, 5])
     """
-    new_weights = []
-    for i in range(len(a_weights)):
-        # Perform crossover at the gene level
-        geneA = a_weights[i]
-        geneB = b_weights[i]
+    rng = np.random if rng is None else rng
+    mask = rng.random(_gene_shape(a_weights, batch_dims)) < 0.5
 
-        # Randomly select a gene from either parent
-        crossed_gene = random.choice([geneA, geneB])
+    return np.where(mask, a_weights, b_weights)
 
-        new_weights.append(crossed_gene)
 
-    return np.array(new_weights)
-
-
-def crossover_weights(a_weights: np.ndarray, b_weights: np.ndarray) -> np.ndarray:
+def crossover_weights(
+    a_weights: np.ndarray,
+    b_weights: np.ndarray,
+    batch_dims: int = 0,
+    rng: np.random.Generator = None,
+) -> np.ndarray:
     """
     Creates a new set of weights based on a random crossover point
     between the two Dooders weights
@@ -94,6 +130,10 @@ def crossover_weights(a_weights: np.ndarray, b_weights: np.ndarray) -> np.ndarra
         The weights of the first Dooder
     b_weights : (np.ndarray)
         The weights of the second Dooder
+    batch_dims : (int)
+        The number of leading axes indexing separate pairs of parents
+    rng : (np.random.Generator)
+        The random generator to draw with, numpy's global one by default
 
     Returns
     -------
@@ -106,14 +146,22 @@ def crossover_weights(a_weights: np.ndarray, b_weights: np.ndarray) -> np.ndarra
     >>> crossover_weights(a_weights, b_weights) (crossover point = 3)
     array([1, 2, 3, 9, 10])
     """
-    crossover_point = random.randint(0, len(a_weights))
-    first_half = a_weights[:crossover_point]
-    second_half = b_weights[crossover_point:]
-    new_weights = np.concatenate((first_half, second_half), axis=0)
-    return new_weights
-
-
-def random_range_weights(a_weights: np.ndarray, b_weights: np.ndarray) -> np.ndarray:
+    rng = np.random if rng is None else rng
+    genes = a_weights.shape[batch_dims]
+    # Uniform over 0..genes, with the same draws from either generator type
+    crossover_point = (rng.random(a_weights.shape[:batch_dims]) * (genes + 1)).astype(int)
+    # Genes before the crossover point come from the first Dooder
+    mask = np.arange(genes) < crossover_point[..., np.newaxis]
+
+    return np.where(mask.reshape(_gene_shape(a_weights, batch_dims)), a_weights, b_weights)
+
+
+def random_range_weights(
+    a_weights: np.ndarray,
+    b_weights: np.ndarray,
+    batch_dims: int = 0,
+    rng: np.random.Generator = None,
+) -> np.ndarray:
     """
     Randomly selects weights between the range of the two Dooders
     to create a new set of weights
@@ -124,6 +172,10 @@ def random_range_weights(a_weights: np.ndarray, b_weights: np.ndarray) -> np.nda
         The weights of the first Dooder
     b_weights : (np.ndarray)
         The weights of the second Dooder
+    batch_dims : (int)
+        The number of leading axes indexing separate pairs of parents
+    rng : (np.random.Generator)
+        The random generator to draw with, numpy's global one by default
 
     Returns
     -------
@@ -136,12 +188,45 @@ def random_range_weights(a_weights: np.ndarray, b_weights: np.ndarray) -> np.nda
     >>> random_range_weights(a_weights, b_weights)
     array([3, 4, 4, 8, 9])
     """
-    new_weights = []
-    for i in range(len(a_weights)):
-        random_weight = np.random.uniform(a_weights[i], b_weights[i])
-        new_weights.append(random_weight)
+    rng = np.random if rng is None else rng
+
+    # One uniform draw between the two values of every weight, in either
+    # order, which Generator.uniform rejects when b is below a
+    return a_weights + (b_weights - a_weights) * rng.random(np.shape(a_weights))
+
+
+def no_recombination(
+    a_weights: np.ndarray,
+    b_weights: np.ndarray,
+    batch_dims: int = 0,
+    rng: np.random.Generator = None,
+) -> np.ndarray:
+    """
+    Randomly inherits all the weights of one of the two Dooders
+
+    Parameters
+    ----------
+    a_weights : (np.ndarray)
+        The weights of the first Dooder
+    b_weights : (np.ndarray)
+        The weights of the second Dooder
+    batch_dims : (int)
+        The number of leading axes indexing separate pairs of parents
+    rng : (np.random.Generator)
+        The random generator to draw with, numpy's global one by default
+
+    Returns
+    -------
+    new_weights : (np.ndarray)
+    """
+    rng = np.random if rng is None else rng
 
-    return np.array(new_weights)
+    if batch_dims == 0:
+        return a_weights if rng.random() < 0.5 else b_weights
+
+    shape = a_weights.shape[:batch_dims] + (1,) * (a_weights.ndim - batch_dims)
+
+    return np.where(rng.random(shape) < 0.5, a_weights, b_weights)
 
 
 RECOMBINATION_TYPES = {
@@ -149,13 +234,20 @@ RECOMBINATION_TYPES = {
     'lottery': lottery_weights,
     'crossover': crossover_weights,
     'random_range': random_range_weights,
-    'none': lambda a, b: random.choice([a, b])
+    'none': no_recombination,
 }
 
 
-def recombine(a_weights: np.ndarray,
-              b_weights: np.ndarray,
-              recombination_type: str = 'averaging') -> np.ndarray:
+def _check_type(recombination_type: str) -> None:
+    if recombination_type not in RECOMBINATION_TYPES:
+        raise ValueError(f'Invalid recombination type {recombination_type}.'
+                         'Valid options are: "averaging", "lottery", "crossover", "random_range", "none"')
+
+
+def recombine(a_weights: Genome,
+              b_weights: Genome,
+              recombination_type: str = 'averaging',
+              rng: np.random.Generator = None) -> Genome:
     """ 
     Recombines the weights of two Dooders to create a new set of weights
 
@@ -165,32 +257,75 @@ def recombine(a_weights: np.ndarray,
 
     Parameters
     ----------
-    a_weights : (np.ndarray)
-        The weights of the first Dooder
-    b_weights : (np.ndarray)
-        The weights of the second Dooder
+    a_weights : (Genome)
+        The weights of every internal model of the first Dooder
+    b_weights : (Genome)
+        The weights of every internal model of the second Dooder
+    recombination_type : (str)
+        The type of recombination to use
+    rng : (np.random.Generator)
+        The random generator to draw with, numpy's global one by default
 
     Returns
     -------
-    new_weights : (np.ndarray)
+    new_weights : (Genome)
     """
+    _check_type(recombination_type)
+    recombination = RECOMBINATION_TYPES[recombination_type]
 
-    if recombination_type not in RECOMBINATION_TYPES:
-        raise ValueError(f'Invalid recombination type {recombination_type}.'
-                         'Valid options are: "averaging", "lottery", "crossover", "random_range", "none"')
-        
     recombined_model_weights = dict.fromkeys(a_weights.keys())
-    
+
     for model in recombined_model_weights.keys():
-        
-        model_weights_a = a_weights[model]
-        model_weights_b = b_weights[model]
-    
-        recombined_weights = []
-        for a, b in zip(model_weights_a.tolist(), model_weights_b.tolist()):
-            recombined_weights.append(
-                RECOMBINATION_TYPES[recombination_type](a, b))
-            
-        recombined_model_weights[model] = recombined_weights
+        recombined_model_weights[model] = [
+            recombination(np.asarray(a), np.asarray(b), rng=rng)
+            for a, b in zip(a_weights[model], b_weights[model])
+        ]
 
     return recombined_model_weights
+
+
+def recombine_batch(parents: List[Tuple[Genome, Genome]],
+                    recombination_type: str = 'averaging',
+                    rng: np.random.Generator = None) -> List[Genome]:
+    """
+    Recombines K pairs of parents into K offspring in one call.
+
+    The layers of every pair are stacked so each recombination runs once
+    per layer over all K pairs.
+
+    Parameters
+    ----------
+    parents : (List[Tuple[Genome, Genome]])
+        The weights of the two parents of every offspring, all with the
+        same models and layer shapes
+    recombination_type : (str)
+        See recombine
+    rng : (np.random.Generator)
+        See recombine
+
+    Returns
+    -------
+    new_weights : (List[Genome])
+        The weights of every offspring, in the order of the parents
+    """
+    _check_type(recombination_type)
+    recombination = RECOMBINATION_TYPES[recombination_type]
+
+    offspring = [{} for _ in parents]
+
+    if not parents:
+        return offspring
+
+    for model in parents[0][0].keys():
+        for genome in offspring:
+            genome[model] = []
+
+        for layer in range(len(parents[0][0][model])):
+            a = np.stack([a_weights[model][layer] for a_weights, _ in parents])
+            b = np.stack([b_weights[model][layer] for _, b_weights in parents])
+            recombined = recombination(a, b, batch_dims=1, rng=rng)
+
+            for genome, weights in zip(offspring, recombined):
+                genome[model].append(weights)
+
+    return offspring
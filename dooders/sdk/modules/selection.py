@@ -3,18 +3,14 @@ Selection module is used to select the most fit Dooders from a gene pool
 and recombine their weights to produce a new set of genes.
 """
 
-import random
 from typing import Dict, List, Tuple
 
 import numpy as np
-from sklearn.decomposition import PCA
 
-from dooders.sdk.modules.recombination import recombine
+from dooders.sdk.modules.embedding import GENE_EMBEDDING
+from dooders.sdk.modules.recombination import recombine, recombine_batch
 from dooders.sdk.utils.types import EmbeddingLayers
 
-# Global PCA instance for embedding
-GENE_EMBEDDING = PCA(n_components=3)
-
 
 def get_embeddings(gene_pool: Dict[str, dict]) -> List[Dict[str, np.ndarray]]:
     """ 
@@ -41,22 +37,25 @@ def get_embeddings(gene_pool: Dict[str, dict]) -> List[Dict[str, np.ndarray]]:
     >>> get_embeddings(gene_pool)
     [{'static': [0.1, 0.2, 0.3], 'dynamic': [0.4, 0.5, 0.6]}]
     """
-    gene_pool_embeddings = []
+    weights = []
     for dooder in gene_pool.values():
-        static_weights = dooder['move_decision'][0]
-        dynamic_weights = dooder['move_decision'][1]
-        static_embedding = GENE_EMBEDDING.fit(
-            static_weights).singular_values_.tolist()
-        dynamic_weights = GENE_EMBEDDING.fit(
-            dynamic_weights).singular_values_.tolist()
+        weights.append(dooder['move_decision'][0])
+        weights.append(dooder['move_decision'][1])
+
+    # Every layer of the gene pool is embedded in one batch
+    embeddings = GENE_EMBEDDING.embed_many(weights)
+
+    gene_pool_embeddings = []
+    for static_embedding, dynamic_embedding in zip(embeddings[0::2], embeddings[1::2]):
         embedding = EmbeddingLayers(
-            static=static_embedding, dynamic=dynamic_weights).dict()
+            static=static_embedding.tolist(), dynamic=dynamic_embedding.tolist()).dict()
         gene_pool_embeddings.append(embedding)
 
     return gene_pool_embeddings
 
 
-def select_parents(gene_pool: Dict[str, dict]) -> Tuple[Tuple[str, np.ndarray], Tuple[str, np.ndarray]]:
+def select_parents(gene_pool: Dict[str, dict],
+                   rng: np.random.Generator = None) -> Tuple[Tuple[str, np.ndarray], Tuple[str, np.ndarray]]:
     """ 
     Returns two random Dooders' weights from the gene pool.
 
@@ -66,20 +65,27 @@ def select_parents(gene_pool: Dict[str, dict]) -> Tuple[Tuple[str, np.ndarray],
     ----------
     gene_pool : dict
         A dictionary containing the Dooder IDs as keys and their weights as values.
+    rng : np.random.Generator, optional
+        The random generator to select with, numpy's global one by default.
 
     Returns
     -------
     Tuple[Tuple[str, np.ndarray], Tuple[str, np.ndarray]]
         A tuple containing two tuples, each containing a Dooder ID and their weights.
     """
-    parent_a_id, parent_b_id = random.sample(list(gene_pool.keys()), 2)
+    rng = np.random if rng is None else rng
+    ids = list(gene_pool.keys())
+    parent_a, parent_b = rng.choice(len(ids), 2, replace=False)
+    parent_a_id, parent_b_id = ids[parent_a], ids[parent_b]
     parent_a_weights = gene_pool[parent_a_id]
     parent_b_weights = gene_pool[parent_b_id]
 
     return (parent_a_id, parent_a_weights), (parent_b_id, parent_b_weights)
 
 
-def recombine_genes(gene_pool: Dict[str, dict], recombination_type: str = 'crossover') -> dict:
+def recombine_genes(gene_pool: Dict[str, dict],
+                    recombination_type: str = 'crossover',
+                    rng: np.random.Generator = None) -> dict:
     """ 
     Produces a new set of genes from two random Dooders' weights 
     from a provided gene pool.
@@ -92,6 +98,8 @@ def recombine_genes(gene_pool: Dict[str, dict], recombination_type: str = 'cross
         A dictionary containing the Dooder IDs as keys and their weights as values.
     recombination_type : str, optional
         The type of recombination to use (default is 'crossover').
+    rng : np.random.Generator, optional
+        The random generator to draw with, numpy's global one by default.
 
     Returns 
     -------
@@ -99,9 +107,72 @@ def recombine_genes(gene_pool: Dict[str, dict], recombination_type: str = 'cross
         A new set of genes produced from two random Dooders' weights 
         from the provided gene pool.
     """
-    parent_a, parent_b = select_parents(gene_pool)
+    parent_a, parent_b = select_parents(gene_pool, rng)
 
     recombined_genes = recombine(
-        parent_a[1], parent_b[1], recombination_type=recombination_type)
+        parent_a[1], parent_b[1], recombination_type=recombination_type, rng=rng)
 
     return recombined_genes
+
+
+def recombine_genes_batch(gene_pool: Dict[str, dict],
+                          count: int,
+                          recombination_type: str = 'crossover',
+                          rng: np.random.Generator = None) -> List[dict]:
+    """ 
+    Produces count new sets of genes, each from two random Dooders' weights 
+    from a provided gene pool, recombining all of them in one call.
+
+    Parameters
+    ----------
+    gene_pool : dict
+        A dictionary containing the Dooder IDs as keys and their weights as values.
+    count : int
+        The number of new sets of genes.
+    recombination_type : str, optional
+        The type of recombination to use (default is 'crossover').
+    rng : np.random.Generator, optional
+        The random generator to draw with, numpy's global one by default.
+
+    Returns 
+    -------
+    List[dict]
+        The new sets of genes, one for every pair of parents selected.
+    """
+    parents = []
+    for _ in range(count):
+        parent_a, parent_b = select_parents(gene_pool, rng)
+        parents.append((parent_a[1], parent_b[1]))
+
+    return recombine_batch(parents, recombination_type=recombination_type, rng=rng)
+
+
+def select_top(gene_pool: Dict[str, dict],
+               fitness: Dict[str, float],
+               count: int) -> Dict[str, dict]:
+    """ 
+    Returns the count fittest Dooders' weights from the gene pool.
+
+    Parameters
+    ----------
+    gene_pool : dict
+        A dictionary containing the Dooder IDs as keys and their weights as values.
+    fitness : dict
+        A dictionary containing the Dooder IDs as keys and their fitness as values.
+        Dooders missing from it are the least fit.
+    count : int
+        The number of Dooders to select, none if not positive.
+
+    Returns
+    -------
+    dict
+        The selected Dooder IDs and their weights, fittest first.
+    """
+    if count <= 0:
+        return {}
+
+    ranked = sorted(gene_pool,
+                    key=lambda id: fitness.get(id, float('-inf')),
+                    reverse=True)
+
+    return {id: gene_pool[id] for id in ranked[:count]}
@@ -182,7 +182,8 @@ class Space:
     @property
     def random(self) -> object:
         """
-        Get a random object in the Space
+        Get a random object in the Space, drawn from the random
+        generator of the objects' simulation when they have one
 
         Returns
         -------
@@ -196,7 +197,11 @@ class Space:
         >>> space.random
         <sdk.objects.Dooder object at 0x000001E0F1B0F0A0>
         """
-        return random.choice(list(self._contents.values()))
+        contents = list(self._contents.values())
+        simulation = getattr(contents[0], "simulation", None) if contents else None
+        random_state = random if simulation is None else simulation.random
+
+        return random_state.choice(contents)
 
     @property
     def is_empty(self) -> bool:
@@ -9,7 +9,6 @@ Currently there are three policies:
 3. Neural Network: The Dooder will move to a location based on a neural network output
 """
 
-from random import choice
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -46,7 +45,7 @@ class RandomMove(BasePolicy):
     @classmethod
     def execute(self, dooder: 'Dooder') -> tuple:
         perception = dooder.perception
-        random_cell = choice(perception.coordinates)
+        random_cell = dooder.simulation.random.choice(perception.coordinates)
 
         return random_cell
 
@@ -79,7 +78,7 @@ class RuleBased(BasePolicy):
 
         if energy:
             energy_positions = [e.position for e in energy]
-            random_cell = choice(energy_positions)
+            random_cell = dooder.simulation.random.choice(energy_positions)
 
         else:
             random_cell = dooder.position
@@ -10,6 +10,8 @@ import numpy as np
 
 from dooders.sdk.base.base_policy import BasePolicy
 from dooders.sdk.core.core import Core
+from dooders.sdk.modules.recombination import (averaging_weights,
+                                                random_range_weights)
 
 if TYPE_CHECKING:
     from dooders.sdk.models.dooder import Dooder
@@ -59,16 +61,11 @@ class AverageWeights(BasePolicy):
         model_names = list(weightsA.keys())
 
         for model in model_names:
-            new_weights[model] = []
             a_weights = weightsA[model]
             b_weights = weightsB[model]
 
-            combined_weights = []
-
-            for i in range(len(a_weights)):
-                combined_weights.append((a_weights[i] + b_weights[i]) / 2)
-
-            new_weights[model] = combined_weights
+            new_weights[model] = [averaging_weights(a, b)
+                                  for a, b in zip(a_weights, b_weights)]
 
         return new_weights
 
@@ -107,15 +104,8 @@ class RangeWeights(BasePolicy):
         weightsB = dooderB.internal_models.weights
 
         for key in weightsA.keys():
-            modelA = weightsA[key]
-            modelB = weightsB[key]
-
-            new_weights[key] = {}
-
-            for k in modelA.keys():
-                mA = modelA[k]
-                mB = modelB[k]
-                new_weights[key][k] = [np.random.uniform(mA, mB)]
+            new_weights[key] = [random_range_weights(mA, mB, rng=dooderA.simulation.rng)
+                                for mA, mB in zip(weightsA[key], weightsB[key])]
 
         return new_weights
 
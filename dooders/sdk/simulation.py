@@ -8,7 +8,9 @@ initializing the simulation, running the simulation, and displaying the results.
 
 import traceback
 from datetime import datetime
+from typing import Optional, Union
 
+import numpy as np
 from tqdm import tqdm
 
 from dooders.sdk.base.reality import Reality
@@ -27,6 +29,12 @@ class Simulation(Reality):
         The settings for the simulation.
     auto_restart: bool
         Whether the simulation should restart if it fails.
+    batch_process: bool
+        Whether the simulation runs as part of a batch.
+    seed: Optional[Union[int, np.random.SeedSequence]]
+        The seed the simulation's random generators are spawned from, and
+        the global random and numpy generators are seeded with.
+        Random if None.
 
     Attributes
     ----------
@@ -34,6 +42,11 @@ class Simulation(Reality):
         Whether the simulation is running or not.
     cycle_number: int
         The number of cycles that have passed.
+    rng: np.random.Generator
+        The numpy random generator of the simulation, for strategies,
+        policies, recombination and the initial network weights.
+    random: random.Random
+        The random generator of the simulation, for the Time scheduler.
 
     Methods
     -------
@@ -67,9 +80,13 @@ class Simulation(Reality):
     """
 
     def __init__(
-        self, settings: dict, auto_restart: bool = True, batch_process: bool = True
+        self,
+        settings: dict,
+        auto_restart: bool = True,
+        batch_process: bool = True,
+        seed: Optional[Union[int, np.random.SeedSequence]] = None,
     ) -> None:
-        super().__init__()
+        super().__init__(seed)
         self.settings = settings
         self.running = False
         self.cycle_number: int = 0
@@ -94,15 +111,23 @@ class Simulation(Reality):
         """
         Advance the simulation by one cycle.
 
-        1. Advance every agent by a step
-        2. Collect data at the end of the cycle
-        3. Place new energy
-        4. Collect stats
-        5. Increment cycle counter
+        1. Batch the internal model inference, if enabled
+        2. Advance every agent by a step
+        3. Apply the learning from the cycle
+        4. Collect data at the end of the cycle
+        5. Place new energy
+        6. Collect stats
+        7. Increment cycle counter
         """
+        if self.settings.get("BatchInference"):
+            self.arena.prime_internal_models()
+
         # advance every agent by a step
         self.time.step()
 
+        # apply the learning queued during the agent steps
+        self.arena.apply_learning()
+
         # collect data at the end of the cycle
         Information.collect(self)
 
@@ -151,6 +176,7 @@ class Simulation(Reality):
         except Exception as e:
             print(traceback.format_exc())
             print("Simulation failed")
+            self.stop()
 
         finally:
             self.ending_time = datetime.now()
@@ -166,15 +192,19 @@ class Simulation(Reality):
 
         This is useful for resetting the simulation after a parameter change.
         """
-        self.__init__(self.settings)
+        self.arena.stop_learning()
+        # A reset spawns new generators from the same seed sequence
+        self.__init__(self.settings, seed=self.seed_sequence)
         Information.reset()
+        self.arena.start_learning()
         self.setup()
 
     def stop(self) -> None:
         """
-        Stop the simulation.
+        Stop the simulation and the learning pool workers.
         """
         self.running = False
+        self.arena.stop_learning()
 
     def generate_id(self) -> int:
         """
@@ -284,5 +314,9 @@ class Simulation(Reality):
             "ending_time": str(self.ending_time),
             "arena": self.arena.state,
             "environment": self.environment.state,
-            "information": Information.data,
+            # Information clears the same lists when the next simulation starts
+            "information": {
+                model: {name: list(column) for name, column in columns.items()}
+                for model, columns in Information.data.items()
+            },
         }
@@ -4,13 +4,34 @@ Strategy: Generation
 This module contains the strategies for generating the number of resources.
 """
 
-from typing import Callable
+from typing import Callable, Optional
 
+import numpy as np
 from scipy.stats import norm, randint
 
 from dooders.sdk.core.core import Core
 
 
+def random_state(model: Callable) -> Optional[np.random.Generator]:
+    """ 
+    Returns the random generator of the model's simulation.
+
+    Parameters
+    ----------
+    model : Callable
+        The model object that contains the environment, agents, and other models.
+
+    Returns
+    -------
+    Optional[np.random.Generator]
+        The simulation's generator, or None for numpy's global one when 
+        the model is not part of a simulation.
+    """
+    simulation = getattr(model, 'simulation', None)
+
+    return getattr(simulation, 'rng', None)
+
+
 @Core.register('strategy')
 def uniform_distribution(model: Callable, args: dict) -> int:
     """ 
@@ -29,7 +50,8 @@ def uniform_distribution(model: Callable, args: dict) -> int:
     int
         The generated value based on a uniform distribution.
     """
-    return randint.rvs(low=args['min'], high=args['max'])
+    return randint.rvs(low=args['min'], high=args['max'],
+                       random_state=random_state(model))
 
 
 @Core.register('strategy')
@@ -58,7 +80,7 @@ def normal_distribution(model: Callable, args: dict) -> float:
     else:
         variation = args['variation']
 
-    return norm.rvs(loc=mean, scale=variation)
+    return norm.rvs(loc=mean, scale=variation, random_state=random_state(model))
 
 
 @Core.register('strategy')
@@ -1,4 +1,3 @@
-from random import choices
 from typing import Callable
 
 from dooders.sdk.core.core import Core
@@ -29,6 +28,6 @@ def random_location(model: Callable, *value) -> list:
     elif value[1].__class__.__name__ == 'partial':
         final_value = value[1]()
 
-    random_locations = choices(locations, k=final_value)
+    random_locations = model.simulation.random.choices(locations, k=final_value)
 
     return random_locations
@@ -7,6 +7,9 @@ Rectangular grid of Spaces.
 import itertools
 from functools import singledispatchmethod
 from typing import Any, Dict, Iterator, List, Sequence, Tuple, Union, cast
+
+import numpy as np
+
 from dooders.sdk.base.coordinate import Coordinate
 
 from dooders.sdk.modules.space import Space
@@ -48,8 +51,15 @@ class Grid:
         A list of lists of Spaces.
     _object_index: Dict[str, Coordinate]
         A dictionary of object ids and their coordinates.
-    _nearby_cache: Dict[Coordinate, Dict[int, List[Coordinate]]]
-        A dictionary of cached nearby coordinates.
+    _spaces: List[Space]
+        The Spaces in flat index order, index = x * height + y.
+    _neighbourhoods: Dict[Tuple[bool, bool, int], np.ndarray]
+        One (width * height, k) int32 table of flat neighbour indices per
+        (moore, include_center, radius) configuration, built on first use.
+        Cells off a non-toroidal grid are -1.
+    _layers: Dict[str, np.ndarray]
+        One (width, height) count array per object type on the grid,
+        kept up to date by add, remove and move.
 
     Methods
     -------
@@ -60,6 +70,16 @@ class Grid:
         Remove an object from the grid.
     remove(object_id: str) -> None
         Remove an object from the grid based on its id.
+    move(object: object, coordinate: Coordinate) -> None
+        Move an object to a new coordinate on the grid.
+    neighbourhood(moore: bool, include_center: bool, radius: int) -> np.ndarray
+        Return the flat neighbour index table of a neighbourhood configuration.
+    layer(object_type: str) -> np.ndarray
+        Return a read-only array of the object type counts per coordinate.
+    has(coordinate: Coordinate, object_type: str, ignore: object) -> bool
+        Return a boolean indicating if a coordinate holds an object type.
+    perception_batch(positions, object_types, radius, ignore) -> np.ndarray
+        Return the perception arrays of many positions at once.
     coordinates() -> Iterator[Coordinate]
         Return an iterator over all coordinates in the grid.
     spaces() -> Iterator[Space]
@@ -84,7 +104,9 @@ class Grid:
 
     _grid: List[List[GridRow]]
     _object_index: Dict[str, Coordinate]
-    _nearby_cache: Dict[Coordinate, Dict[int, List[Coordinate]]]
+    _spaces: List[Space]
+    _neighbourhoods: Dict[Tuple[bool, bool, int], np.ndarray]
+    _layers: Dict[str, np.ndarray]
 
     def __init__(self, settings: dict) -> None:
         self.torus = settings.get("torus", True)
@@ -93,7 +115,9 @@ class Grid:
 
         self._grid = []
         self._object_index = {}
-        self._nearby_cache = {}
+        self._spaces = []
+        self._neighbourhoods = {}
+        self._layers = {}
 
         self._build()
 
@@ -106,8 +130,79 @@ class Grid:
             for y in range(self.height):
                 space = Space(x, y)
                 col.append(space)
+                self._spaces.append(space)
             self._grid.append(col)
 
+    def neighbourhood(
+        self, moore: bool = True, include_center: bool = False, radius: int = 1
+    ) -> np.ndarray:
+        """
+        Return the flat neighbour index table for a neighbourhood configuration.
+
+        Row i holds the flat indices (x * height + y) of the cells nearby
+        the cell with flat index i, in nearby_coordinates order.
+
+        Parameters
+        ----------
+        moore: bool, optional, default = True
+            A boolean indicating if the neighbourhood
+            should be Moore or Von Neumann.
+        include_center: bool, optional, default = False
+            A boolean indicating if the center position
+            should be included in the neighbourhood.
+        radius: int, optional, default = 1
+            The radius of the neighbourhood.
+
+        Returns
+        -------
+        np.ndarray, shape (width * height, k), int32
+            The neighbour indices, -1 for cells off a non-toroidal grid.
+        """
+        key = (moore, include_center, radius)
+        table = self._neighbourhoods.get(key)
+
+        if table is None:
+            offsets = [
+                (dx, dy)
+                for dy in range(-radius, radius + 1)
+                for dx in range(-radius, radius + 1)
+                if (dx or dy or include_center)
+                and (moore or abs(dx) + abs(dy) <= radius)
+            ]
+            offsets = np.array(offsets, dtype=np.int64).reshape(-1, 2)
+
+            xs, ys = np.divmod(np.arange(self.width * self.height), self.height)
+            xs = xs[:, np.newaxis] + offsets[:, 0]
+            ys = ys[:, np.newaxis] + offsets[:, 1]
+
+            if self.torus:
+                table = (xs % self.width) * self.height + ys % self.height
+            else:
+                inside = (xs >= 0) & (xs < self.width) & (ys >= 0) & (ys < self.height)
+                table = np.where(inside, xs * self.height + ys, -1)
+
+            table = table.astype(np.int32)
+            table.flags.writeable = False
+            self._neighbourhoods[key] = table
+
+        return table
+
+    def _nearby_indices(
+        self, position: Coordinate, moore: bool, include_center: bool, radius: int
+    ) -> np.ndarray:
+        """
+        Return the flat indices of the cells nearby a position.
+        """
+        x, y = position
+        indices = self.neighbourhood(moore, include_center, radius)[
+            x * self.height + y
+        ]
+
+        if not self.torus:
+            indices = indices[indices >= 0]
+
+        return indices
+
     def add(self, object: object, coordinate: Coordinate) -> None:
         """
         Add an object to a space on the grid.
@@ -129,11 +224,35 @@ class Grid:
         # Add the object to the space
         space.add(object)
 
-        # Add the object to the object index for quick lookup
-        self._object_index[object.id] = coordinate
+        # Add the object to the object index for quick lookup, as a tuple
+        # so lists, tuples and Coordinates all compare equal in has()
+        self._object_index[object.id] = (x, y)
+        self._count(object.__class__.__name__, (x, y), 1)
 
         object.position = coordinate
 
+    def _count(self, object_type: str, coordinate: Coordinate, change: int) -> None:
+        """
+        Update the occupancy layer of an object type at a coordinate.
+
+        Parameters
+        ----------
+        object_type: str
+            The class name of the object, 'Dooder', 'Energy', etc.
+        coordinate: Coordinate, (int, int)
+            The coordinate to update.
+        change: int
+            The change in the number of objects, 1 or -1.
+        """
+        layer = self._layers.get(object_type)
+
+        if layer is None:
+            layer = np.zeros((self.width, self.height), dtype=np.int32)
+            self._layers[object_type] = layer
+
+        x, y = coordinate
+        layer[x, y] += change
+
     @singledispatchmethod
     def remove(self, type: Union[object, str]) -> None:
         """
@@ -177,6 +296,7 @@ class Grid:
         # and the object index
         self._grid[x][y].remove(object)
         self._object_index.pop(object.id)
+        self._count(object.__class__.__name__, (x, y), -1)
 
     @remove.register
     def _(self, object_id: str) -> None:
@@ -194,8 +314,156 @@ class Grid:
         grid.remove(dooder.id)
         """
         x, y = self._object_index[object_id]
+        object = next(o for o in self._grid[x][y].contents if o.id == object_id)
         self._grid[x][y].remove(object_id)
         self._object_index.pop(object_id)
+        self._count(object.__class__.__name__, (x, y), -1)
+
+    def move(self, object: object, coordinate: Coordinate) -> None:
+        """
+        Move an object to a new Space on the grid.
+
+        Parameters
+        ----------
+        object: object, Dooder, Energy, etc.
+            The object to move.
+        coordinate: Coordinate, (int, int)
+            Where to move the object.
+
+        Example
+        -------
+        grid.move(dooder, (1, 0))
+        """
+        self.remove(object)
+        self.add(object, coordinate)
+
+    def layer(self, object_type: str) -> np.ndarray:
+        """
+        Return the number of objects of a type at every coordinate.
+
+        The array is a read-only view that stays up to date as objects
+        are added, removed and moved.
+
+        Parameters
+        ----------
+        object_type: str
+            The type of object, 'Dooder', 'Energy', etc.
+
+        Returns
+        -------
+        np.ndarray, shape (width, height)
+            The count of the object type, indexed as layer[x, y].
+
+        Example
+        -------
+        grid.layer('Energy').nonzero()
+        >>> (array([0, 3]), array([2, 1]))
+        """
+        layer = self._layers.get(object_type)
+
+        if layer is None:
+            layer = np.zeros((self.width, self.height), dtype=np.int32)
+            self._layers[object_type] = layer
+
+        view = layer.view()
+        view.flags.writeable = False
+
+        return view
+
+    def has(
+        self, coordinate: Coordinate, object_type: str, ignore: object = None
+    ) -> bool:
+        """
+        Return a boolean indicating if a Space holds an object type.
+
+        Parameters
+        ----------
+        coordinate: Coordinate, (int, int)
+            The coordinate to check.
+        object_type: str
+            The type of object, 'Dooder', 'Energy', etc.
+        ignore: object, optional
+            An object to leave out of the check (Specifically the involved Dooder)
+
+        Returns
+        -------
+        bool
+            True if the Space contains the object type, False otherwise
+        """
+        layer = self._layers.get(object_type)
+
+        if layer is None:
+            return False
+
+        x, y = coordinate
+        count = layer[x, y]
+
+        if (
+            ignore is not None
+            and ignore.__class__.__name__ == object_type
+            and self._object_index.get(ignore.id) == (x, y)
+        ):
+            count -= 1
+
+        return count > 0
+
+    def perception_batch(
+        self,
+        positions: Sequence[Coordinate],
+        object_types: Union[str, List[str]],
+        radius: int = 1,
+        ignore: str = None,
+    ) -> np.ndarray:
+        """
+        Return the perception arrays of many positions in one pass.
+
+        Row i matches Perception.array(object_types) of an object at
+        positions[i]: for each object type, one 0/1 value per cell of the
+        Moore neighbourhood (center included), in nearby_spaces order.
+
+        Parameters
+        ----------
+        positions: Sequence[Coordinate], [(int, int), ...]
+            The positions to perceive from.
+        object_types: str or List[str], ('Dooder', 'Energy', etc.)
+            The object types to check for.
+        radius: int, optional, default = 1
+            The radius of the perception.
+        ignore: str, optional
+            The object type of the perceiving objects. Each one is left out
+            of its own center cell, like Perception does with its Dooder.
+
+        Returns
+        -------
+        np.ndarray, shape (len(positions), len(object_types) * cells), uint8
+            The perception arrays, one row per position.
+            Cells off a non-toroidal grid are always 0.
+
+        Example
+        -------
+        grid.perception_batch([(0, 0), (3, 2)], 'Energy')
+        >>> array([[0, 0, 1, 0, 0, 0, 0, 0, 0],
+                   [0, 0, 0, 0, 0, 0, 1, 0, 0]], dtype=uint8)
+        """
+        if isinstance(object_types, str):
+            object_types = [object_types]
+
+        table = self.neighbourhood(True, True, radius)
+        positions = np.asarray(positions, dtype=np.int64).reshape(-1, 2)
+        indices = table[positions[:, 0] * self.height + positions[:, 1]]
+        inside = indices >= 0
+        center = table.shape[1] // 2
+        arrays = []
+
+        for object_type in object_types:
+            counts = self.layer(object_type).ravel()[indices]
+            if object_type == ignore:
+                counts[:, center] -= 1
+            if not self.torus:
+                counts[~inside] = 0
+            arrays.append(counts > 0)
+
+        return np.concatenate(arrays, axis=1).astype(np.uint8)
 
     def coordinates(self) -> Iterator[Coordinate]:
         """
@@ -268,14 +536,17 @@ class Grid:
         >>> <Energy>
         >>> <Dooder>
         """
-        for row in self._grid:
-            for space in row:
-                for object in space.contents:
-                    if object_type is None:
-                        yield object
+        if object_type is None:
+            for row in self._grid:
+                for space in row:
+                    yield from space.contents
+        elif object_type in self._layers:
+            for x, y in zip(*self._layers[object_type].nonzero()):
+                for object in self._grid[x][y].contents:
                     if object.__class__.__name__ == object_type:
                         yield object
 
+    @contents.register(tuple)
     @contents.register
     def _(self, position: "Coordinate") -> Iterator[Any]:
         """
@@ -332,8 +603,8 @@ class Grid:
         >>> <Space>
         >>> <Space>
         """
-        nearby = self.nearby_coordinates(position, moore, include_center, radius)
-        return [self._grid[pos[0]][pos[1]] for pos in nearby]
+        indices = self._nearby_indices(position, moore, include_center, radius)
+        return [self._spaces[i] for i in indices]
 
     def nearby_contents(
         self,
@@ -370,10 +641,8 @@ class Grid:
         >>> <Dooder>
         >>> <Energy>
         """
-        nearby_contents = self.nearby_coordinates(
-            position, moore, include_center, radius
-        )
-        return [self._grid[pos[0]][pos[1]].contents for pos in nearby_contents]
+        indices = self._nearby_indices(position, moore, include_center, radius)
+        return [self._spaces[i].contents for i in indices]
 
     def nearby_coordinates(
         self,
@@ -411,35 +680,8 @@ class Grid:
         >>> (0, 1)
         >>> (0, 2)
         """
-        cache_key = (position, moore, include_center, radius)
-        nearby_coordinates = self._nearby_cache.get(cache_key, None)
-
-        if nearby_coordinates is None:
-            coordinates = []
-
-            x, y = position
-            for dy in range(-radius, radius + 1):
-                for dx in range(-radius, radius + 1):
-                    if dx == 0 and dy == 0 and not include_center:
-                        continue
-                    # Skip coordinates that are outside manhattan distance
-                    if not moore and abs(dx) + abs(dy) > radius:
-                        continue
-
-                    coord = (x + dx, y + dy)
-
-                    if self.out_of_bounds(coord):
-                        # Skip if not a torus and new coords out of bounds.
-                        if not self.torus:
-                            continue
-                        coord = self.torus_adjustment(coord)
-
-                    coordinates.append(coord)
-
-            nearby_coordinates = coordinates
-            self._nearby_cache[cache_key] = nearby_coordinates
-
-        return nearby_coordinates
+        indices = self._nearby_indices(position, moore, include_center, radius)
+        return [divmod(int(i), self.height) for i in indices]
 
     def torus_adjustment(self, position: Coordinate) -> Coordinate:
         """
@@ -0,0 +1,526 @@
+"""
+Space: Sparse Grid
+------------------
+Rectangular grid of Spaces, allocated in chunks only where objects are.
+"""
+
+from typing import Any, Dict, Iterator, List, Sequence, Tuple, Union
+
+import numpy as np
+
+from dooders.sdk.base.coordinate import Coordinate
+from dooders.sdk.core.core import Core
+from dooders.sdk.modules.space import Space
+from dooders.sdk.surfaces.grid import Grid
+
+ChunkKey = Tuple[int, int]
+
+
+class Chunk:
+    """
+    A square block of cells of a SparseGrid.
+
+    Parameters
+    ----------
+    size: int
+        The width and height of the chunk, in cells.
+
+    Attributes
+    ----------
+    spaces: Dict[Tuple[int, int], Space]
+        The occupied Spaces of the chunk, by grid coordinate.
+    layers: Dict[str, np.ndarray]
+        One (size, size) count array per object type in the chunk.
+    count: int
+        The number of objects in the chunk.
+    """
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.spaces = {}
+        self.layers = {}
+        self.count = 0
+
+    def layer(self, object_type: str) -> np.ndarray:
+        """
+        Return the count array of an object type, creating it if needed.
+        """
+        layer = self.layers.get(object_type)
+
+        if layer is None:
+            layer = np.zeros((self.size, self.size), dtype=np.int32)
+            self.layers[object_type] = layer
+
+        return layer
+
+
+@Core.register("surface")
+class SparseGrid(Grid):
+    """
+    A rectangular grid of Spaces for very large, mostly empty worlds.
+
+    Cells are grouped in square chunks. A chunk, and the Spaces inside it,
+    only exist while at least one object is placed there, so memory and
+    startup time scale with the number of objects instead of the area.
+    Empty Spaces returned by lookups are temporary and not stored.
+
+    Parameters
+    ----------
+    settings: dict, {torus: bool, width: int, height: int, chunk_size: int}
+        A dictionary of settings for the grid.
+        The following settings are available:
+        torus: bool, default: True
+            A boolean indicating if the grid is a torus.
+            Torus grids wrap around the edges.
+        width: int, default: 10
+            The width of the grid.
+        height: int, default: 10
+            The height of the grid.
+        chunk_size: int, default: 16
+            The width and height of a chunk, in cells.
+
+    Attributes
+    ----------
+    torus: bool
+        See settings.
+    width: int
+        See settings.
+    height: int
+        See settings.
+    chunk_size: int
+        See settings.
+    _chunks: Dict[ChunkKey, Chunk]
+        The allocated chunks, by (x // chunk_size, y // chunk_size).
+    _object_index: Dict[str, Coordinate]
+        A dictionary of object ids and their coordinates.
+    _offsets: Dict[Tuple[bool, bool, int], np.ndarray]
+        Cached (k, 2) neighbourhood offsets per neighbourhood configuration.
+    _neighbourhoods: Dict[Tuple[bool, bool, int], np.ndarray]
+        Cached neighbour index tables, see Grid.neighbourhood.
+
+    Methods
+    -------
+    Same as Grid. spaces() only iterates over the occupied Spaces,
+    and layer() assembles a dense array from the chunks. neighbourhood()
+    builds the same dense (width * height, k) table as Grid, so it is
+    only built when asked for; the nearby lookups use offsets instead.
+
+    See Also
+    --------
+    sdk.surfaces.grid.Grid: The dense grid.
+    """
+
+    _chunks: Dict[ChunkKey, Chunk]
+    _object_index: Dict[str, Coordinate]
+    _offsets: Dict[Tuple[bool, bool, int], np.ndarray]
+    _neighbourhoods: Dict[Tuple[bool, bool, int], np.ndarray]
+
+    def __init__(self, settings: dict) -> None:
+        self.torus = settings.get("torus", True)
+        self.width = settings.get("width", 10)
+        self.height = settings.get("height", 10)
+        self.chunk_size = settings.get("chunk_size", 16)
+
+        self._chunks = {}
+        self._object_index = {}
+        self._offsets = {}
+        self._neighbourhoods = {}
+
+    def _key(self, x: int, y: int) -> ChunkKey:
+        return x // self.chunk_size, y // self.chunk_size
+
+    def _space(self, x: int, y: int) -> Space:
+        """
+        Return the Space at a coordinate, a temporary empty one if unoccupied.
+        """
+        chunk = self._chunks.get(self._key(x, y))
+
+        if chunk is not None:
+            space = chunk.spaces.get((x, y))
+            if space is not None:
+                return space
+
+        return Space(x, y)
+
+    def add(self, object: object, coordinate: Coordinate) -> None:
+        """
+        Add an object to a space on the grid, allocating its chunk if needed.
+
+        Parameters
+        ----------
+        object: object, Dooder, Energy, etc.
+            The object to add to the grid.
+        coordinate: Coordinate, (int, int)
+            Where to place the object.
+        """
+        x, y = coordinate
+        key = self._key(x, y)
+        chunk = self._chunks.get(key)
+
+        if chunk is None:
+            chunk = Chunk(self.chunk_size)
+            self._chunks[key] = chunk
+
+        space = chunk.spaces.get((x, y))
+
+        if space is None:
+            space = Space(x, y)
+            chunk.spaces[(x, y)] = space
+
+        space.add(object)
+        chunk.count += 1
+        chunk.layer(object.__class__.__name__)[
+            x % self.chunk_size, y % self.chunk_size
+        ] += 1
+
+        # Indexed as a tuple so lists, tuples and Coordinates all compare
+        # equal in has()
+        self._object_index[object.id] = (x, y)
+
+        object.position = coordinate
+
+    def remove(self, object: Union[object, str]) -> None:
+        """
+        Remove an object from the grid, freeing its Space and chunk when empty.
+
+        Parameters
+        ----------
+        object: Union[object, str]
+            The object or id of the object to remove.
+            It will also be removed from the object index.
+        """
+        object_id = object if isinstance(object, str) else object.id
+        x, y = self._object_index.pop(object_id)
+        key = self._key(x, y)
+        chunk = self._chunks[key]
+        space = chunk.spaces[(x, y)]
+
+        object = next(o for o in space.contents if o.id == object_id)
+        space.remove(object_id)
+        chunk.count -= 1
+        chunk.layers[object.__class__.__name__][
+            x % self.chunk_size, y % self.chunk_size
+        ] -= 1
+
+        if space.count == 0:
+            del chunk.spaces[(x, y)]
+
+        if chunk.count == 0:
+            del self._chunks[key]
+
+    def layer(self, object_type: str) -> np.ndarray:
+        """
+        Return the number of objects of a type at every coordinate.
+
+        Unlike Grid, the array is assembled from the chunks on every call.
+
+        Parameters
+        ----------
+        object_type: str
+            The type of object, 'Dooder', 'Energy', etc.
+
+        Returns
+        -------
+        np.ndarray, shape (width, height)
+            The count of the object type, indexed as layer[x, y].
+        """
+        dense = np.zeros((self.width, self.height), dtype=np.int32)
+
+        for (cx, cy), chunk in self._chunks.items():
+            layer = chunk.layers.get(object_type)
+            if layer is not None:
+                x, y = cx * self.chunk_size, cy * self.chunk_size
+                block = dense[x : x + self.chunk_size, y : y + self.chunk_size]
+                block += layer[: block.shape[0], : block.shape[1]]
+
+        dense.flags.writeable = False
+
+        return dense
+
+    def has(
+        self, coordinate: Coordinate, object_type: str, ignore: object = None
+    ) -> bool:
+        """
+        Return a boolean indicating if a Space holds an object type.
+
+        Parameters
+        ----------
+        coordinate: Coordinate, (int, int)
+            The coordinate to check.
+        object_type: str
+            The type of object, 'Dooder', 'Energy', etc.
+        ignore: object, optional
+            An object to leave out of the check (Specifically the involved Dooder)
+
+        Returns
+        -------
+        bool
+            True if the Space contains the object type, False otherwise
+        """
+        x, y = coordinate
+        chunk = self._chunks.get(self._key(x, y))
+
+        if chunk is None or object_type not in chunk.layers:
+            return False
+
+        count = chunk.layers[object_type][x % self.chunk_size, y % self.chunk_size]
+
+        if (
+            ignore is not None
+            and ignore.__class__.__name__ == object_type
+            and self._object_index.get(ignore.id) == (x, y)
+        ):
+            count -= 1
+
+        return count > 0
+
+    def perception_batch(
+        self,
+        positions: Sequence[Coordinate],
+        object_types: Union[str, List[str]],
+        radius: int = 1,
+        ignore: str = None,
+    ) -> np.ndarray:
+        """
+        Return the perception arrays of many positions in one pass.
+
+        See Grid.perception_batch. The query cells are grouped by chunk,
+        every chunk holding a query is looked up once, and the counts are
+        gathered in one pass from the stacked layers of those chunks.
+        """
+        if isinstance(object_types, str):
+            object_types = [object_types]
+
+        offsets = self._neighbour_offsets(True, True, radius)
+        positions = np.asarray(positions, dtype=np.int64).reshape(-1, 2)
+        xs = positions[:, 0, np.newaxis] + offsets[:, 0]
+        ys = positions[:, 1, np.newaxis] + offsets[:, 1]
+
+        if self.torus:
+            xs %= self.width
+            ys %= self.height
+            inside = np.ones(xs.shape, dtype=bool)
+        else:
+            inside = (xs >= 0) & (xs < self.width) & (ys >= 0) & (ys < self.height)
+
+        # Group the query cells by chunk, so only the chunks that hold a
+        # query are looked up, each once
+        cells = np.flatnonzero(inside)
+        xs, ys = xs.ravel()[cells], ys.ravel()[cells]
+        chunk_rows = -(-self.height // self.chunk_size)
+        keys = (xs // self.chunk_size) * chunk_rows + ys // self.chunk_size
+        unique, inverse = np.unique(keys, return_inverse=True)
+        chunks = [
+            self._chunks.get((int(key) // chunk_rows, int(key) % chunk_rows))
+            for key in unique
+        ]
+        local = (inverse, xs % self.chunk_size, ys % self.chunk_size)
+        empty = np.zeros((self.chunk_size, self.chunk_size), dtype=np.int32)
+
+        center = len(offsets) // 2
+        arrays = []
+
+        for object_type in object_types:
+            counts = np.zeros(inside.shape, dtype=np.int32)
+            layers = [
+                empty if chunk is None else chunk.layers.get(object_type, empty)
+                for chunk in chunks
+            ]
+
+            if layers:
+                counts.reshape(-1)[cells] = np.stack(layers)[local]
+
+            if object_type == ignore:
+                counts[:, center] -= 1
+            arrays.append(counts > 0)
+
+        return np.concatenate(arrays, axis=1).astype(np.uint8)
+
+    def coordinates(self) -> Iterator[Coordinate]:
+        """
+        Return an iterator over all coordinates in the grid.
+
+        Returns
+        -------
+        Iterator[Coordinate]
+            An iterator over all coordinates in the grid.
+        """
+        for x in range(self.width):
+            for y in range(self.height):
+                yield Coordinate(x, y)
+
+    def spaces(self) -> Iterator[Space]:
+        """
+        Return an iterator over the occupied Spaces in the grid.
+
+        Returns
+        -------
+        Iterator[Space]
+            An iterator over the occupied Spaces in the grid.
+        """
+        for chunk in list(self._chunks.values()):
+            yield from list(chunk.spaces.values())
+
+    def contents(self, object_type: Union[str, Coordinate] = None) -> Iterator[Any]:
+        """
+        Return an iterator over the contents of the grid.
+
+        Parameters
+        ----------
+        object_type: str or Coordinate, optional
+            The type of contents to return, or the position to return the
+            contents of. Defaults to all contents.
+
+        Returns
+        -------
+        Iterator[Any], [<Dooder>, <Energy>, <Dooder>, <Energy>]
+            An iterator over the matching contents.
+        """
+        if object_type is None:
+            for space in self.spaces():
+                yield from space.contents
+        elif isinstance(object_type, str):
+            for chunk in list(self._chunks.values()):
+                if object_type not in chunk.layers:
+                    continue
+                for space in list(chunk.spaces.values()):
+                    for object in space.contents:
+                        if object.__class__.__name__ == object_type:
+                            yield object
+        else:
+            x, y = object_type
+            yield from self._space(x, y).contents
+
+    def _neighbour_offsets(
+        self, moore: bool, include_center: bool, radius: int
+    ) -> np.ndarray:
+        """
+        Return the (k, 2) neighbourhood offsets, in nearby_coordinates order.
+        """
+        key = (moore, include_center, radius)
+        offsets = self._offsets.get(key)
+
+        if offsets is None:
+            offsets = [
+                (dx, dy)
+                for dy in range(-radius, radius + 1)
+                for dx in range(-radius, radius + 1)
+                if (dx or dy or include_center)
+                and (moore or abs(dx) + abs(dy) <= radius)
+            ]
+            offsets = np.array(offsets, dtype=np.int64).reshape(-1, 2)
+            self._offsets[key] = offsets
+
+        return offsets
+
+    def _nearby_indices(
+        self, position: Coordinate, moore: bool, include_center: bool, radius: int
+    ) -> np.ndarray:
+        """
+        Return the flat indices of the cells nearby a position, from the
+        offsets instead of the dense neighbourhood table.
+        """
+        x, y = position
+        offsets = self._neighbour_offsets(moore, include_center, radius)
+        xs = x + offsets[:, 0]
+        ys = y + offsets[:, 1]
+
+        if self.torus:
+            xs %= self.width
+            ys %= self.height
+        else:
+            inside = (xs >= 0) & (xs < self.width) & (ys >= 0) & (ys < self.height)
+            xs, ys = xs[inside], ys[inside]
+
+        return xs * self.height + ys
+
+    def nearby_coordinates(
+        self,
+        position: Coordinate,
+        moore: bool = True,
+        include_center: bool = False,
+        radius: int = 1,
+    ) -> List[Coordinate]:
+        """
+        Return a list of coordinates nearby a given position.
+
+        See Grid.nearby_coordinates.
+        """
+        x, y = position
+        coordinates = []
+
+        for dx, dy in self._neighbour_offsets(moore, include_center, radius):
+            coord = (x + int(dx), y + int(dy))
+            if self.out_of_bounds(coord):
+                if not self.torus:
+                    continue
+                coord = self.torus_adjustment(coord)
+            coordinates.append(coord)
+
+        return coordinates
+
+    def nearby_spaces(
+        self,
+        position: Coordinate,
+        moore: bool = True,
+        include_center: bool = True,
+        radius: int = 1,
+    ) -> List[Space]:
+        """
+        Return a list of Spaces nearby a given position.
+
+        See Grid.nearby_spaces.
+        """
+        nearby = self.nearby_coordinates(position, moore, include_center, radius)
+        return [self._space(x, y) for x, y in nearby]
+
+    def nearby_contents(
+        self,
+        position: Coordinate,
+        moore: bool = True,
+        include_center: bool = False,
+        radius: int = 1,
+    ) -> List[Any]:
+        """
+        Return a list of the contents nearby a given position.
+
+        See Grid.nearby_contents.
+        """
+        nearby = self.nearby_coordinates(position, moore, include_center, radius)
+        return [self._space(x, y).contents for x, y in nearby]
+
+    def __iter__(self) -> Iterator[Space]:
+        """
+        Iterate over the occupied Spaces of the grid.
+        """
+        return self.spaces()
+
+    def __getitem__(self, value: Union[int, tuple, list, str]) -> Any:
+        """
+        Return a column, a Space, a list of Spaces, or the Space holding an
+        object id, like Grid.
+        """
+        if isinstance(value, int):
+            return [self._space(value, y) for y in range(self.height)]
+        elif isinstance(value, tuple):
+            return self._space(*self.torus_adjustment(value))
+        elif isinstance(value, list):
+            return [self._space(*self.torus_adjustment(pos)) for pos in value]
+        elif isinstance(value, str):
+            position = self._object_index.get(value)
+            if position is not None:
+                return self._space(*position)
+        else:
+            raise NotImplementedError(f"Type {type(value)} is unsupported")
+
+    @property
+    def state(self) -> Dict:
+        """
+        Return the state of the grid.
+
+        Returns
+        -------
+        Dict, {'width': 10, 'height': 10, 'torus': False, 'chunk_size': 16}
+            The state of the grid.
+        """
+        return {**super().state, "chunk_size": self.chunk_size}
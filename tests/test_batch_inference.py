@@ -0,0 +1,70 @@
+import unittest
+
+import numpy as np
+
+from dooders.sdk.core.default_settings import default_settings
+from dooders.sdk.learning.batch import BatchInference, PopulationInference
+from dooders.sdk.learning.scratch.model import SimpleNeuralNet
+from dooders.sdk.modules.internal_models import InternalModels
+
+MODEL_SETTINGS = default_settings["internal_models"]
+
+
+class TestBatchInference(unittest.TestCase):
+    def setUp(self):
+        self.networks = [
+            SimpleNeuralNet(str(i), MODEL_SETTINGS["energy_detection"])
+            for i in range(5)
+        ]
+        for network in self.networks:
+            network.built = True
+        self.inputs = np.random.randint(0, 2, size=(5, 9)).astype("uint8")
+
+    def test_forward_matches_predict(self):
+        batch_output = BatchInference(self.networks).forward(self.inputs)[-1]
+
+        for i, network in enumerate(self.networks):
+            expected = network.model.forward(self.inputs[i : i + 1], training=False)
+            np.testing.assert_allclose(batch_output[i : i + 1], expected)
+
+    def test_primed_predict_and_learn(self):
+        expected = [
+            network.model.forward(self.inputs[i : i + 1], training=False)
+            for i, network in enumerate(self.networks)
+        ]
+        BatchInference(self.networks).prime(self.inputs)
+
+        for i, network in enumerate(self.networks):
+            self.assertIsNotNone(network.primed)
+            output = network.predict(self.inputs[i : i + 1])
+            self.assertIsNone(network.primed)
+            np.testing.assert_allclose(output, expected[i])
+            network.learn(self.inputs[i : i + 1])
+
+    def test_primed_input_mismatch(self):
+        BatchInference(self.networks).prime(self.inputs)
+        other_input = 1 - self.inputs[0:1]
+        output = self.networks[0].predict(other_input)
+        expected = self.networks[0].model.forward(other_input, training=False)
+        np.testing.assert_allclose(output, expected)
+
+    def test_population_inference(self):
+        population = [InternalModels(str(i), MODEL_SETTINGS) for i in range(3)]
+        for models in population:
+            for network in models.values():
+                network.built = True
+        perceptions = {"energy_detection": self.inputs[:3]}
+        decisions = PopulationInference(population, ["energy_detection"]).prime(
+            perceptions
+        )
+        self.assertEqual(decisions.shape, (3, 9))
+
+        for i, models in enumerate(population):
+            sensed = models["energy_detection"].predict(self.inputs[i : i + 1])
+            fixed = (sensed.astype("float32") >= 0.5).astype("uint8")
+            decision = models["move_decision"].predict(fixed)
+            np.testing.assert_allclose(decision, decisions[i : i + 1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+import unittest
+
+import numpy as np
+
+from dooders.sdk.core.default_settings import default_settings
+from dooders.sdk.learning.scratch.layer import Layer_BinaryDense, Layer_Dense
+from dooders.sdk.learning.scratch.model import SimpleNeuralNet
+
+MODEL_SETTINGS = default_settings["internal_models"]
+
+
+class TestLayerBinaryDense(unittest.TestCase):
+    def setUp(self):
+        self.sparse = Layer_BinaryDense(9, 16, dtype="float32")
+        self.sparse.biases += np.random.randn(1, 16).astype("float32")
+        self.dense = Layer_Dense(9, 16, dtype="float32")
+        self.dense.weights = self.sparse.weights
+        self.dense.biases = self.sparse.biases
+        self.inputs = np.random.randint(0, 2, size=(5, 9)).astype("uint8")
+        self.inputs[0] = 0
+
+    def test_forward_matches_dense(self):
+        for inputs in (self.inputs, self.inputs[1:2]):
+            self.sparse.forward(inputs, training=True)
+            self.dense.forward(inputs, training=True)
+            self.assertIsNotNone(self.sparse.active)
+            np.testing.assert_allclose(self.sparse.output, self.dense.output, rtol=1e-5)
+            np.testing.assert_allclose(
+                self.sparse.infer(inputs), self.dense.output, rtol=1e-5
+            )
+
+    def test_backward_matches_dense(self):
+        dvalues = np.random.randn(5, 16).astype("float32")
+        self.sparse.forward(self.inputs, training=True)
+        self.dense.forward(self.inputs, training=True)
+        self.sparse.backward(dvalues)
+        self.dense.backward(dvalues)
+
+        np.testing.assert_allclose(
+            self.sparse.dweights, self.dense.dweights, rtol=1e-5, atol=1e-6
+        )
+        np.testing.assert_allclose(self.sparse.dbiases, self.dense.dbiases)
+        np.testing.assert_allclose(self.sparse.dinputs, self.dense.dinputs, rtol=1e-5)
+
+        inactive = self.inputs.sum(axis=0) == 0
+        self.assertFalse(self.sparse.dweights[inactive].any())
+
+    def test_non_binary_inputs_take_dense_path(self):
+        inputs = np.random.rand(2, 9).astype("float32")
+        self.sparse.forward(inputs, training=True)
+        self.dense.forward(inputs, training=True)
+        self.assertIsNone(self.sparse.active)
+        np.testing.assert_allclose(self.sparse.output, self.dense.output)
+
+    def test_network_input_layer(self):
+        network = SimpleNeuralNet("0", MODEL_SETTINGS["energy_detection"])
+        self.assertIsInstance(network.layers[0], Layer_BinaryDense)
+
+        settings = dict(MODEL_SETTINGS["energy_detection"], binary_inputs=False)
+        network = SimpleNeuralNet("1", settings)
+        self.assertNotIsInstance(network.layers[0], Layer_BinaryDense)
+
+    def test_replay_forward(self):
+        model = SimpleNeuralNet("0", MODEL_SETTINGS["energy_detection"]).model
+        layer = model.layers[0]
+        model.forward(self.inputs, training=True)
+
+        outputs = []
+        model.infer(self.inputs[1:2], outputs)
+        model.replay_forward(self.inputs[1:2], outputs)
+        for active, expected in zip(layer.active, np.nonzero(self.inputs[1:2])):
+            np.testing.assert_array_equal(active, expected)
+
+        # The frozen input layer has no gradients to compute
+        self.assertNotIn(layer, model.backward_layers)
+        self.assertIs(model.backward_layers[0], model.trainable_layers[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+import copy
+import unittest
+
+import numpy as np
+
+from dooders.sdk.core.default_settings import default_settings
+from dooders.sdk.learning.cache import InferenceCache
+from dooders.sdk.learning.scratch.model import SimpleNeuralNet
+
+MODEL_SETTINGS = default_settings["internal_models"]
+
+
+class TestBuffers(unittest.TestCase):
+    def setUp(self):
+        self.network = SimpleNeuralNet("0", MODEL_SETTINGS["move_decision"])
+        self.network.built = True
+        self.model = self.network.model
+
+    def test_buffers_reused(self):
+        x = np.random.randint(0, 2, size=(1, 9)).astype("uint8")
+        self.network.predict(x)
+        self.network.learn(np.eye(9)[[0]])
+        arrays = [layer.output for layer in self.model.layers]
+        gradients = [layer.dinputs for layer in self.model.backward_layers]
+
+        self.network.predict(1 - x)
+        self.network.learn(np.eye(9)[[1]])
+        for layer, output in zip(self.model.layers, arrays):
+            self.assertIs(layer.output, output)
+        for layer, dinputs in zip(self.model.backward_layers, gradients):
+            self.assertIs(layer.dinputs, dinputs)
+
+        self.model.forward(np.ones((3, 9), dtype="uint8"), training=False)
+        self.assertEqual(self.model.layers[-1].output.shape, (3, 9))
+        self.assertIsNot(self.model.layers[-1].output, arrays[-1])
+
+    def test_matches_unbuffered_model(self):
+        unbuffered = copy.deepcopy(self.network)
+        for layer in unbuffered.model.layers + [unbuffered.model.loss]:
+            layer.buffers = None
+
+        for i in range(3):
+            x = np.random.randint(0, 2, size=(1, 9)).astype("uint8")
+            reality = np.eye(9)[[i]]
+            for network in (self.network, unbuffered):
+                network.predict(x)
+                network.learn(reality)
+
+        for weights, expected in zip(self.network.weights, unbuffered.weights):
+            np.testing.assert_allclose(weights, expected, rtol=1e-6)
+
+    def test_multilabel_loss_buffers(self):
+        network = SimpleNeuralNet("0", MODEL_SETTINGS["energy_detection"])
+        network.built = True
+        unbuffered = copy.deepcopy(network)
+        unbuffered.model.loss.buffers = None
+        x = np.array([[0, 1, 0, 0, 1, 0, 0, 0, 1]], dtype="uint8")
+
+        network.predict(x)
+        network.learn([1, 4])
+        dinputs = network.model.loss.dinputs
+        for reality in ([1, 4], [8]):
+            for model in (network, unbuffered):
+                model.predict(x)
+                model.learn(reality)
+
+            self.assertIs(network.model.loss.dinputs, dinputs)
+            np.testing.assert_array_equal(dinputs, unbuffered.model.loss.dinputs)
+
+    def test_cached_outputs_not_overwritten(self):
+        self.network.use_cache(InferenceCache(shared=False))
+        x = np.array([[1, 0, 0, 0, 0, 0, 0, 0, 0]], dtype="uint8")
+        first = self.network.predict(x).copy()
+        self.network.predict(1 - x)
+
+        np.testing.assert_array_equal(self.network.predict(x), first)
+
+
+if __name__ == "__main__":
+    unittest.main()
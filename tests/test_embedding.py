@@ -0,0 +1,59 @@
+import unittest
+
+import numpy as np
+from sklearn.decomposition import PCA
+
+from dooders.sdk.modules.embedding import GeneEmbedding
+from dooders.sdk.modules.selection import get_embeddings
+
+
+class TestGeneEmbedding(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.weights = [
+            rng.standard_normal((9, 64)).astype("float16"),
+            rng.standard_normal((64, 9)).astype("float32"),
+            rng.standard_normal((9, 64)).astype("float16"),
+        ]
+        self.embedding = GeneEmbedding(n_components=3)
+
+    def test_matches_pca(self):
+        embeddings = self.embedding.embed_many(self.weights)
+
+        for weights, embedding in zip(self.weights, embeddings):
+            expected = PCA(n_components=3).fit(weights).singular_values_
+            np.testing.assert_allclose(embedding, expected, rtol=1e-5)
+
+    def test_cache(self):
+        first = self.embedding.embed_many(self.weights + [self.weights[0].copy()])
+        self.assertEqual(len(self.embedding.entries), 3)
+        self.assertIs(first[0], first[3])
+
+        second = self.embedding.embed(self.weights[1].copy())
+        self.assertIs(second, first[1])
+        self.assertEqual(self.embedding.hits, 1)
+
+        changed = self.weights[1].copy()
+        changed[0, 0] += 1
+        self.embedding.embed(changed)
+        self.assertEqual(len(self.embedding.entries), 4)
+
+    def test_max_size(self):
+        embedding = GeneEmbedding(max_size=2)
+        embedding.embed_many(self.weights)
+        self.assertEqual(len(embedding.entries), 2)
+
+    def test_get_embeddings(self):
+        gene_pool = {
+            "0": {"move_decision": [self.weights[0], self.weights[1]]},
+            "1": {"move_decision": [self.weights[2], self.weights[1]]},
+        }
+        embeddings = get_embeddings(gene_pool)
+
+        self.assertEqual(len(embeddings), 2)
+        self.assertEqual(embeddings[0]["dynamic"], embeddings[1]["dynamic"])
+        self.assertEqual(len(embeddings[1]["static"]), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
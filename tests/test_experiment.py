@@ -3,9 +3,44 @@ import os
 import unittest.mock
 from unittest.mock import Mock, patch
 
+import random
+
+import numpy as np
 import pytest
 
-from dooders.experiment import Experiment
+from dooders.experiment import Experiment, seed_simulation
+
+
+class FakeDooder:
+    def __init__(self, id):
+        self.id = id
+        self.internal_models = Mock(weights={"move_decision": [np.ones(2)]})
+
+
+class FakeSimulation:
+    def __init__(self, seed):
+        # A Simulation seeds the global generators from its seed
+        seed_simulation(seed)
+
+    def run_simulation(self, batch=False):
+        self.simulation_summary = {"draw": (random.random(), np.random.random())}
+        self.state = {}
+
+
+class FakeExperiment(Experiment):
+    """ Runs a fake simulation that only draws random numbers """
+
+    experiment_results = {}
+
+    def create_simulation(self, seed=None):
+        return FakeSimulation(seed)
+
+    def get_objects(self, object_type="Entity"):
+        return [FakeDooder(f"{self.simulation.simulation_summary['draw'][0]}")]
+
+
+def add_tag(experiment):
+    experiment.simulation.tag = "custom"
 
 
 class TestExperiment:
@@ -17,7 +52,7 @@ class TestExperiment:
     def test_create_simulation(self, experiment):
         with patch('dooders.sdk.core.Assemble.execute') as mock_execute:
             experiment.create_simulation()
-            mock_execute.assert_called_once_with(experiment.settings)
+            mock_execute.assert_called_once_with(experiment.settings, seed=None)
 
     def test_simulate(self, experiment):
         with patch.object(experiment, 'create_simulation') as mock_create_simulation, \
@@ -55,6 +90,35 @@ class TestExperiment:
             mock_dump.assert_called_once_with(
                 object_to_save, mock_open.return_value.__enter__.return_value)  # Corrected line
 
+    def test_batch_simulate_workers(self):
+        settings = {"GenePool": "retain"}
+        results = []
+        for workers in (1, 2):
+            experiment = FakeExperiment("Test", settings)
+            experiment.experiment_results.clear()
+            experiment.batch_simulate(4, custom_logic=add_tag, workers=workers, seed=7)
+            results.append((dict(experiment.experiment_results), experiment.gene_pool))
+
+        (serial, serial_pool), (parallel, parallel_pool) = results
+        assert serial == parallel
+        assert list(serial_pool) == list(parallel_pool)
+        draws = [result["summary"]["draw"] for result in serial.values()]
+        assert len(set(draws)) == 4
+
+    def test_batch_simulate_workers_simulations(self):
+        summaries = []
+        for workers in (1, 2, 1):
+            experiment = Experiment(None, {"MaxCycles": 30, "GenePool": "retain"})
+            experiment.experiment_results = {}
+            experiment.batch_simulate(3, workers=workers, seed=3, progress_bar=False)
+            summaries.append([
+                {key: result["summary"][key]
+                 for key in ("CycleCount", "ConsumedEnergy", "TotalEnergy")}
+                for _, result in sorted(experiment.experiment_results.items())
+            ])
+
+        assert summaries[0] == summaries[1] == summaries[2]
+
     # def test_load_state(self, experiment):
     #     with patch('builtins.open', new_callable=unittest.mock.mock_open()) as mock_open, \
     #             patch('json.load') as mock_load:
@@ -100,4 +100,141 @@
 #     assert grid[0,0].position == (0,0)
 #     assert grid[0][0].position == (0,0)
 #     assert len(grid['all']) == 2
-#     assert type(grid['all']) == list
\ No newline at end of file
+#     assert type(grid['all']) == list
+
+import unittest
+
+import numpy as np
+
+from dooders.sdk.base.coordinate import Coordinate
+from dooders.sdk.modules.perception import Perception
+from dooders.sdk.surfaces.grid import Grid
+
+
+class Energy:
+    def __init__(self, id):
+        self.id = id
+        self.position = None
+
+
+class Dooder(Energy):
+    pass
+
+
+class TestGridLayers(unittest.TestCase):
+    def setUp(self):
+        self.grid = Grid({"height": 4, "width": 5, "torus": True})
+        self.energy = [Energy(f"energy_{i}") for i in range(3)]
+        self.dooder = Dooder("dooder_0")
+        self.grid.add(self.energy[0], (0, 0))
+        self.grid.add(self.energy[1], (0, 0))
+        self.grid.add(self.energy[2], (2, 3))
+        self.grid.add(self.dooder, (2, 3))
+
+    def test_layer_counts(self):
+        layer = self.grid.layer("Energy")
+        self.assertEqual(layer.shape, (5, 4))
+        self.assertEqual(layer[0, 0], 2)
+        self.assertEqual(layer[2, 3], 1)
+        self.assertEqual(layer.sum(), 3)
+        self.assertFalse(layer.flags.writeable)
+        self.assertEqual(self.grid.layer("Hazard").sum(), 0)
+
+    def test_incremental_updates(self):
+        layer = self.grid.layer("Energy")
+        self.grid.remove(self.energy[0])
+        self.grid.remove(self.energy[2].id)
+        self.grid.move(self.energy[1], (4, 1))
+
+        np.testing.assert_array_equal(np.argwhere(layer), [[4, 1]])
+        self.assertEqual(self.energy[1].position, (4, 1))
+        self.assertEqual(list(self.grid.contents("Energy")), [self.energy[1]])
+
+    def test_has(self):
+        self.assertTrue(self.grid.has((0, 0), "Energy"))
+        self.assertFalse(self.grid.has((1, 0), "Energy"))
+        self.assertTrue(self.grid.has((2, 3), "Dooder"))
+        self.assertFalse(self.grid.has((2, 3), "Dooder", ignore=self.dooder))
+
+    def test_add_coordinate(self):
+        energy = Energy("energy_3")
+        self.grid.add(energy, Coordinate(1, 2))
+        self.assertEqual(self.grid.layer("Energy")[1, 2], 1)
+
+        self.grid.remove(energy)
+        self.assertEqual(self.grid.layer("Energy")[1, 2], 0)
+
+    def test_has_ignores_list_position(self):
+        dooder = Dooder("dooder_1")
+        self.grid.add(dooder, [1, 1])
+        self.assertTrue(self.grid.has((1, 1), "Dooder"))
+        self.assertFalse(self.grid.has((1, 1), "Dooder", ignore=dooder))
+        self.assertFalse(self.grid.has(Coordinate(1, 1), "Dooder", ignore=dooder))
+
+    def test_perception_batch_matches_perception(self):
+        # Dooders placed at list positions, as SeedPlacement does
+        dooders = [Dooder("dooder_1"), Dooder("dooder_2")]
+        self.grid.add(dooders[0], [4, 2])
+        self.grid.add(dooders[1], [0, 1])
+        observers = [dooders[1], self.dooder, dooders[0]]
+        positions = [(0, 1), (2, 3), (4, 2)]
+
+        batch = self.grid.perception_batch(
+            positions, ["Dooder", "Energy"], ignore="Dooder"
+        )
+        self.assertEqual(batch.shape, (3, 18))
+        self.assertEqual(batch.dtype, np.uint8)
+
+        for row, position, dooder in zip(batch, positions, observers):
+            # Without a surface, Perception answers from Space.has
+            perception = Perception(self.grid.nearby_spaces(position), dooder)
+            expected = perception.array(["Dooder", "Energy"])[0]
+            np.testing.assert_array_equal(row, expected)
+
+
+class TestGridNeighbourhood(unittest.TestCase):
+    def expected(self, grid, position, moore, include_center, radius):
+        coordinates = []
+        x, y = position
+        for dy in range(-radius, radius + 1):
+            for dx in range(-radius, radius + 1):
+                if dx == 0 and dy == 0 and not include_center:
+                    continue
+                if not moore and abs(dx) + abs(dy) > radius:
+                    continue
+                coord = (x + dx, y + dy)
+                if grid.out_of_bounds(coord):
+                    if not grid.torus:
+                        continue
+                    coord = grid.torus_adjustment(coord)
+                coordinates.append(coord)
+        return coordinates
+
+    def test_matches_neighbour_scan(self):
+        for torus in (True, False):
+            grid = Grid({"height": 4, "width": 5, "torus": torus})
+            for moore, include_center, radius in [
+                (True, False, 1),
+                (True, True, 1),
+                (False, True, 2),
+            ]:
+                for position in grid.coordinates():
+                    position = tuple(position)
+                    self.assertEqual(
+                        grid.nearby_coordinates(position, moore, include_center, radius),
+                        self.expected(grid, position, moore, include_center, radius),
+                    )
+
+    def test_table(self):
+        grid = Grid({"height": 4, "width": 5, "torus": False})
+        table = grid.neighbourhood(True, True, 1)
+        self.assertEqual(table.shape, (20, 9))
+        self.assertEqual(table.dtype, np.int32)
+        self.assertIs(table, grid.neighbourhood(True, True, 1))
+        self.assertEqual((table[0] == -1).sum(), 5)
+        spaces = grid.nearby_spaces((1, 1))
+        self.assertEqual([s.coordinates for s in spaces][4], grid[(1, 1)].coordinates)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import copy
+import unittest
+
+import numpy as np
+
+from dooders.sdk.core.default_settings import default_settings
+from dooders.sdk.learning.cache import InferenceCache
+from dooders.sdk.learning.scratch.model import SimpleNeuralNet
+
+MODEL_SETTINGS = default_settings["internal_models"]
+
+
+class TestInferenceCache(unittest.TestCase):
+    def setUp(self):
+        self.network = SimpleNeuralNet("0", MODEL_SETTINGS["energy_detection"])
+        self.network.built = True
+        self.input = np.array([[1, 0, 0, 1, 0, 0, 0, 1, 0]], dtype="uint8")
+
+    def test_key(self):
+        self.assertIsNone(InferenceCache.key(np.array([[0.5, 1.0]])))
+        self.assertIsNone(InferenceCache.key(np.array([[2, 1]])))
+        self.assertNotEqual(
+            InferenceCache.key(np.array([[1, 0]])), InferenceCache.key(np.array([[1]]))
+        )
+
+    def test_hit_and_invalidation(self):
+        cache = InferenceCache(shared=False)
+        self.network.use_cache(cache)
+        first = self.network.predict(self.input)
+        second = self.network.predict(self.input)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        np.testing.assert_allclose(first, second)
+
+        self.network.learn(np.eye(9)[[2]])
+        self.assertEqual(len(cache.entries), 0)
+        learned = self.network.predict(self.input)
+        expected = self.network.model.forward(self.input, training=False)
+        np.testing.assert_allclose(learned, expected)
+
+    def test_shared_by_identical_weights(self):
+        cache = InferenceCache()
+        twin = copy.deepcopy(self.network)
+        self.network.use_cache(cache)
+        twin.use_cache(cache)
+
+        self.network.predict(self.input)
+        output = twin.predict(self.input)
+        self.assertEqual(cache.hits, 1)
+        np.testing.assert_allclose(
+            output, twin.model.forward(self.input, training=False)
+        )
+
+        twin.inherit_weights([w * 2 for w in twin.weights])
+        twin.predict(self.input)
+        self.assertEqual(cache.hits, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
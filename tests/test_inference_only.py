@@ -0,0 +1,62 @@
+import unittest
+
+import numpy as np
+
+from dooders.sdk.core.assemble import Assemble
+from dooders.sdk.core.default_settings import default_settings
+from dooders.sdk.learning.cache import InferenceCache
+from dooders.sdk.modules.internal_models import InternalModels
+
+MODEL_SETTINGS = default_settings["internal_models"]
+
+
+class TestInferenceOnly(unittest.TestCase):
+    def setUp(self):
+        self.models = InternalModels("0", MODEL_SETTINGS, inference_only=True)
+        self.network = self.models["energy_detection"]
+        self.network.built = True
+        self.input = np.array([[0, 1, 0, 0, 1, 0, 0, 0, 1]], dtype="uint8")
+
+    def test_lean_predict(self):
+        self.assertTrue(self.models.inference_only)
+        self.assertIsNone(self.network.model.optimizer)
+
+        output = self.network.predict(self.input)
+        expected = self.network.model.forward(self.input, training=False)
+        np.testing.assert_allclose(output, expected)
+
+    def test_no_learning_state(self):
+        weights = [w.copy() for w in self.network.weights]
+        self.network.predict(self.input)
+        self.assertFalse(hasattr(self.network, "input"))
+        self.assertFalse(hasattr(self.network.layers[0], "inputs"))
+
+        self.network.learn(np.eye(9)[[1]])
+        for before, after in zip(weights, self.network.weights):
+            np.testing.assert_array_equal(before, after)
+        self.assertIsNone(self.network.model.optimizer)
+
+    def test_cache_and_switch_back(self):
+        cache = InferenceCache()
+        self.models.use_cache(cache)
+        first = self.network.predict(self.input)
+        np.testing.assert_allclose(self.network.predict(self.input), first)
+        self.assertEqual(cache.hits, 1)
+
+        self.models.set_inference_only(False)
+        np.testing.assert_allclose(self.network.predict(self.input), first)
+        self.assertEqual(cache.hits, 2)
+        self.network.learn(np.eye(9)[[1]])
+        self.assertIn(self.network.layers[2], self.network.model.optimizer.cache)
+
+
+class TestArenaInferenceOnly(unittest.TestCase):
+    def test_setting(self):
+        simulation = Assemble.execute({"MaxCycles": 3, "InferenceOnly": True}, seed=0)
+        self.assertTrue(simulation.arena.active_dooders)
+        for dooder in simulation.arena.active_dooders.values():
+            self.assertTrue(dooder.internal_models.inference_only)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+import unittest
+
+import numpy as np
+
+from dooders.sdk.core.default_settings import default_settings
+from dooders.sdk.learning.scratch.model import SimpleNeuralNet
+from dooders.sdk.learning.scratch.plan import InferencePlan
+
+MODEL_SETTINGS = default_settings["internal_models"]
+
+
+class TestInferencePlan(unittest.TestCase):
+    def setUp(self):
+        self.networks = []
+        for name in ("energy_detection", "move_decision"):
+            network = SimpleNeuralNet(name, MODEL_SETTINGS[name])
+            network.built = True
+            self.networks.append(network)
+
+    def test_matches_forward(self):
+        inputs = np.random.randint(0, 2, size=(4, 9)).astype("uint8")
+        for network in self.networks:
+            self.assertIsInstance(network.plan, InferencePlan)
+            for x in (inputs[:1], inputs, inputs.astype("float32")):
+                outputs = []
+                output = network.plan(x, outputs)
+                expected = network.model.forward(x, training=False)
+                np.testing.assert_array_equal(output, expected)
+                for layer, layer_output in zip(network.model.layers, outputs):
+                    np.testing.assert_array_equal(layer_output, layer.output)
+
+    def test_follows_inherited_weights(self):
+        parent = SimpleNeuralNet("parent", MODEL_SETTINGS["move_decision"])
+        child = self.networks[1]
+        child.inherit_weights(parent.weights)
+        x = np.random.randint(0, 2, size=(1, 9)).astype("uint8")
+
+        np.testing.assert_array_equal(
+            child.plan(x), parent.model.forward(x, training=False)
+        )
+
+    def test_inference_only_uses_plan(self):
+        network = self.networks[0]
+        x = np.random.randint(0, 2, size=(1, 9)).astype("uint8")
+        expected = network.model.forward(x, training=False).copy()
+        network.set_inference_only(True)
+        calls = []
+        plan = network.plan
+        network.plan = lambda *args: calls.append(args) or plan(*args)
+
+        np.testing.assert_array_equal(network.predict(x), expected)
+        self.assertEqual(len(calls), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+import unittest
+
+import numpy as np
+
+from dooders.sdk.core.default_settings import default_settings
+from dooders.sdk.learning.cache import InferenceCache
+from dooders.sdk.models.dooder import Dooder
+from dooders.sdk.modules.internal_models import InternalModels
+
+MODEL_SETTINGS = default_settings["internal_models"]
+
+
+class TestLazyInternalModels(unittest.TestCase):
+    def test_dooder_builds_active_models(self):
+        models = Dooder().internal_models
+        self.assertEqual(set(models), {"energy_detection", "move_decision"})
+        self.assertIn("dooder_detection", models.instructions)
+
+    def test_built_on_first_access(self):
+        cache = InferenceCache()
+        models = InternalModels("0", MODEL_SETTINGS, active=[])
+        models.use_cache(cache)
+        self.assertEqual(len(models), 0)
+
+        model = models.get("hazard_detection")
+        self.assertIs(models["hazard_detection"], model)
+        self.assertIs(model.inference_cache, cache)
+        self.assertIsNone(models.get("unknown"))
+        with self.assertRaises(KeyError):
+            models["unknown"]
+
+    def test_inherit_builds_models(self):
+        parent = InternalModels("0", MODEL_SETTINGS, active=["move_decision"])
+        child = InternalModels("1", MODEL_SETTINGS, active=[])
+        child.inherit_weights(parent.weights)
+        self.assertEqual(list(child), ["move_decision"])
+        self.assertIs(
+            child["move_decision"].layers[2].weights,
+            parent["move_decision"].weights[1],
+        )
+
+    def test_rng(self):
+        def weights(seed):
+            models = InternalModels(
+                "0", MODEL_SETTINGS, active=[], rng=np.random.default_rng(seed)
+            )
+            return models["move_decision"].weights
+
+        for first, second in zip(weights(1), weights(1)):
+            np.testing.assert_array_equal(first, second)
+        self.assertFalse(np.array_equal(weights(1)[1], weights(2)[1]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+import unittest
+
+from dooders.experiments.island_model import (DEFAULT_SETTINGS, island_model,
+                                              migrate)
+from dooders.sdk.modules.selection import select_top
+
+
+class TestIslandModel(unittest.TestCase):
+    def setUp(self):
+        self.gene_pool = {id: {"move_decision": [id]} for id in "abcd"}
+        self.fitness = {"a": 10.0, "b": 40.0, "c": 20.0}
+
+    def test_select_top(self):
+        top = select_top(self.gene_pool, self.fitness, 3)
+        self.assertEqual(list(top), ["b", "c", "a"])
+
+    def test_migrate(self):
+        migrants = {"x": {}, "y": {}}
+        gene_pool = migrate(self.gene_pool, self.fitness, migrants)
+        self.assertEqual(set(gene_pool), {"b", "c", "x", "y"})
+
+        gene_pool = migrate({"a": {}}, self.fitness, migrants)
+        self.assertEqual(set(gene_pool), {"x", "y"})
+
+        migrants = {id: {} for id in "vwxyz"}
+        gene_pool = migrate({id: {} for id in "abc"}, self.fitness, migrants)
+        self.assertEqual(set(gene_pool), set(migrants))
+
+        self.assertEqual(select_top(self.gene_pool, self.fitness, -2), {})
+
+    def test_island_model(self):
+        settings = {**DEFAULT_SETTINGS,
+                    "SimulationCount": 12,
+                    "MaxCycles": 6,
+                    "Lockstep": True,
+                    "Islands": 2,
+                    "MigrationInterval": 2,
+                    "MigrationSize": 2,
+                    "Seed": 5}
+
+        results = island_model(settings, "test_island_model", 3)
+        self.assertEqual(len(results["islands"]), 2)
+
+        for island in results["islands"]:
+            self.assertEqual(len(island["fit_dooder_counts"]), 3)
+            self.assertEqual(island["migrations"], [1])
+
+        again = island_model(settings, "test_island_model", 3)
+        self.assertEqual(
+            [island["fit_dooder_counts"] for island in results["islands"]],
+            [island["fit_dooder_counts"] for island in again["islands"]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+import copy
+import unittest
+
+import numpy as np
+
+from dooders.sdk.core.assemble import Assemble
+from dooders.sdk.core.default_settings import default_settings
+from dooders.sdk.learning.scratch.model import SimpleNeuralNet
+from dooders.sdk.learning.scratch.optimizer import Optimizer_Adam_Population
+from dooders.sdk.learning.workers import LearningPool
+
+MODEL_SETTINGS = default_settings["internal_models"]
+
+
+class TestLearningPool(unittest.TestCase):
+    def setUp(self):
+        self.serial = []
+        for i in range(6):
+            network = SimpleNeuralNet(str(i), MODEL_SETTINGS["move_decision"])
+            network.built = True
+            self.serial.append(network)
+        self.pooled = [copy.deepcopy(network) for network in self.serial]
+        self.pool = LearningPool(workers=3)
+        for network in self.pooled:
+            network.use_learning_pool(self.pool)
+
+    def tearDown(self):
+        self.pool.shutdown()
+
+    def run_cycles(self, networks, cycles, optimizer=None, learn_twice=False):
+        rng = np.random.default_rng(0)
+        for _ in range(cycles):
+            for network in networks:
+                for _ in range(2 if learn_twice else 1):
+                    network.predict(rng.integers(0, 2, size=(1, 9), dtype="uint8"))
+                    network.learn(np.eye(9)[[rng.integers(9)]])
+            self.pool.barrier()
+            if optimizer is not None:
+                optimizer.step()
+
+    def assert_same_weights(self):
+        for serial, pooled in zip(self.serial, self.pooled):
+            for expected, weights in zip(serial.weights, pooled.weights):
+                np.testing.assert_array_equal(weights, expected)
+
+    def test_matches_serial_learning(self):
+        self.run_cycles(self.serial, 3)
+        self.run_cycles(self.pooled, 3)
+        self.assertEqual(len(self.pool), 0)
+        self.assert_same_weights()
+
+    def test_matches_serial_population_optimizer(self):
+        optimizers = [Optimizer_Adam_Population(), Optimizer_Adam_Population()]
+        for networks, optimizer in zip((self.serial, self.pooled), optimizers):
+            for network in networks:
+                network.share_optimizer(optimizer)
+            self.run_cycles(networks, 3, optimizer, learn_twice=True)
+
+        self.assert_same_weights()
+
+    def test_barrier_raises_errors(self):
+        network = self.pooled[0]
+        network.predict(np.ones((1, 9), dtype="uint8"))
+        network.learn([["not a number"]])
+
+        with self.assertRaises(ValueError):
+            self.pool.barrier()
+        self.assertEqual(len(self.pool), 0)
+
+
+class TestSimulationLearningPool(unittest.TestCase):
+    def test_shutdown_on_stop_and_reset(self):
+        settings = {"MaxCycles": 3, "BackgroundLearning": True, "LearningWorkers": 2}
+        simulation = Assemble.execute(settings, seed=0)
+        pool = simulation.arena.learning_pool
+        self.assertIsNotNone(pool)
+
+        simulation.reset()
+        self.assertTrue(pool.executor._shutdown)
+        pool = simulation.arena.learning_pool
+        self.assertIsNotNone(pool)
+
+        simulation.run_simulation(batch=True)
+        self.assertTrue(pool.executor._shutdown)
+        self.assertIsNone(simulation.arena.learning_pool)
+        for dooder in simulation.arena.active_dooders.values():
+            self.assertIsNone(dooder.internal_models._learning_pool)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,190 @@
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from dooders.experiment import Experiment
+from dooders.experiments.recursive_artificial_selection import InheritWeights
+from dooders.sdk.conditions.death import DeathConditions
+from dooders.sdk.core.core import _COMPONENTS, Component
+from dooders.sdk.lockstep import LockstepSimulation
+
+
+class TestLockstepSimulation(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(0)
+        self.engine = LockstepSimulation(
+            6, {"MaxCycles": 12}, np.random.default_rng(0)
+        )
+        self.engine.setup()
+
+    def test_setup(self):
+        engine = self.engine
+        self.assertEqual(engine.alive.shape, (6, 1))
+        self.assertTrue(engine.running.all())
+        self.assertTrue(((engine.energy_cell >= 0).sum(axis=1) == engine.allocated).all())
+
+    def test_rules(self):
+        engine = self.engine
+        position = engine.position.copy()
+        energy = engine.layer("Energy")
+        engine.step()
+
+        for index in range(engine.count):
+            nearby = engine.neighbourhood[position[index, 0]]
+            self.assertIn(engine.position[index, 0], nearby)
+            ate = energy[index, engine.position[index, 0]] > 0
+            self.assertEqual(engine.hunger[index, 0], 0 if ate else 1)
+            self.assertEqual(engine.energy_consumed[index, 0], int(ate))
+        self.assertTrue((engine.age == 1).all())
+        self.assertTrue((engine.cycle_number == 1).all())
+
+    def test_starvation(self):
+        engine = self.engine
+        engine.hunger[0, 0] = 5
+        engine.step()
+
+        self.assertFalse(engine.alive[0, 0])
+        self.assertEqual(engine.terminated[0, 0], 0)
+        engine.stop_conditions()
+        self.assertFalse(engine.running[0])
+
+    def test_default_rules(self):
+        old_age = classmethod(lambda cls, dooder: dooder.age > 3)
+        with mock.patch.object(DeathConditions, "old_age", old_age, create=True):
+            with self.assertRaises(ValueError):
+                LockstepSimulation(2, {"MaxCycles": 4})
+
+        step = Component("step", "dooders.sdk.steps", "dooder", "Step", None, "", True)
+        with mock.patch.dict(_COMPONENTS["step"]["dooder"], {"Step": step}):
+            with self.assertRaises(ValueError):
+                LockstepSimulation(2, {"MaxCycles": 4})
+
+    def test_results(self):
+        self.engine.run()
+        results = self.engine.results()
+        self.assertEqual(len(results), 6)
+
+        for index, result in enumerate(results):
+            summary, state = result["summary"], result["state"]
+            cycles = summary["CycleCount"]
+            information = state["information"]["resources"]
+            self.assertLessEqual(cycles, 12)
+            self.assertEqual(len(information["allocated_energy"]), max(cycles - 1, 0))
+            self.assertEqual(summary["TotalEnergy"], sum(information["allocated_energy"]))
+            self.assertEqual(summary["EndingDooderCount"], int(self.engine.alive[index].sum()))
+
+            (dooder,) = state["arena"].values()
+            self.assertEqual(len(dooder["inference_record"]), cycles)
+            if cycles < 12:
+                self.assertEqual(dooder["status"], "Terminated")
+
+
+class TestLockstepExperiment(unittest.TestCase):
+    def batch_simulate(self, lockstep):
+        experiment = Experiment("Test", {"MaxCycles": 8, "GenePool": "retain"})
+        experiment.experiment_results = {}
+        experiment.batch_simulate(4, lockstep=lockstep, seed=5)
+
+        return experiment
+
+    def test_matches_simulation(self):
+        experiments = [self.batch_simulate(lockstep) for lockstep in (False, True)]
+        results = [list(e.experiment_results.values()) for e in experiments]
+
+        for simulation, lockstep in zip(*results):
+            self.assertEqual(simulation["summary"].keys(), lockstep["summary"].keys())
+            self.assertEqual(simulation["state"].keys(), lockstep["state"].keys())
+            self.assertEqual(
+                simulation["summary"]["StartingDooderCount"],
+                lockstep["summary"]["StartingDooderCount"],
+            )
+
+            for result in (simulation, lockstep):
+                cycles = result["summary"]["CycleCount"]
+                for columns in result["state"]["information"].values():
+                    for column in columns.values():
+                        self.assertEqual(len(column), max(cycles - 1, 0))
+
+            for model in ("arena", "resources"):
+                self.assertEqual(
+                    simulation["state"]["information"][model].keys(),
+                    lockstep["state"]["information"][model].keys(),
+                )
+
+            for dooder in [*simulation["state"]["arena"].values(),
+                           *lockstep["state"]["arena"].values()]:
+                self.assertEqual(
+                    dooder.keys(),
+                    next(iter(lockstep["state"]["arena"].values())).keys(),
+                )
+
+        for experiment, result in zip(experiments, results):
+            passed = {
+                id
+                for simulation in result
+                for id, dooder in simulation["state"]["arena"].items()
+                if dooder["status"] == "Alive"
+            }
+            self.assertEqual(set(experiment.gene_pool), passed)
+
+        shapes = [
+            {
+                model: [np.shape(weights) for weights in layers]
+                for entry in experiment.gene_pool.values()
+                for model, layers in entry.items()
+            }
+            for experiment in experiments
+        ]
+        self.assertTrue(shapes[0])
+        self.assertEqual(shapes[0], shapes[1])
+
+    def test_matches_simulation_statistics(self):
+        # The engines draw differently, so the summaries of a fixed seed
+        # set are compared by their means, within three standard errors
+        summaries = []
+        for lockstep in (False, True):
+            experiment = Experiment("Test", {"MaxCycles": 20})
+            experiment.experiment_results = {}
+            experiment.batch_simulate(
+                60, lockstep=lockstep, seed=2, progress_bar=False
+            )
+            summaries.append(
+                [result["summary"] for result in experiment.experiment_results.values()]
+            )
+
+        for key in ("CycleCount", "ConsumedEnergy", "TotalEnergy"):
+            simulation, lockstep = (
+                np.array([summary[key] for summary in batch]) for batch in summaries
+            )
+            error = np.sqrt(
+                simulation.var(ddof=1) / len(simulation)
+                + lockstep.var(ddof=1) / len(lockstep)
+            )
+            self.assertLess(abs(simulation.mean() - lockstep.mean()), 3 * error, key)
+
+    def test_gene_pool(self):
+        settings = {"MaxCycles": 4, "GenePool": "retain"}
+        experiment = Experiment("Test", settings)
+        experiment.experiment_results = {}
+        experiment.batch_simulate(5, lockstep=True, seed=3)
+
+        self.assertEqual(len(experiment.experiment_results), 5)
+        passed = sum(
+            result["summary"]["EndingDooderCount"]
+            for result in experiment.experiment_results.values()
+        )
+        self.assertEqual(len(experiment.gene_pool), passed)
+
+        inherit = InheritWeights(experiment.gene_pool, "averaging")
+        offspring = Experiment("Test", settings)
+        offspring.experiment_results = {}
+        offspring.batch_simulate(3, custom_logic=inherit, lockstep=True, seed=4)
+        self.assertEqual(len(offspring.experiment_results), 3)
+
+        with self.assertRaises(ValueError):
+            offspring.batch_simulate(2, lockstep=True, workers=2)
+
+
+if __name__ == "__main__":
+    unittest.main()
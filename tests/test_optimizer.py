@@ -0,0 +1,63 @@
+import copy
+import unittest
+
+import numpy as np
+
+from dooders.sdk.core.default_settings import default_settings
+from dooders.sdk.learning.scratch.model import SimpleNeuralNet
+from dooders.sdk.learning.scratch.optimizer import Optimizer_Adam_Population
+
+MODEL_SETTINGS = default_settings["internal_models"]
+
+
+class TestOptimizerAdamPopulation(unittest.TestCase):
+    def setUp(self):
+        self.own = [
+            SimpleNeuralNet(str(i), MODEL_SETTINGS["move_decision"]) for i in range(4)
+        ]
+        for network in self.own:
+            network.built = True
+        self.shared = [copy.deepcopy(network) for network in self.own]
+        self.optimizer = Optimizer_Adam_Population(decay=5e-7)
+        for network in self.shared:
+            network.share_optimizer(self.optimizer)
+
+    def learn(self, networks, inputs, realities):
+        for network, x, reality in zip(networks, inputs, realities):
+            network.predict(x)
+            network.learn(reality)
+
+    def test_matches_own_optimizer(self):
+        for _ in range(3):
+            inputs = [np.random.randint(0, 2, size=(1, 9)) for _ in self.own]
+            realities = [np.eye(9)[[np.random.randint(9)]] for _ in self.own]
+            # The second network has nothing to learn this cycle
+            realities[1] = []
+
+            self.learn(self.own, inputs, realities)
+            self.learn(self.shared, inputs, realities)
+            self.optimizer.step()
+
+        for own, shared in zip(self.own, self.shared):
+            for own_weights, shared_weights in zip(own.weights, shared.weights):
+                # Both paths compute in float32, only the rounding differs
+                np.testing.assert_allclose(
+                    own_weights, shared_weights, rtol=1e-4, atol=1e-8
+                )
+
+    def test_release_reuses_slots(self):
+        self.learn(self.shared, [np.ones((1, 9))] * 4, [np.eye(9)[[0]]] * 4)
+        self.shared[0].share_optimizer(None)
+        self.assertEqual(self.optimizer.pending, {})
+
+        replacement = SimpleNeuralNet("new", MODEL_SETTINGS["move_decision"])
+        replacement.built = True
+        replacement.share_optimizer(self.optimizer)
+        self.learn([replacement], [np.ones((1, 9))], [np.eye(9)[[0]]])
+
+        group = next(iter(self.optimizer.groups.values()))
+        self.assertEqual(group["size"], 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+import unittest
+
+import numpy as np
+
+from dooders.sdk.models.dooder import Dooder
+from dooders.sdk.modules.population import PopulationStore
+
+
+class TestPopulationStore(unittest.TestCase):
+    def setUp(self):
+        self.store = PopulationStore(capacity=2)
+        self.dooders = [Dooder({"position": (i, i + 1), "hunger": i}) for i in range(3)]
+        for dooder in self.dooders:
+            self.store.attach(dooder)
+
+    def test_attributes_read_through_store(self):
+        dooder = self.dooders[2]
+        dooder.hunger += 3
+        dooder.position = (4, 5)
+        dooder.status = "Terminated"
+
+        self.assertEqual(dooder.hunger, 5)
+        self.assertEqual(dooder.position, (4, 5))
+        self.assertEqual(dooder.status, "Terminated")
+        np.testing.assert_array_equal(self.store.column("hunger"), [0, 1, 5])
+        np.testing.assert_array_equal(self.store.column("x"), [0, 1, 4])
+
+    def test_detach_keeps_state_and_reuses_slot(self):
+        dooder = self.dooders[1]
+        dooder.age = 7
+        slot = dooder._slot
+        self.store.detach(dooder)
+
+        self.assertIsNone(dooder._store)
+        self.assertEqual(dooder.age, 7)
+        self.assertEqual(dooder.position, (1, 2))
+        self.assertEqual(len(self.store), 2)
+        np.testing.assert_array_equal(self.store.column("hunger"), [0, 2])
+
+        replacement = Dooder({"hunger": 9})
+        self.assertEqual(self.store.attach(replacement), slot)
+        self.assertEqual(replacement.age, 0)
+        self.assertEqual(len(self.store), 3)
+
+    def test_statuses_per_store(self):
+        self.dooders[0].status = "Dormant"
+        other = PopulationStore()
+        dooder = Dooder({"status": "Resting"})
+        other.attach(dooder)
+
+        self.assertEqual(self.dooders[0].status, "Dormant")
+        self.assertEqual(dooder.status, "Resting")
+        self.assertEqual(self.store.statuses, ["Alive", "Terminated", "Dormant"])
+        self.assertEqual(other.statuses, ["Alive", "Terminated", "Resting"])
+
+
+if __name__ == "__main__":
+    unittest.main()
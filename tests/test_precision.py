@@ -0,0 +1,58 @@
+import copy
+import unittest
+
+import numpy as np
+
+from dooders.sdk.core.default_settings import default_settings
+from dooders.sdk.learning.scratch.model import SimpleNeuralNet
+from dooders.sdk.learning.scratch.optimizer import Optimizer_Adam_Population
+
+MODEL_SETTINGS = default_settings["internal_models"]
+
+
+class TestPrecision(unittest.TestCase):
+    def setUp(self):
+        self.network = SimpleNeuralNet("0", MODEL_SETTINGS["energy_detection"])
+        self.network.built = True
+        self.input = np.array([[1, 0, 0, 1, 0, 0, 0, 1, 0]], dtype="uint8")
+
+    def test_float32_compute(self):
+        for layer in self.network.model.trainable_layers:
+            self.assertEqual(layer.weights.dtype, np.float32)
+            self.assertEqual(layer.biases.dtype, np.float32)
+
+        output = self.network.predict(self.input)
+        self.assertEqual(output.dtype, np.float32)
+
+        self.network.learn(self.input)
+        layer = self.network.layers[2]
+        self.assertEqual(layer.weights.dtype, np.float32)
+        self.assertEqual(layer.dweights.dtype, np.float32)
+
+    def test_population_optimizer_keeps_precision(self):
+        optimizer = Optimizer_Adam_Population()
+        self.network.share_optimizer(optimizer)
+        self.network.predict(self.input)
+        self.network.learn(self.input)
+        optimizer.step()
+
+        group = next(iter(optimizer.groups.values()))
+        self.assertEqual(group["weight_momentums"].dtype, np.float32)
+        self.assertEqual(self.network.layers[2].weights.dtype, np.float32)
+
+    def test_float16_storage(self):
+        settings = dict(MODEL_SETTINGS["move_decision"], storage_precision="float16")
+        parent = SimpleNeuralNet("1", settings)
+        genes = parent.weights
+        self.assertEqual(genes[1].dtype, np.float16)
+
+        child = SimpleNeuralNet("2", MODEL_SETTINGS["move_decision"])
+        child.inherit_weights(genes)
+        self.assertEqual(child.layers[2].weights.dtype, np.float32)
+        np.testing.assert_allclose(
+            child.layers[2].weights, parent.layers[2].weights, rtol=1e-3, atol=1e-6
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+import unittest
+
+import numpy as np
+
+from dooders.sdk.modules.recombination import (RECOMBINATION_TYPES,
+                                               crossover_weights,
+                                               lottery_weights, recombine,
+                                               recombine_batch)
+from dooders.sdk.modules.selection import recombine_genes_batch
+
+
+def genome(value):
+    return {
+        "move_decision": [np.full((9, 4), value, dtype="float32"),
+                          np.full((4, 9), value, dtype="float32")],
+        "energy_detection": [np.full((9, 4), value, dtype="float32"),
+                             np.full((4, 4), value, dtype="float32")],
+    }
+
+
+class TestRecombination(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(0)
+        self.a = np.arange(20, dtype="float32").reshape(5, 4)
+        self.b = -self.a - 1
+
+    def assert_rows_from_parents(self, weights, a, b):
+        for row, a_row, b_row in zip(weights, a, b):
+            self.assertTrue(np.array_equal(row, a_row) or np.array_equal(row, b_row))
+
+    def test_lottery_selects_genes(self):
+        weights = lottery_weights(self.a, self.b)
+        self.assertEqual(weights.shape, self.a.shape)
+        self.assert_rows_from_parents(weights, self.a, self.b)
+
+    def test_crossover_point(self):
+        weights = crossover_weights(self.a, self.b)
+        from_a = [np.array_equal(row, a_row) for row, a_row in zip(weights, self.a)]
+        self.assertEqual(from_a, sorted(from_a, reverse=True))
+        self.assert_rows_from_parents(weights, self.a, self.b)
+
+    def test_random_range_bounds(self):
+        weights = RECOMBINATION_TYPES["random_range"](self.a, self.b)
+        self.assertTrue(np.all(weights <= np.maximum(self.a, self.b)))
+        self.assertTrue(np.all(weights >= np.minimum(self.a, self.b)))
+
+    def test_recombine(self):
+        weights = recombine(genome(1), genome(3), "averaging")
+        self.assertEqual(set(weights), {"move_decision", "energy_detection"})
+        for layer in weights["move_decision"]:
+            np.testing.assert_array_equal(layer, 2)
+
+        with self.assertRaises(ValueError):
+            recombine(genome(1), genome(3), "invalid")
+
+    def test_batch_matches_pairs(self):
+        parents = [(genome(i), genome(-i)) for i in range(1, 5)]
+        for recombination_type in RECOMBINATION_TYPES:
+            offspring = recombine_batch(parents, recombination_type)
+            self.assertEqual(len(offspring), len(parents))
+
+            for child, (a, b) in zip(offspring, parents):
+                for model in a:
+                    for layer, a_layer, b_layer in zip(child[model], a[model], b[model]):
+                        self.assertEqual(layer.shape, a_layer.shape)
+                        if recombination_type == "averaging":
+                            np.testing.assert_array_equal(layer, 0)
+                        elif recombination_type == "random_range":
+                            self.assertTrue(np.all(np.abs(layer) <= np.abs(a_layer)))
+                        else:
+                            self.assert_rows_from_parents(layer, a_layer, b_layer)
+
+    def test_rng(self):
+        parents = [(genome(i), genome(-i)) for i in range(1, 5)]
+        gene_pool = {str(i): genome(i) for i in range(4)}
+
+        for recombination_type in RECOMBINATION_TYPES:
+            first = recombine_batch(parents, recombination_type,
+                                    rng=np.random.default_rng(1))
+            second = recombine_batch(parents, recombination_type,
+                                     rng=np.random.default_rng(1))
+            for a, b in zip(first, second):
+                for layer_a, layer_b in zip(a["move_decision"], b["move_decision"]):
+                    np.testing.assert_array_equal(layer_a, layer_b)
+
+            pair = recombine(genome(1), genome(-1), recombination_type,
+                             rng=np.random.default_rng(1))
+            self.assertEqual(pair["move_decision"][0].shape, (9, 4))
+
+        first = recombine_genes_batch(gene_pool, 3, "averaging",
+                                      rng=np.random.default_rng(2))
+        second = recombine_genes_batch(gene_pool, 3, "averaging",
+                                       rng=np.random.default_rng(2))
+        for a, b in zip(first, second):
+            np.testing.assert_array_equal(a["move_decision"][0], b["move_decision"][0])
+
+    def test_recombine_genes_batch(self):
+        gene_pool = {str(i): genome(i) for i in range(4)}
+        offspring = recombine_genes_batch(gene_pool, 6, "lottery")
+        self.assertEqual(len(offspring), 6)
+        self.assertEqual(len(offspring[0]["energy_detection"]), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+import json
+import os
+import tempfile
+import unittest
+
+from dooders.experiments.recursive_artificial_selection import (
+    DEFAULT_SETTINGS, run_experiment)
+from dooders.sdk.modules.recombination import RECOMBINATION_TYPES
+
+
+class TestRunExperiment(unittest.TestCase):
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.folder = tempfile.TemporaryDirectory()
+        os.chdir(self.folder.name)
+        self.settings = {**DEFAULT_SETTINGS,
+                         "SimulationCount": 6,
+                         "MaxCycles": 4,
+                         "Generations": 2,
+                         "Lockstep": True,
+                         "Seed": 1}
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.folder.cleanup()
+
+    def test_parallel_sweep(self):
+        results = run_experiment("sweep", self.settings,
+                                 show_report=False, workers=2)
+
+        self.assertEqual(list(results), list(RECOMBINATION_TYPES))
+        for type, type_results in results.items():
+            self.assertEqual(len(type_results["fit_dooder_counts"]), 2)
+            self.assertTrue(os.path.exists(f"results/sweep/{type}.json"))
+        self.assertNotIn("RecombinationType", self.settings)
+
+        with open("results/sweep/merged.json") as f:
+            self.assertEqual(list(json.load(f)), list(RECOMBINATION_TYPES))
+
+    def test_resume(self):
+        saved = {"fit_dooder_counts": [], "generation_embeddings": [], "accuracies": []}
+        os.makedirs("results/sweep")
+        with open("results/sweep/crossover.json", "w") as f:
+            json.dump(saved, f)
+
+        results = run_experiment("sweep", self.settings, show_report=False,
+                                 resume=True)
+
+        self.assertEqual(results["crossover"], saved)
+        self.assertEqual(len(results["lottery"]["fit_dooder_counts"]), 2)
+
+        results = run_experiment("sweep", self.settings, show_report=False)
+
+        self.assertEqual(len(results["crossover"]["fit_dooder_counts"]), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
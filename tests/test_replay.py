@@ -0,0 +1,86 @@
+import unittest
+
+import numpy as np
+
+from dooders.sdk.core.assemble import Assemble
+from dooders.sdk.core.default_settings import default_settings
+from dooders.sdk.learning.replay import ReplayBuffer
+from dooders.sdk.learning.scratch.model import SimpleNeuralNet
+from dooders.sdk.learning.scratch.optimizer import Optimizer_Adam_Population
+from dooders.sdk.modules.internal_models import InternalModels
+
+MODEL_SETTINGS = default_settings["internal_models"]
+
+
+class TestReplayBuffer(unittest.TestCase):
+    def test_ring(self):
+        buffer = ReplayBuffer(capacity=3)
+        for i in range(5):
+            buffer.add(np.full((1, 2), i, dtype="uint8"), [i, i])
+
+        self.assertEqual(len(buffer), 3)
+        self.assertEqual(sorted(buffer.inputs[:, 0]), [2, 3, 4])
+
+        inputs, targets = buffer.sample(10, np.random.default_rng(0))
+        self.assertEqual(inputs.shape, (3, 2))
+        self.assertEqual(targets.shape, (3, 2))
+        self.assertEqual(sorted(inputs[:, 0]), sorted(targets[:, 0]))
+
+
+class TestReplayLearning(unittest.TestCase):
+    def setUp(self):
+        self.network = SimpleNeuralNet("0", MODEL_SETTINGS["move_decision"])
+        self.network.built = True
+        self.network.use_replay(ReplayBuffer(16))
+
+    def cycle(self):
+        x = np.random.randint(0, 2, size=(1, 9)).astype("uint8")
+        self.network.predict(x)
+        self.network.learn(np.eye(9)[[np.random.randint(9)]])
+
+    def test_learn_only_stores(self):
+        weights = [w.copy() for w in self.network.weights]
+        for _ in range(4):
+            self.cycle()
+
+        self.assertEqual(len(self.network.replay), 4)
+        for before, after in zip(weights, self.network.weights):
+            np.testing.assert_array_equal(before, after)
+
+        self.network.train_replay(batch_size=4)
+        self.assertFalse(np.array_equal(weights[1], self.network.weights[1]))
+
+    def test_population_optimizer(self):
+        optimizer = Optimizer_Adam_Population()
+        self.network.share_optimizer(optimizer)
+        weights = self.network.weights[1].copy()
+        for _ in range(4):
+            self.cycle()
+
+        self.network.train_replay(batch_size=4)
+        self.assertEqual(len(optimizer.pending), 1)
+        optimizer.step()
+        self.assertFalse(np.array_equal(weights, self.network.weights[1]))
+
+    def test_internal_models(self):
+        models = InternalModels("0", active=["move_decision"])
+        models.use_replay(8)
+        self.assertEqual(models["move_decision"].replay.capacity, 8)
+        self.assertEqual(models["energy_detection"].replay.capacity, 8)
+
+        models.use_replay(None)
+        self.assertIsNone(models["move_decision"].replay)
+
+
+class TestArenaReplay(unittest.TestCase):
+    def test_setting(self):
+        settings = {"MaxCycles": 3, "ReplayLearning": True, "ReplayCapacity": 8}
+        simulation = Assemble.execute(settings, seed=0)
+        self.assertTrue(simulation.arena.active_dooders)
+        for dooder in simulation.arena.active_dooders.values():
+            models = dooder.internal_models
+            self.assertEqual(models["move_decision"].replay.capacity, 8)
+
+
+if __name__ == "__main__":
+    unittest.main()
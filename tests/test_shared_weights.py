@@ -0,0 +1,51 @@
+import unittest
+
+import numpy as np
+
+from dooders.sdk.core.default_settings import default_settings
+from dooders.sdk.learning.scratch.model import SimpleNeuralNet
+from dooders.sdk.learning.scratch.weights import SHARED_WEIGHTS, SharedWeights
+
+MODEL_SETTINGS = default_settings["internal_models"]
+
+
+class TestSharedWeights(unittest.TestCase):
+    def test_intern(self):
+        store = SharedWeights()
+        weights = np.random.randn(9, 4)
+        shared = store.intern(weights)
+        self.assertIsNot(shared, weights)
+        self.assertFalse(shared.flags.writeable)
+        self.assertIs(store.intern(weights.copy()), shared)
+        other = store.intern(weights + 1)
+        self.assertIsNot(other, shared)
+        self.assertEqual(store.nbytes, 2 * weights.nbytes)
+
+        del shared
+        self.assertEqual(len(store), 1)
+
+    def test_frozen_layer_shared_between_offspring(self):
+        parent = SimpleNeuralNet("0", MODEL_SETTINGS["move_decision"])
+        children = [
+            SimpleNeuralNet(str(i), MODEL_SETTINGS["move_decision"]) for i in range(3)
+        ]
+        for child in children:
+            child.inherit_weights([w.copy() for w in parent.weights])
+
+        frozen = parent.layers[0].weights
+        for child in children:
+            self.assertIs(child.layers[0].weights, frozen)
+            self.assertIsNot(child.layers[2].weights, parent.layers[2].weights)
+        self.assertIs(SHARED_WEIGHTS.intern(frozen.copy()), frozen)
+
+        with self.assertRaises(ValueError):
+            frozen[0, 0] = 1.0
+
+        different = parent.weights[0] * 2
+        children[0].inherit_weights([different, parent.weights[1]])
+        self.assertIsNot(children[0].layers[0].weights, frozen)
+        self.assertIs(children[1].layers[0].weights, frozen)
+
+
+if __name__ == "__main__":
+    unittest.main()
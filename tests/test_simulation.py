@@ -2,6 +2,8 @@ import unittest
 from datetime import datetime
 from unittest.mock import Mock, patch
 
+import dooders.experiment  # registers the simulation components
+from dooders.sdk.core.assemble import Assemble
 from dooders.sdk.simulation import Simulation
 
 
@@ -53,13 +55,41 @@ class TestSimulation(unittest.TestCase):
         with patch.object(Simulation, '__init__') as mock_init, \
                 patch.object(Simulation, 'setup') as mock_setup:
             mock_init.return_value = None  # as it is called in reset
+            self.simulation.arena = Mock()
             self.simulation.reset()
-            mock_init.assert_called_once_with(self.simulation.settings)
+            mock_init.assert_called_once_with(
+                self.simulation.settings, seed=self.simulation.seed_sequence)
             mock_setup.assert_called_once()
+            self.simulation.arena.stop_learning.assert_called_once()
+            self.simulation.arena.start_learning.assert_called_once()
+
+    def test_seed(self):
+        def draws(simulation):
+            return simulation.rng.random(3).tolist(), simulation.random.random()
+
+        first = draws(Simulation({'MaxCycles': 10}, seed=3))
+        self.assertEqual(first, draws(Simulation({'MaxCycles': 10}, seed=3)))
+        self.assertNotEqual(first, draws(Simulation({'MaxCycles': 10}, seed=4)))
+        self.assertIs(self.simulation.time.random, self.simulation.random)
+
+    def test_seed_reproduces_run(self):
+        def run(seed):
+            simulation = Assemble.execute({'MaxCycles': 40}, seed=seed)
+            simulation.auto_restart = False
+            simulation.run_simulation(batch=True)
+            summary = simulation.simulation_summary
+            for key in ('SimulationID', 'Timestamp', 'ElapsedSeconds'):
+                del summary[key]
+            return summary
+
+        for seed in (2, 7):
+            self.assertEqual(run(seed), run(seed))
 
     def test_stop(self):
+        self.simulation.arena = Mock()
         self.simulation.stop()
         self.assertFalse(self.simulation.running)
+        self.simulation.arena.stop_learning.assert_called_once()
 
     def test_simulation_summary(self):
         self.simulation.starting_time = datetime.now()
@@ -0,0 +1,105 @@
+import unittest
+
+import numpy as np
+
+from dooders.sdk.surfaces.grid import Grid
+from dooders.sdk.surfaces.sparse_grid import SparseGrid
+
+
+class Energy:
+    def __init__(self, id):
+        self.id = id
+        self.position = None
+
+
+class Dooder(Energy):
+    pass
+
+
+class TestSparseGrid(unittest.TestCase):
+    def setUp(self):
+        settings = {"height": 9, "width": 7, "torus": True, "chunk_size": 4}
+        self.sparse = SparseGrid(settings)
+        self.dense = Grid(settings)
+        self.placed = [
+            (Energy("energy_0"), (0, 0)),
+            (Energy("energy_1"), (6, 8)),
+            (Energy("energy_2"), (6, 8)),
+            (Dooder("dooder_0"), (3, 4)),
+        ]
+        for object, position in self.placed:
+            self.sparse.add(object, position)
+            self.dense.add(type(object)(object.id), position)
+
+    def test_chunks_allocated_and_freed(self):
+        self.assertEqual(len(self.sparse._chunks), 3)
+        self.sparse.remove(self.placed[0][0])
+        self.sparse.remove("energy_1")
+        self.assertEqual(len(self.sparse._chunks), 2)
+        self.sparse.move(self.placed[2][0], (1, 1))
+        self.assertEqual(len(self.sparse._chunks), 2)
+        self.assertEqual(self.placed[2][0].position, (1, 1))
+        self.assertEqual(list(self.sparse.contents("Energy")), [self.placed[2][0]])
+
+    def test_matches_grid(self):
+        np.testing.assert_array_equal(
+            self.sparse.layer("Energy"), self.dense.layer("Energy")
+        )
+        for position in [(0, 0), (6, 8), (3, 4), (5, 2)]:
+            self.assertEqual(
+                [s.count for s in self.sparse.nearby_spaces(position)],
+                [s.count for s in self.dense.nearby_spaces(position)],
+            )
+            self.assertEqual(
+                self.sparse.nearby_coordinates(position, False, True, 2),
+                self.dense.nearby_coordinates(position, False, True, 2),
+            )
+        positions = [(0, 0), (6, 8), (3, 4), (5, 2)]
+        np.testing.assert_array_equal(
+            self.sparse.perception_batch(positions, ["Dooder", "Energy"], ignore="Dooder"),
+            self.dense.perception_batch(positions, ["Dooder", "Energy"], ignore="Dooder"),
+        )
+
+    def test_lookups(self):
+        self.assertEqual(self.sparse[(13, 17)].coordinates, self.dense[(6, 8)].coordinates)
+        self.assertEqual(self.sparse["dooder_0"].count, 1)
+        self.assertTrue(self.sparse.has((6, 8), "Energy"))
+        self.assertFalse(self.sparse.has((3, 4), "Dooder", ignore=self.placed[3][0]))
+        self.assertEqual(len(list(self.sparse.contents())), 4)
+        self.assertEqual(len(list(self.sparse.contents((6, 8)))), 2)
+
+    def test_has_ignores_list_position(self):
+        dooder = Dooder("dooder_1")
+        self.sparse.add(dooder, [5, 5])
+        self.assertTrue(self.sparse.has((5, 5), "Dooder"))
+        self.assertFalse(self.sparse.has((5, 5), "Dooder", ignore=dooder))
+
+    def test_neighbourhood(self):
+        for torus in (True, False):
+            settings = {"height": 9, "width": 7, "torus": torus, "chunk_size": 4}
+            sparse, dense = SparseGrid(settings), Grid(settings)
+            np.testing.assert_array_equal(
+                sparse.neighbourhood(True, True, 1), dense.neighbourhood(True, True, 1)
+            )
+            for position in [(0, 0), (6, 8), (3, 4)]:
+                np.testing.assert_array_equal(
+                    sparse._nearby_indices(position, False, False, 2),
+                    dense._nearby_indices(position, False, False, 2),
+                )
+
+    def test_perception_batch_non_torus(self):
+        settings = {"height": 9, "width": 7, "torus": False, "chunk_size": 4}
+        sparse, dense = SparseGrid(settings), Grid(settings)
+        for object, position in self.placed:
+            sparse.add(type(object)(object.id), position)
+            dense.add(type(object)(object.id), position)
+
+        positions = [(0, 0), (6, 8), (3, 4), (5, 2)]
+        np.testing.assert_array_equal(
+            sparse.perception_batch(positions, ["Dooder", "Energy"], ignore="Dooder"),
+            dense.perception_batch(positions, ["Dooder", "Energy"], ignore="Dooder"),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import unittest
+
+import numpy as np
+
+from dooders.sdk.core.default_settings import default_settings
+from dooders.sdk.learning.batch import BatchInference
+from dooders.sdk.learning.scratch.model import SimpleNeuralNet
+from dooders.sdk.learning.weight_arena import WeightArena
+
+MODEL_SETTINGS = default_settings["internal_models"]
+
+
+class TestWeightArena(unittest.TestCase):
+    def setUp(self):
+        self.arena = WeightArena(capacity=2)
+        self.networks = [
+            SimpleNeuralNet(str(i), MODEL_SETTINGS["move_decision"]) for i in range(3)
+        ]
+        self.expected = []
+        for network in self.networks:
+            network.built = True
+            self.expected.append([w.copy() for w in network.weights])
+            network.use_weight_arena(self.arena)
+
+    def test_layers_are_views_of_one_buffer(self):
+        for network, expected in zip(self.networks, self.expected):
+            layer = network.layers[2]
+            self.assertIn(layer, self.arena)
+            self.assertTrue(np.shares_memory(layer.weights, self.arena.gather([layer])[0]))
+            np.testing.assert_array_equal(layer.weights, expected[1])
+            # The frozen first layer stays in the shared store
+            self.assertNotIn(network.layers[0], self.arena)
+
+        weights, _ = self.arena.gather([n.layers[2] for n in self.networks])
+        self.assertEqual(weights.shape, (3, 512, 9))
+
+    def test_learning_and_inheriting_write_the_slot(self):
+        network = self.networks[1]
+        slot = self.arena.slots[network.layers[2]]
+        network.predict(np.ones((1, 9)))
+        network.learn(np.eye(9)[[3]])
+        export = self.arena.export(slot[0])
+        np.testing.assert_array_equal(export["weights"][slot[1]], network.layers[2].weights)
+
+        network.inherit_weights(self.expected[0])
+        self.assertEqual(self.arena.slots[network.layers[2]], slot)
+        np.testing.assert_array_equal(network.layers[2].weights, self.expected[0][1])
+
+    def test_release_reuses_slot(self):
+        layer = self.networks[0].layers[2]
+        slot = self.arena.slots[layer]
+        self.networks[0].use_weight_arena(None)
+        self.assertNotIn(layer, self.arena)
+        np.testing.assert_array_equal(layer.weights, self.expected[0][1])
+        self.assertFalse(self.arena.export(slot[0])["active"][slot[1]])
+
+        replacement = SimpleNeuralNet("new", MODEL_SETTINGS["move_decision"])
+        replacement.use_weight_arena(self.arena)
+        self.assertEqual(self.arena.slots[replacement.layers[2]], slot)
+
+    def test_batch_inference_reads_arena(self):
+        inputs = np.random.randint(0, 2, size=(3, 9))
+        output = BatchInference(self.networks).forward(inputs)[-1]
+        for i, network in enumerate(self.networks):
+            expected = network.model.forward(inputs[i : i + 1], training=False)
+            np.testing.assert_allclose(output[i : i + 1], expected, rtol=1e-5)
+
+
+if __name__ == "__main__":
+    unittest.main()